@@ -0,0 +1,83 @@
+"""
+Compares the previous per-cell DataFrame construction of BaseDBPD._access_sqlite_query() with the
+columnar fetchmany() path on a generated SQLite file.
+
+Usage:
+    python benchmarks/bench_access_sqlite_query.py [rows] [columns]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dbpd import SQLite  # noqa: E402
+
+
+def generate_sqlite_file(filepath: str, rows: int, columns: int) -> None:
+    db = SQLite(filepath=filepath, show_description=False)
+    column_defs = ', '.join(f'c{i} {("INTEGER", "REAL", "TEXT")[i % 3]}' for i in range(columns))
+    db.query(sql=f'CREATE TABLE bench ({column_defs})', show_head=False, warn_is_none=False)
+    values = [
+        tuple((r * columns + c, (r + c) * 0.5, f'value_{(r + c) % 1000}')[c % 3] for c in range(columns))
+        for r in range(rows)
+    ]
+    cursor = db.db_conn.cursor()
+    cursor.executemany(f'INSERT INTO bench VALUES ({", ".join("?" for _ in range(columns))})', values)
+    cursor.close()
+    db.close()
+
+
+def old_path(db: SQLite, sql: str) -> pd.DataFrame:
+    cursor = db.db_conn.cursor()
+    cursor.execute(sql)
+    columns = [i[0] for i in cursor.description]
+    data = cursor.fetchall()
+    cursor.close()
+    df_data = {}
+    for row in data:
+        for i, column in enumerate(columns):
+            if column not in df_data:
+                df_data[column] = []
+            df_data[column].append(row[i])
+    return pd.DataFrame(data=df_data, columns=columns)
+
+
+def new_path(db: SQLite, sql: str) -> pd.DataFrame:
+    return db._access_sqlite_query(sql=sql)
+
+
+def measure(func, db: SQLite, sql: str) -> tuple:
+    # Timing and peak memory are measured in separate runs, tracemalloc slows allocation-heavy code considerably
+    start = time.perf_counter()
+    df = func(db, sql)
+    elapsed = time.perf_counter() - start
+    del df
+    tracemalloc.start()
+    df = func(db, sql)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return df, elapsed, peak
+
+
+def main(rows: int = 1_000_000, columns: int = 12) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        filepath = os.path.join(tmp, 'bench.db')
+        generate_sqlite_file(filepath=filepath, rows=rows, columns=columns)
+        db = SQLite(filepath=filepath, show_description=False)
+        sql = 'SELECT * FROM bench'
+        old_df, old_time, old_peak = measure(old_path, db, sql)
+        new_df, new_time, new_peak = measure(new_path, db, sql)
+        db.close()
+    pd.testing.assert_frame_equal(old_df, new_df)
+    print(f'{rows:,} rows x {columns} columns')
+    print(f'per-cell : {old_time:8.3f} s  peak {old_peak / 2 ** 20:9.1f} MiB')
+    print(f'columnar : {new_time:8.3f} s  peak {new_peak / 2 ** 20:9.1f} MiB')
+    print(f'speedup  : {old_time / new_time:8.2f} x')
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:3]])
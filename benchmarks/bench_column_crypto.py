@@ -0,0 +1,47 @@
+"""
+Measures decrypting (and encrypting) a whole column with BaseDBPD.decrypt_column() in the calling thread, a thread pool
+and a process pool, against decrypting one value at a time with a new Fernet instance per value (reported as values/s).
+
+Usage:
+    python benchmarks/bench_column_crypto.py [values] [workers]
+"""
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dbpd import BaseDBPD, SQLiteInMemory  # noqa: E402
+
+
+def main(values: int = 200_000, workers: int = os.cpu_count() or 1) -> None:
+    from cryptography.fernet import Fernet
+
+    key = BaseDBPD.generate_fernet_encryption_key()
+    db = SQLiteInMemory(show_description=False, fernet_encryption_key=key)
+    df = pd.DataFrame({'ssn': [f'{i:09d}' for i in range(values)]})
+
+    encrypted = db.encrypt_column(dataframe=df, column='ssn', workers=1)
+    print(f'{"encrypt_column()":<30}: {db.recent_column_crypto["values_per_second"]:12,.0f} values/s')
+
+    sample = encrypted['ssn'].iloc[:min(values, 20_000)].tolist()
+    start = time.perf_counter()
+    for value in sample:
+        Fernet(key).decrypt(value).decode('utf-8')
+    elapsed = time.perf_counter() - start
+    print(f'{"new Fernet per value":<30}: {len(sample) / elapsed:12,.0f} values/s  ({len(sample):,} values)')
+
+    for name, kwargs in [
+        ('decrypt_column()', {'workers': 1}),
+        (f'decrypt_column(threads={workers})', {'workers': workers, 'executor': 'thread'}),
+        (f'decrypt_column(processes={workers})', {'workers': workers, 'executor': 'process'})
+    ]:
+        decrypted = db.decrypt_column(dataframe=encrypted, column='ssn', **kwargs)
+        assert decrypted['ssn'].iloc[-1] == df['ssn'].iloc[-1]
+        print(f'{name:<30}: {db.recent_column_crypto["values_per_second"]:12,.0f} values/s')
+    db.close()
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:3]])
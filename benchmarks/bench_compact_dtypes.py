@@ -0,0 +1,51 @@
+"""
+Measures the memory and time of query() against query(compact_dtypes=True) (and with downcast_floats=True) on a wide
+SQLite table with nullable integers, booleans, dates, low-cardinality strings and floats.
+
+Usage:
+    python benchmarks/bench_compact_dtypes.py [rows] [column_groups]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dbpd import SQLiteInMemory  # noqa: E402
+
+
+def main(rows: int = 200_000, column_groups: int = 4) -> None:
+    rng = np.random.default_rng(seed=0)
+    data = {'id': np.arange(rows)}
+    declared = ['id INTEGER PRIMARY KEY']
+    for group in range(column_groups):
+        data[f'qty_{group}'] = pd.array(np.where(rng.random(rows) < 0.1, None, rng.integers(0, 1000, rows)), dtype='Int64')
+        data[f'flag_{group}'] = pd.array(np.where(rng.random(rows) < 0.1, None, rng.random(rows) < 0.5), dtype='boolean')
+        data[f'day_{group}'] = (pd.Timestamp('2023-01-01') + pd.to_timedelta(rng.integers(0, 365, rows), unit='D')).strftime('%Y-%m-%d')
+        data[f'region_{group}'] = rng.choice(['north', 'south', 'east', 'west'], rows)
+        data[f'price_{group}'] = rng.random(rows) * 100
+        declared += [f'qty_{group} INTEGER', f'flag_{group} BOOLEAN', f'day_{group} DATE', f'region_{group} TEXT', f'price_{group} REAL']
+    df = pd.DataFrame(data)
+
+    db = SQLiteInMemory(show_description=False)
+    db.query(f'CREATE TABLE wide ({", ".join(declared)})', show_head=False, warn_is_none=False)
+    db.insert_dataframe(table_name='wide', dataframe=df)
+    db.commit()
+
+    for name, kwargs in [
+        ('query()', {}),
+        ('compact_dtypes', {'compact_dtypes': True}),
+        ('+ downcast_floats', {'compact_dtypes': True, 'downcast_floats': True})
+    ]:
+        start = time.perf_counter()
+        result = db.query('SELECT * FROM wide', show_head=False, **kwargs)
+        elapsed = time.perf_counter() - start
+        megabytes = result.memory_usage(index=True, deep=True).sum() / 1024 ** 2
+        print(f'{name:<18}: {elapsed:8.3f} s  {megabytes:10.1f} MB  ({rows:,} rows x {len(result.columns)} columns)')
+    db.close()
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:3]])
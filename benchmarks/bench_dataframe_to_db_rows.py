@@ -0,0 +1,56 @@
+"""
+Compares converting a DataFrame into executemany() parameter rows with convert_numpy_value() per cell against the
+column-wise BaseDBPD.dataframe_to_db_rows().
+
+Usage:
+    python benchmarks/bench_dataframe_to_db_rows.py [rows]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dbpd import BaseDBPD  # noqa: E402
+
+
+def generate_dataframe(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed=0)
+    floats = rng.random(rows)
+    floats[rng.random(rows) < 0.1] = np.nan
+    return pd.DataFrame({
+        'an_int': rng.integers(0, 1000, rows),
+        'a_float': floats,
+        'a_bool': rng.random(rows) < 0.5,
+        'a_string': np.where(rng.random(rows) < 0.1, None, 'value'),
+        'a_date': pd.Timestamp('2023-01-01') + pd.to_timedelta(rng.integers(0, 365, rows), unit='D')
+    })
+
+
+def per_cell(df: pd.DataFrame, null_zeroes_for_columns: list) -> list:
+    return [
+        tuple(BaseDBPD.convert_numpy_value(value=value, column=column, null_zeroes_for_columns=null_zeroes_for_columns) for column, value in zip(df.columns, row))
+        for row in df.itertuples(index=False, name=None)
+    ]
+
+
+def column_wise(df: pd.DataFrame, null_zeroes_for_columns: list) -> list:
+    return BaseDBPD.dataframe_to_db_rows(dataframe=df, null_zeroes_for_columns=null_zeroes_for_columns)
+
+
+def main(rows: int = 1_000_000) -> None:
+    df = generate_dataframe(rows=rows)
+    null_zeroes_for_columns = ['an_int']
+    results = {}
+    for func in [per_cell, column_wise]:
+        start = time.perf_counter()
+        results[func.__name__] = func(df, null_zeroes_for_columns)
+        elapsed = time.perf_counter() - start
+        print(f'{func.__name__:<12}: {elapsed:8.3f} s  {rows / elapsed:14,.0f} rows/s')
+    assert results['per_cell'] == results['column_wise']
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:2]])
@@ -0,0 +1,35 @@
+"""
+Measures short-lived managers created per request (a new engine, connected and disposed of every time) against
+managers sharing the process-wide engine (shared_engine=True) with a warmed-up pool, and prints the pool statistics.
+Pass a SQLAlchemy URL to measure a server database, the handshake cost of a server makes the difference larger.
+
+Usage:
+    python benchmarks/bench_engine_registry.py [requests] [url]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dbpd import BaseDBPD  # noqa: E402
+
+
+def main(requests: int = 500, url: str = None) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        if url is None:
+            url = f'sqlite:///{os.path.join(directory, "bench.db")}'
+
+        for name, kwargs in [('engine per request', {}), ('shared_engine=True', {'shared_engine': True, 'warm_up_connections': 5})]:
+            start = time.perf_counter()
+            for _ in range(requests):
+                db = BaseDBPD(connection_credentials=url, show_description=False, **kwargs)
+                db.query('SELECT 1 AS one', show_head=False)
+                stats = db.pool_stats()
+                db.close()
+            elapsed = time.perf_counter() - start
+            print(f'{name:<20}: {elapsed:8.3f} s  {requests / elapsed:10,.0f} requests/s  ({stats["connects"]:,} connects, {stats["mean_wait_seconds"] * 1000:.3f} ms mean wait)')
+
+
+if __name__ == '__main__':
+    main(*[int(sys.argv[1])] if len(sys.argv) > 1 else [], *sys.argv[2:3])
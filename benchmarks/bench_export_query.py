@@ -0,0 +1,65 @@
+"""
+Compares exporting a query to Parquet, Feather and CSV by materializing the full DataFrame (query() then to_parquet(),
+etc.) against the streaming export_query_to_parquet(), export_query_to_feather() and export_query_to_csv(),
+measuring the elapsed time and the peak traced memory of each.
+
+Usage:
+    python benchmarks/bench_export_query.py [rows] [chunksize]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dbpd import SQLite  # noqa: E402
+
+SQL = 'SELECT * FROM measurements'
+
+
+def measure(func: callable) -> tuple:
+    # Timed and traced in separate runs, tracing every allocation slows the run down considerably
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(rows: int = 1_000_000, chunksize: int = 100_000) -> None:
+    rng = np.random.default_rng(seed=0)
+    with tempfile.TemporaryDirectory() as directory:
+        db = SQLite(filepath=os.path.join(directory, 'bench.db'), show_description=False)
+        db.query('CREATE TABLE measurements (id INTEGER, sensor TEXT, value REAL, taken TEXT)', show_head=False, warn_is_none=False)
+        db.insert_dataframe(table_name='measurements', dataframe=pd.DataFrame({
+            'id': np.arange(rows),
+            'sensor': rng.choice(['north', 'south', 'east', 'west'], rows),
+            'value': rng.random(rows),
+            'taken': '2023-01-01 00:00:00'
+        }))
+        db.commit()
+
+        path = os.path.join(directory, 'out')
+        scenarios = [
+            ('parquet, materialized', lambda: db.query(SQL, show_head=False).to_parquet(f'{path}_1.parquet', index=False)),
+            ('parquet, streamed', lambda: db.export_query_to_parquet(f'{path}_2.parquet', SQL, chunksize=chunksize)),
+            ('feather, materialized', lambda: db.query(SQL, show_head=False).to_feather(f'{path}_1.feather')),
+            ('feather, streamed', lambda: db.export_query_to_feather(f'{path}_2.feather', SQL, chunksize=chunksize)),
+            ('csv, materialized', lambda: db.query(SQL, show_head=False).to_csv(f'{path}_1.csv', index=False)),
+            ('csv, streamed', lambda: db.export_query_to_csv(f'{path}_2.csv', SQL, chunksize=chunksize))
+        ]
+        for name, func in scenarios:
+            elapsed, peak = measure(func)
+            print(f'{name:<22}: {elapsed:8.3f} s  {rows / elapsed:12,.0f} rows/s  peak {peak / 1024 ** 2:8.1f} MB')
+        db.close()
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:3]])
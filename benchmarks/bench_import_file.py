@@ -0,0 +1,52 @@
+"""
+Measures BaseDBPD.import_file() loading CSV and Parquet files into SQLite, against inserting the same rows one at a
+time with insert_values() (measured on a sample and reported as rows/s).
+
+Usage:
+    python benchmarks/bench_import_file.py [rows] [chunksize]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dbpd import SQLite  # noqa: E402
+
+
+def main(rows: int = 1_000_000, chunksize: int = 100_000) -> None:
+    rng = np.random.default_rng(seed=0)
+    df = pd.DataFrame({
+        'id': np.arange(rows),
+        'store': rng.choice(['north', 'south', 'east', 'west'], rows),
+        'amount': rng.random(rows) * 100,
+        'sold_at': pd.Timestamp('2023-01-01') + pd.to_timedelta(rng.integers(0, 365 * 86400, rows), unit='s')
+    })
+    with tempfile.TemporaryDirectory() as directory:
+        files = {'csv': os.path.join(directory, 'sales.csv'), 'parquet': os.path.join(directory, 'sales.parquet')}
+        df.to_csv(files['csv'], index=False)
+        df.to_parquet(files['parquet'], index=False)
+
+        db = SQLite(filepath=os.path.join(directory, 'bench.db'), show_description=False)
+        for file_format, filepath in files.items():
+            start = time.perf_counter()
+            kwargs = {'parse_dates': ['sold_at']} if file_format == 'csv' else {}
+            db.import_file(table_name=f'sales_{file_format}', filepath=filepath, chunksize=chunksize, show_progress=False, **kwargs)
+            elapsed = time.perf_counter() - start
+            print(f'{"import_file(" + file_format + ")":<22}: {elapsed:8.3f} s  {rows / elapsed:14,.0f} rows/s')
+
+        sample = df.iloc[:min(rows, 20_000)]
+        start = time.perf_counter()
+        for row in db.dataframe_to_db_rows(dataframe=sample):
+            db.insert_values(table_name='sales_csv', **dict(zip(sample.columns, row)))
+        db.commit()
+        elapsed = time.perf_counter() - start
+        print(f'{"insert_values() per row":<22}: {elapsed:8.3f} s  {len(sample) / elapsed:14,.0f} rows/s  ({len(sample):,} rows)')
+        db.close()
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:3]])
@@ -0,0 +1,69 @@
+"""
+Measures the start-up cost of dbpd with "python -X importtime", in a fresh interpreter per run, and reports which of
+the heavy dependencies each step loads. "import dbpd" should load none of them, a SQLite manager should not load
+SQLAlchemy, pyodbc, pywin32 or cryptography.
+
+Usage:
+    python benchmarks/bench_import_time.py [runs] [max_import_dbpd_ms]
+
+If max_import_dbpd_ms is given the script exits with status 1 when "import dbpd" takes longer, so that it can be used
+to catch start-up regressions.
+"""
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ['numpy', 'pandas', 'sqlalchemy', 'pyodbc', 'win32com', 'cryptography', 'asyncio']
+
+SCENARIOS = {
+    'python (baseline)': 'pass',
+    'import dbpd': 'import dbpd',
+    'dbpd.SQLiteInMemory()': 'import dbpd; dbpd.SQLiteInMemory(show_description=False)',
+    'import pandas (reference)': 'import pandas',
+}
+
+LINE_PATTERN = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$')
+
+
+def import_time(statement: str) -> tuple:
+    """
+    Runs a statement with -X importtime in a new interpreter
+
+    :return: tuple - (total microseconds of the top-level imports, set of imported top-level package names)
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get('PYTHONPATH')])))
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], capture_output=True, text=True, env=env, check=True)
+    total = 0
+    packages = set()
+    for line in completed.stderr.splitlines():
+        match = LINE_PATTERN.match(line)
+        if match is None:
+            continue
+        cumulative, indent, module = int(match.group(2)), match.group(3), match.group(4)
+        if len(indent) == 1:
+            total += cumulative
+        packages.add(module.split('.')[0])
+    return total, packages
+
+
+def main(runs: int = 5, max_import_dbpd_ms: float = None) -> None:
+    results = {}
+    for name, statement in SCENARIOS.items():
+        timings = []
+        for _ in range(runs):
+            total, packages = import_time(statement=statement)
+            timings.append(total)
+        results[name] = min(timings) / 1000
+        loaded = ', '.join(i for i in HEAVY_MODULES if i in packages) or '-'
+        print(f'{name:<28}: {results[name]:8.1f} ms (best of {runs})  loads: {loaded}')
+
+    if max_import_dbpd_ms is not None and results['import dbpd'] > max_import_dbpd_ms:
+        print(f'"import dbpd" took {results["import dbpd"]:.1f} ms, more than {max_import_dbpd_ms} ms')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:2]], *[float(i) for i in sys.argv[2:3]])
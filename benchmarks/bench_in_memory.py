@@ -0,0 +1,64 @@
+"""
+Measures SQLiteInMemory.from_file() against copying a table with copy_query_to(), the serialize()/deserialize() round
+trip, and the worst lookup latency of the calling thread while the database is saved in the background with
+save_as() in one step against save_as(pages=...) in steps.
+
+Usage:
+    python benchmarks/bench_in_memory.py [rows] [pages]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dbpd import SQLite, SQLiteInMemory  # noqa: E402
+
+
+def main(rows: int = 1_000_000, pages: int = 256) -> None:
+    rng = np.random.default_rng(seed=0)
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, 'lookups.db')
+        db = SQLite(filepath=filepath, show_description=False)
+        db.query('CREATE TABLE lookups (id INTEGER PRIMARY KEY, code TEXT, value REAL)', show_head=False, warn_is_none=False)
+        db.insert_dataframe(table_name='lookups', dataframe=pd.DataFrame({'id': np.arange(rows), 'code': rng.choice(['a', 'b', 'c'], rows), 'value': rng.random(rows)}))
+        db.commit()
+
+        start = time.perf_counter()
+        copy = SQLiteInMemory(show_description=False)
+        db.copy_query_to(target=copy, table_name='lookups', sql='SELECT * FROM lookups')
+        print(f'{"copy_query_to()":<32}: {time.perf_counter() - start:8.3f} s')
+        copy.close()
+        db.close()
+
+        start = time.perf_counter()
+        memory = SQLiteInMemory.from_file(filepath, show_description=False)
+        print(f'{"SQLiteInMemory.from_file()":<32}: {time.perf_counter() - start:8.3f} s')
+
+        start = time.perf_counter()
+        data = memory.serialize()
+        other = SQLiteInMemory(show_description=False)
+        other.deserialize(data)
+        print(f'{"serialize() + deserialize()":<32}: {time.perf_counter() - start:8.3f} s  ({len(data) / 1024 ** 2:,.1f} MB)')
+        other.close()
+
+        for name, kwargs in [('save_as() in one step', {}), (f'save_as(pages={pages})', {'pages': pages, 'pause': 0.001})]:
+            snapshot = threading.Thread(target=memory.save_as, kwargs={'filepath': os.path.join(directory, 'snapshot.db'), **kwargs})
+            latencies = []
+            snapshot.start()
+            while snapshot.is_alive():
+                start = time.perf_counter()
+                memory.query('SELECT value FROM lookups WHERE id = ?', parameters=[int(rng.integers(0, rows))], show_head=False)
+                latencies.append(time.perf_counter() - start)
+            snapshot.join()
+            os.remove(os.path.join(directory, 'snapshot.db'))
+            print(f'{name:<32}: worst lookup {max(latencies or [0]) * 1000:8.2f} ms  ({len(latencies):,} lookups during the save)')
+        memory.close()
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:3]])
@@ -0,0 +1,56 @@
+"""
+Compares loading rows into a SQLite file in many small transactions (one commit per batch, as an ingest job that
+commits as it goes) with the default pragmas, with each performance profile and inside BaseDBPD.sqlite_bulk_load().
+
+Usage:
+    python benchmarks/bench_sqlite_bulk_load.py [rows] [batch_size]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dbpd import SQLite  # noqa: E402
+
+
+def load(filepath: str, df: pd.DataFrame, batch_size: int, profile: str = None, bulk_load: bool = False) -> float:
+    db = SQLite(filepath=filepath, performance_profile=profile, show_description=False)
+    db.query('CREATE TABLE measurements (id INTEGER, value REAL, label TEXT)', show_head=False, warn_is_none=False)
+    db.commit()
+    start = time.perf_counter()
+    if bulk_load:
+        with db.sqlite_bulk_load():
+            for i in range(0, len(df), batch_size):
+                db.insert_dataframe(table_name='measurements', dataframe=df.iloc[i:i + batch_size])
+                db.commit()
+    else:
+        for i in range(0, len(df), batch_size):
+            db.insert_dataframe(table_name='measurements', dataframe=df.iloc[i:i + batch_size])
+            db.commit()
+    elapsed = time.perf_counter() - start
+    db.close()
+    return elapsed
+
+
+def main(rows: int = 200_000, batch_size: int = 500) -> None:
+    rng = np.random.default_rng(seed=0)
+    df = pd.DataFrame({'id': np.arange(rows), 'value': rng.random(rows), 'label': 'sensor'})
+    scenarios = [
+        ('default pragmas', None, False),
+        ('balanced', 'balanced', False),
+        ('bulk_load profile', 'bulk_load', False),
+        ('sqlite_bulk_load()', None, True)
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        for n, (name, profile, bulk_load) in enumerate(scenarios):
+            filepath = os.path.join(directory, f'bench_{n}.db')
+            elapsed = load(filepath=filepath, df=df, batch_size=batch_size, profile=profile, bulk_load=bulk_load)
+            print(f'{name:<20}: {elapsed:8.3f} s  {rows / elapsed:14,.0f} rows/s')
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:3]])
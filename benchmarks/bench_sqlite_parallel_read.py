@@ -0,0 +1,52 @@
+"""
+Compares reading a whole SQLite table with query() against SQLite.parallel_read() with an increasing number of
+worker processes. The speedup depends on the number of cores.
+
+Usage:
+    python benchmarks/bench_sqlite_parallel_read.py [rows] [max_workers]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dbpd import SQLite  # noqa: E402
+
+
+def main(rows: int = 2_000_000, max_workers: int = None) -> None:
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    rng = np.random.default_rng(seed=0)
+    with tempfile.TemporaryDirectory() as directory:
+        db = SQLite(filepath=os.path.join(directory, 'bench.db'), show_description=False)
+        db.query('CREATE TABLE measurements (id INTEGER PRIMARY KEY, sensor TEXT, value REAL, flag INTEGER)', show_head=False, warn_is_none=False)
+        db.insert_dataframe(table_name='measurements', dataframe=pd.DataFrame({
+            'id': np.arange(rows),
+            'sensor': rng.choice(['a', 'b', 'c'], rows),
+            'value': rng.random(rows),
+            'flag': rng.integers(0, 2, rows)
+        }))
+        db.commit()
+
+        start = time.perf_counter()
+        db.query('SELECT * FROM measurements', show_head=False)
+        elapsed = time.perf_counter() - start
+        print(f'{"query()":<22}: {elapsed:8.3f} s  {rows / elapsed:14,.0f} rows/s')
+
+        workers = 2
+        while workers <= max_workers:
+            start = time.perf_counter()
+            df = db.parallel_read(table_name='measurements', workers=workers)
+            elapsed = time.perf_counter() - start
+            assert len(df) == rows
+            print(f'{f"parallel_read({workers})":<22}: {elapsed:8.3f} s  {rows / elapsed:14,.0f} rows/s')
+            workers *= 2
+        db.close()
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:3]])
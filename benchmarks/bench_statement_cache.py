@@ -0,0 +1,46 @@
+"""
+Measures the per-call overhead of running the same parameterized statement repeatedly through query() on a
+SQLAlchemy "sqlite://" engine, with the statement (text()) cache disabled and enabled.
+
+Usage:
+    python benchmarks/bench_statement_cache.py [calls]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dbpd import BaseDBPD  # noqa: E402
+
+SQL = 'SELECT id, name, price FROM products WHERE id = :id AND price > :price'
+
+
+def run(db: BaseDBPD, calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        db.query(sql=SQL, parameters={'id': i % 1000, 'price': 0}, show_head=False, warn_is_none=False)
+    return (time.perf_counter() - start) / calls
+
+
+def main(calls: int = 20_000) -> None:
+    # Any database_type other than 'access' and 'sqlite' runs query() through the SQLAlchemy engine
+    db = BaseDBPD(connection_credentials='sqlite://', database_type='postgres', show_description=False)
+    db.query('CREATE TABLE products (id INTEGER PRIMARY KEY, name TEXT, price REAL)', show_head=False, warn_is_none=False)
+    db.query("""
+        INSERT INTO products
+        SELECT i, 'product ' || i, i * 1.5 FROM (WITH RECURSIVE n(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM n WHERE i < 999) SELECT i FROM n)
+    """, show_head=False, warn_is_none=False)
+    db.commit()
+
+    size = db.STATEMENT_CACHE_SIZE
+    db.STATEMENT_CACHE_SIZE = 0
+    uncached = run(db=db, calls=calls)
+    db.STATEMENT_CACHE_SIZE = size
+    cached = run(db=db, calls=calls)
+    print(f'text() per call   : {uncached * 1e6:8.1f} us per query()')
+    print(f'statement cache   : {cached * 1e6:8.1f} us per query()  ({uncached / cached:.2f}x)  {db.statement_cache_info()}')
+    db.close()
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:2]])
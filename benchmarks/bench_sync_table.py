@@ -0,0 +1,53 @@
+"""
+Measures a nightly refresh of a SQLAlchemy-backed table into a SQLite reporting file: a full copy with copy_query_to()
+against BaseDBPD.sync_table() moving only the rows changed since the previous sync (the first sync is a full copy).
+
+Usage:
+    python benchmarks/bench_sync_table.py [rows] [changed_rows]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dbpd import BaseDBPD, SQLite  # noqa: E402
+
+
+def main(rows: int = 1_000_000, changed_rows: int = 1_000) -> None:
+    rng = np.random.default_rng(seed=0)
+    with tempfile.TemporaryDirectory() as directory:
+        source = BaseDBPD(connection_credentials=f'sqlite:///{os.path.join(directory, "source.db")}', show_description=False)
+        source.query('CREATE TABLE orders (order_id INTEGER PRIMARY KEY, amount REAL, version INTEGER)', show_head=False, warn_is_none=False)
+        source.insert_dataframe(table_name='orders', dataframe=pd.DataFrame({'order_id': np.arange(rows), 'amount': rng.random(rows) * 100, 'version': np.arange(rows)}))
+        source.commit()
+
+        full = SQLite(filepath=os.path.join(directory, 'full.db'), show_description=False)
+        start = time.perf_counter()
+        copied = source.copy_query_to(target=full, table_name='orders', sql='SELECT * FROM orders')
+        elapsed = time.perf_counter() - start
+        print(f'{"copy_query_to() (full)":<30}: {elapsed:8.3f} s  ({copied:,} rows)')
+        full.close()
+
+        reporting = SQLite(filepath=os.path.join(directory, 'reporting.db'), show_description=False)
+        for name in ['sync_table() (first)', 'sync_table() (delta)']:
+            start = time.perf_counter()
+            synced = source.sync_table(target=reporting, table_name='orders', watermark_column='version', key_columns='order_id')
+            elapsed = time.perf_counter() - start
+            print(f'{name:<30}: {elapsed:8.3f} s  ({synced:,} rows)')
+            changed = rng.choice(rows, changed_rows, replace=False).tolist()
+            source.query(
+                f'UPDATE orders SET amount = amount + 1, version = (SELECT MAX(version) FROM orders) + 1 WHERE order_id IN ({", ".join(str(i) for i in changed)})',
+                show_head=False,
+                warn_is_none=False
+            )
+            source.commit()
+        reporting.close()
+        source.close()
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:3]])
@@ -0,0 +1,73 @@
+"""
+Stress test of thread-safe mode: N threads share one SQLite manager (thread_safe=True, WAL journal) and run a mix of
+reads and writes against the same file, then the row counts are checked. Also compares the read throughput of the
+threads with a single thread.
+
+Usage:
+    python benchmarks/bench_thread_safe_stress.py [threads] [operations_per_thread]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dbpd import SQLite  # noqa: E402
+
+ROWS = 50_000
+
+
+def worker(db: SQLite, worker_id: int, operations: int) -> int:
+    rng = np.random.default_rng(seed=worker_id)
+    written = 0
+    for i in range(operations):
+        if i % 4 == 0:
+            db.insert_values(table_name='events', worker=worker_id, value=float(rng.random()))
+            db.commit()
+            written += 1
+        else:
+            low = int(rng.integers(0, ROWS))
+            df = db.query('SELECT * FROM readings WHERE id BETWEEN ? AND ?', parameters=[low, low + 1000], show_head=False, warn_is_none=False)
+            assert df is None or df['id'].between(low, low + 1000).all()
+    return written
+
+
+def run(db: SQLite, threads: int, operations: int) -> tuple:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        written = sum(executor.map(worker, [db] * threads, range(threads), [operations] * threads))
+    return time.perf_counter() - start, written
+
+
+def main(threads: int = 8, operations: int = 200) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, 'stress.db')
+        db = SQLite(filepath=filepath, performance_profile='balanced', thread_safe=True, show_description=False, timeout=30)
+        db.query('CREATE TABLE readings (id INTEGER PRIMARY KEY, value REAL)', show_head=False, warn_is_none=False)
+        db.query('CREATE TABLE events (worker INTEGER, value REAL)', show_head=False, warn_is_none=False)
+        db.insert_dataframe(table_name='readings', dataframe=pd.DataFrame({'id': np.arange(ROWS), 'value': np.random.default_rng(seed=0).random(ROWS)}))
+        db.commit()
+
+        for n in [1, threads]:
+            elapsed, written = run(db=db, threads=n, operations=operations)
+            total = n * operations
+            print(f'{n:>3} thread(s): {elapsed:8.3f} s  {total / elapsed:10,.0f} operations/s  ({written} writes)')
+
+        expected = operations // 4 + (operations % 4 > 0)
+        db.close()
+
+        check = SQLite(filepath=filepath, show_description=False)
+        counts = check.query('SELECT worker, COUNT(*) AS n FROM events GROUP BY worker', show_head=False)
+        check.close()
+        assert (counts.set_index('worker')['n'].loc[list(range(1, threads))] == expected).all(), counts
+        assert counts['n'].sum() == expected * (threads + 1), counts
+        print(f'OK: {counts["n"].sum()} rows written by {threads} threads, no lost or failed writes')
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:3]])
@@ -0,0 +1,48 @@
+"""
+Measures inserting rows one statement at a time into a SQLite database file with a commit per row, against the same
+inserts within BaseDBPD.transaction() (one commit for the block, or a group commit every N rows).
+
+Usage:
+    python benchmarks/bench_transaction.py [rows] [commit_every_rows]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dbpd import SQLite  # noqa: E402
+
+
+def main(rows: int = 20_000, commit_every_rows: int = 1_000) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        db = SQLite(filepath=os.path.join(directory, 'bench.db'), show_description=False)
+        db.query('CREATE TABLE events (id INTEGER PRIMARY KEY, name TEXT)', show_head=False, warn_is_none=False)
+        db.commit()
+
+        sample = min(rows, 2_000)
+        start = time.perf_counter()
+        for i in range(sample):
+            db.insert_values(table_name='events', id=i, name=f'event_{i}')
+            db.commit()
+        elapsed = time.perf_counter() - start
+        print(f'{"commit per row":<36}: {elapsed:8.3f} s  {sample / elapsed:12,.0f} rows/s  ({sample:,} rows)')
+
+        offset = sample
+        for name, kwargs in [
+            ('transaction()', {}),
+            (f'transaction(commit_every_rows={commit_every_rows})', {'commit_every_rows': commit_every_rows})
+        ]:
+            start = time.perf_counter()
+            with db.transaction(**kwargs):
+                for i in range(offset, offset + rows):
+                    db.insert_values(table_name='events', id=i, name=f'event_{i}')
+                    db.commit()
+            elapsed = time.perf_counter() - start
+            offset += rows
+            print(f'{name:<36}: {elapsed:8.3f} s  {rows / elapsed:12,.0f} rows/s  ({db.recent_transaction["commits"]:,} commits)')
+        db.close()
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:3]])
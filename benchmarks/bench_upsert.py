@@ -0,0 +1,54 @@
+"""
+Measures BaseDBPD.upsert_dataframe() syncing a DataFrame (half existing keys, half new keys) into a SQLite table,
+against the SELECT per key followed by an UPDATE or insert_values() that it replaces (measured on a sample and
+reported as rows/s).
+
+Usage:
+    python benchmarks/bench_upsert.py [rows] [batch_size]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dbpd import SQLite  # noqa: E402
+
+
+def main(rows: int = 1_000_000, batch_size: int = 10_000) -> None:
+    rng = np.random.default_rng(seed=0)
+    existing = pd.DataFrame({'id': np.arange(rows), 'price': rng.random(rows) * 100, 'stock': rng.integers(0, 1000, rows)})
+    # updates the second half of the existing keys and inserts as many new keys
+    sync = pd.DataFrame({'id': np.arange(rows // 2, rows + rows // 2), 'price': rng.random(rows) * 100, 'stock': rng.integers(0, 1000, rows)})
+
+    with tempfile.TemporaryDirectory() as directory:
+        db = SQLite(filepath=os.path.join(directory, 'bench.db'), show_description=False, performance_profile='balanced')
+        db.query('CREATE TABLE products (id INTEGER PRIMARY KEY, price REAL, stock INTEGER)', show_head=False, warn_is_none=False)
+        db.insert_dataframe(table_name='products', dataframe=existing)
+        db.commit()
+
+        start = time.perf_counter()
+        affected = db.upsert_dataframe(table_name='products', dataframe=sync, key_columns='id', batch_size=batch_size)
+        db.commit()
+        elapsed = time.perf_counter() - start
+        print(f'{"upsert_dataframe()":<30}: {elapsed:8.3f} s  {len(sync) / elapsed:14,.0f} rows/s  ({affected:,} rows affected)')
+
+        sample = sync.iloc[rows // 2 - min(rows, 20_000) // 2:rows // 2 + min(rows, 20_000) // 2]
+        start = time.perf_counter()
+        for row in db.dataframe_to_db_rows(dataframe=sample):
+            values = dict(zip(sample.columns, row))
+            if db.query('SELECT id FROM products WHERE id = ?', parameters=[values['id']], show_head=False, warn_is_none=False) is None:
+                db.insert_values(table_name='products', **values)
+            else:
+                db.query('UPDATE products SET price = ?, stock = ? WHERE id = ?', parameters=[values['price'], values['stock'], values['id']], show_head=False, warn_is_none=False)
+        db.commit()
+        elapsed = time.perf_counter() - start
+        print(f'{"SELECT + UPDATE/INSERT per key":<30}: {elapsed:8.3f} s  {len(sample) / elapsed:14,.0f} rows/s  ({len(sample):,} rows)')
+        db.close()
+
+
+if __name__ == '__main__':
+    main(*[int(i) for i in sys.argv[1:3]])
@@ -1,6 +1,46 @@
-from .dbpd import BaseDBPD
-from .access import Access
-from .mysql import MySQL
-from .oracle import Oracle
-from .postgres import Postgres
-from .sqlite import SQLite, SQLiteInMemory
\ No newline at end of file
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# The classes are imported from their modules on first access (e.g. dbpd.SQLite), so that "import dbpd" stays cheap
+# and each backend only loads what it needs: pandas/numpy for every backend, SQLAlchemy only for MySQL, Oracle and
+# Postgres, pyodbc only for Access and cryptography only on the first encrypt/decrypt call
+_LAZY_ATTRIBUTES = {
+    'BaseDBPD': '.dbpd',
+    'Access': '.access',
+    'ENGINE_REGISTRY': '.engine_registry',
+    'EngineRegistry': '.engine_registry',
+    'QueryRecord': '.instrumentation',
+    'QueryStats': '.instrumentation',
+    'MySQL': '.mysql',
+    'Oracle': '.oracle',
+    'Postgres': '.postgres',
+    'ResultCache': '.result_cache',
+    'SQLite': '.sqlite',
+    'SQLiteInMemory': '.sqlite'
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
+
+
+if TYPE_CHECKING:
+    from .dbpd import BaseDBPD
+    from .access import Access
+    from .engine_registry import ENGINE_REGISTRY, EngineRegistry
+    from .instrumentation import QueryRecord, QueryStats
+    from .mysql import MySQL
+    from .oracle import Oracle
+    from .postgres import Postgres
+    from .result_cache import ResultCache
+    from .sqlite import SQLite, SQLiteInMemory
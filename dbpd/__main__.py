@@ -0,0 +1,22 @@
+import sys
+
+USAGE = """usage: python -m dbpd <command> [options]
+
+commands:
+    bench    run the benchmark suite, see "python -m dbpd bench --help"
+"""
+
+
+def main(argv: list) -> int:
+    if not argv or argv[0] in ['-h', '--help']:
+        print(USAGE)
+        return 0 if argv else 2
+    if argv[0] == 'bench':
+        from .bench import main as bench_main
+        return bench_main(argv=argv[1:])
+    print(f'Unknown command "{argv[0]}"\n\n{USAGE}')
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main(argv=sys.argv[1:]))
@@ -1,4 +1,4 @@
-from .dbpd import BaseDBPD, Optional
+from .dbpd import BaseDBPD, Optional, Union
 
 
 class Access(BaseDBPD):
@@ -8,15 +8,17 @@ class Access(BaseDBPD):
     :param filepath: The filepath of the Access database (or where the new one should be created)
     :param description: A description of the database (for reference utility only)
     :param show_description: Whether the description should be printed to the console upon init
+    :param thread_safe: Gives every thread its own connection (or Session), so that the manager can be used from several threads (see BaseDBPD.db_conn)
     :param pyodbc_connection_kwargs: Any keyword arguments that should be passed to the pyodbc.connect() function
     """
 
     def __init__(
             self,
             filepath: str,
-            fernet_encryption_key: Optional[bytes] = None,
+            fernet_encryption_key: Optional[Union[bytes, list]] = None,
             description: str = 'MS Access database connection',
             show_description: bool = True,
+            thread_safe: bool = False,
             **pyodbc_connection_kwargs
     ):
         super(Access, self).__init__(
@@ -25,5 +27,6 @@ class Access(BaseDBPD):
             description=description,
             show_description=show_description,
             fernet_encryption_key=fernet_encryption_key,
+            thread_safe=thread_safe,
             **pyodbc_connection_kwargs
         )
\ No newline at end of file
@@ -0,0 +1,6 @@
+"""
+The dbpd benchmark suite, run it with "python -m dbpd bench" (see "python -m dbpd bench --help"). The benchmarks in the
+repository's benchmarks/ directory measure single features in more detail.
+"""
+from .data import BACKENDS, DTYPES, generate_dataframe, load_backend
+from .suite import OPERATIONS, compare_to_baseline, load_report, main, run_benchmarks, save_report
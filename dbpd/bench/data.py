@@ -0,0 +1,98 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from typing import Optional
+
+from ..dbpd import BaseDBPD
+from ..sqlite import SQLite, SQLiteInMemory
+
+
+DTYPES = ['int', 'float', 'str', 'datetime', 'bool']
+
+BACKENDS = ['sqlite', 'sqlite_in_memory', 'sqlalchemy']
+
+# Low-cardinality words for the 'str' columns, so that string columns resemble codes and categories of real tables
+WORDS = [
+    'alpha', 'bravo', 'charlie', 'delta', 'echo', 'foxtrot', 'golf', 'hotel',
+    'india', 'juliett', 'kilo', 'lima', 'mike', 'november', 'oscar', 'papa'
+]
+
+
+def generate_dataframe(
+        rows: int = 100000,
+        columns: int = 10,
+        dtypes: Optional[list] = None,
+        null_fraction: float = 0.0,
+        seed: int = 0
+) -> pd.DataFrame:
+    """
+    Generates a deterministic DataFrame of synthetic data, the same arguments always produce the same values. The first
+    column is an integer "id" column, the other columns cycle through "dtypes" and are named after their dtype
+    (e.g. int_1, float_2, str_3).
+
+    :param rows: The number of rows
+    :param columns: The number of columns, including the id column
+    :param dtypes: The dtypes of the columns: 'int', 'float', 'str', 'datetime' and/or 'bool', defaults to all of them
+    :param null_fraction: The fraction of values of each (non-id) column that are NULL
+    :param seed: The seed of the random generator
+    :return: DataFrame
+    """
+    if dtypes is None:
+        dtypes = DTYPES
+    invalid = [dtype for dtype in dtypes if dtype not in DTYPES]
+    if invalid or not dtypes:
+        raise ValueError(f'Invalid "dtypes" argument: {invalid or dtypes}. Must be a list of {DTYPES}')
+    if columns < 1:
+        raise ValueError(f'"columns" must be a positive integer, got {columns}')
+
+    rng = np.random.default_rng(seed=seed)
+    data = {'id': np.arange(rows, dtype=np.int64)}
+    for i in range(1, columns):
+        dtype = dtypes[(i - 1) % len(dtypes)]
+        if dtype == 'int':
+            values = pd.Series(rng.integers(0, 1_000_000, rows), dtype='int64')
+        elif dtype == 'float':
+            values = pd.Series(rng.random(rows) * 1000)
+        elif dtype == 'str':
+            values = pd.Series(np.array(WORDS, dtype=object)[rng.integers(0, len(WORDS), rows)]).astype(str)
+        elif dtype == 'datetime':
+            values = pd.Series(pd.Timestamp('2020-01-01') + pd.to_timedelta(rng.integers(0, 3 * 365 * 86400, rows), unit='s'))
+        else:
+            values = pd.Series(rng.random(rows) < 0.5)
+        if null_fraction > 0:
+            mask = rng.random(rows) < null_fraction
+            if dtype in ['int', 'bool']:
+                values = values.astype('Int64' if dtype == 'int' else 'boolean')
+            values = values.mask(mask)
+        data[f'{dtype}_{i}'] = values
+    return pd.DataFrame(data)
+
+
+def load_backend(backend: str, dataframe: pd.DataFrame, directory: str, table_name: str = 'bench') -> BaseDBPD:
+    """
+    Creates a database for a benchmark backend and loads a DataFrame into a new table:
+        sqlite:           a SQLite database file (SQLite)
+        sqlite_in_memory: an in-memory SQLite database (SQLiteInMemory)
+        sqlalchemy:       a SQLite database file connected through a SQLAlchemy "sqlite://" engine (BaseDBPD)
+
+    :param backend: One of BACKENDS
+    :param dataframe: The DataFrame to be loaded, e.g. from generate_dataframe()
+    :param directory: The directory for the database files
+    :param table_name: The name of the new table
+    :return: BaseDBPD - The connected manager, the caller is responsible for closing it
+    """
+    if backend == 'sqlite':
+        db = SQLite(filepath=os.path.join(directory, f'{backend}.db'), show_description=False)
+    elif backend == 'sqlite_in_memory':
+        db = SQLiteInMemory(show_description=False)
+    elif backend == 'sqlalchemy':
+        db = BaseDBPD(connection_credentials=f'sqlite:///{os.path.join(directory, backend + ".db")}', show_description=False)
+    else:
+        raise ValueError(f'Invalid "backend" argument: "{backend}". Must be one of {BACKENDS}')
+    sql = db._generate_create_table_sql_from_dataframe(dataframe=dataframe, table_name=table_name, dialect=db._dialect_name())
+    db.query(sql=sql, show_head=False, warn_is_none=False)
+    db.insert_dataframe(table_name=table_name, dataframe=dataframe)
+    db.commit()
+    return db
@@ -0,0 +1,389 @@
+import argparse
+import datetime
+import gc
+import importlib.util
+import json
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from typing import Optional
+
+from ..dbpd import BaseDBPD
+from .data import BACKENDS, DTYPES, generate_dataframe, load_backend
+
+
+# Operations that run once per backend, the other operations do not use a database
+BACKEND_OPERATIONS = ['query', 'query_iter', 'insert_values', 'insert_dataframe', 'export_query_to_sqlite', 'export_query_to_excel']
+OPERATIONS = BACKEND_OPERATIONS + ['flatten_sql', 'convert_numpy_value', 'dataframe_to_db_rows', 'encrypt_value', 'decrypt_value', 'encrypt_column', 'decrypt_column']
+
+# Operations skipped when an optional dependency is not installed
+OPTIONAL_DEPENDENCIES = {
+    'export_query_to_excel': 'openpyxl',
+    'encrypt_value': 'cryptography',
+    'decrypt_value': 'cryptography',
+    'encrypt_column': 'cryptography',
+    'decrypt_column': 'cryptography'
+}
+
+TABLE_NAME = 'bench'
+
+
+def _operations(config: dict, dataframe: pd.DataFrame, managers: dict, directory: str) -> list:
+    """
+    Builds the benchmarked operations, each is a tuple of (operation, backend, unit, function) where the function runs
+    the operation once and returns the number of units processed. Operations that write to the benchmark table roll
+    back afterwards, so that every run sees the same data.
+    """
+    sample = dataframe.iloc[:config['sample']]
+    sample_rows = BaseDBPD.dataframe_to_db_rows(dataframe=sample)
+    select_sql = f'SELECT * FROM {TABLE_NAME}'
+    operations = []
+
+    for backend, db in managers.items():
+        def _query(db=db) -> int:
+            return len(db.query(sql=select_sql, show_head=False))
+
+        def _query_iter(db=db) -> int:
+            return sum(len(df) for df in db.query_iter(sql=select_sql, chunksize=10000))
+
+        def _insert_values(db=db) -> int:
+            for row in sample_rows:
+                db.insert_values(TABLE_NAME, **dict(zip(sample.columns, row)))
+            db.rollback()
+            return len(sample_rows)
+
+        def _insert_dataframe(db=db) -> int:
+            inserted = db.insert_dataframe(table_name=TABLE_NAME, dataframe=dataframe)
+            db.rollback()
+            return inserted
+
+        def _export_query_to_sqlite(db=db, backend=backend) -> int:
+            out_filepath = os.path.join(directory, f'export_{backend}.db')
+            if os.path.isfile(out_filepath):
+                os.remove(out_filepath)
+            return len(db.export_query_to_sqlite(out_filepath=out_filepath, out_table_name=TABLE_NAME, in_sql=select_sql))
+
+        def _export_query_to_excel(db=db, backend=backend) -> int:
+            out_filepath = os.path.join(directory, f'export_{backend}.xlsx')
+            if os.path.isfile(out_filepath):
+                os.remove(out_filepath)
+            return len(db.export_query_to_excel(out_filepath=out_filepath, out_table_name=TABLE_NAME, in_sql=f'{select_sql} LIMIT {config["sample"]}'))
+
+        operations += [
+            ('query', backend, 'rows', _query),
+            ('query_iter', backend, 'rows', _query_iter),
+            ('insert_values', backend, 'rows', _insert_values),
+            ('insert_dataframe', backend, 'rows', _insert_dataframe),
+            ('export_query_to_sqlite', backend, 'rows', _export_query_to_sqlite),
+            ('export_query_to_excel', backend, 'rows', _export_query_to_excel)
+        ]
+
+    statements = [BaseDBPD.TABLE_NAME_QUERIES[i] for i in sorted(BaseDBPD.TABLE_NAME_QUERIES)]
+
+    def _flatten_sql() -> int:
+        count = config['sample'] * 10
+        for i in range(count):
+            BaseDBPD.flatten_sql(statements[i % len(statements)])
+        return count
+
+    values = [(column, value) for column in sample.columns for value in sample[column].to_numpy()]
+
+    def _convert_numpy_value() -> int:
+        for column, value in values:
+            BaseDBPD.convert_numpy_value(value=value, column=column, null_zeroes_for_columns=[])
+        return len(values)
+
+    def _dataframe_to_db_rows() -> int:
+        return len(BaseDBPD.dataframe_to_db_rows(dataframe=dataframe))
+
+    operations += [
+        ('flatten_sql', None, 'statements', _flatten_sql),
+        ('convert_numpy_value', None, 'values', _convert_numpy_value),
+        ('dataframe_to_db_rows', None, 'rows', _dataframe_to_db_rows)
+    ]
+
+    crypto_operations = ['encrypt_value', 'decrypt_value', 'encrypt_column', 'decrypt_column']
+    if any(i in config['operations'] for i in crypto_operations) and importlib.util.find_spec('cryptography') is not None:
+        from cryptography.fernet import Fernet
+
+        crypto_db = next(iter(managers.values()), None) or BaseDBPD(sqlite_in_memory=True, show_description=False)
+        crypto_db.fernet_encryption_key = Fernet.generate_key()
+        plain = pd.DataFrame({'value': [str(value) for value in dataframe.iloc[:, -1].to_numpy()]})
+        tokens = crypto_db.encrypt_column(dataframe=plain.iloc[:config['sample']], column='value', workers=1)['value'].tolist()
+        encrypted = crypto_db.encrypt_column(dataframe=plain, column='value', workers=1)
+
+        def _encrypt_value() -> int:
+            for value in plain['value'].iloc[:config['sample']]:
+                crypto_db.encrypt_value(value=value)
+            return config['sample']
+
+        def _decrypt_value() -> int:
+            for token in tokens:
+                crypto_db.decrypt_value(value=token)
+            return len(tokens)
+
+        def _encrypt_column() -> int:
+            crypto_db.encrypt_column(dataframe=plain, column='value')
+            return len(plain)
+
+        def _decrypt_column() -> int:
+            crypto_db.decrypt_column(dataframe=encrypted, column='value')
+            return len(encrypted)
+
+        operations += [
+            ('encrypt_value', None, 'values', _encrypt_value),
+            ('decrypt_value', None, 'values', _decrypt_value),
+            ('encrypt_column', None, 'values', _encrypt_column),
+            ('decrypt_column', None, 'values', _decrypt_column)
+        ]
+    return [operation for operation in operations if operation[0] in config['operations']]
+
+
+def _measure(function: callable, repeat: int, memory: bool) -> tuple:
+    """
+    Runs a function "repeat" times and returns (units processed, best seconds, peak MB). The peak memory is measured in
+    one extra run with tracemalloc, as tracing slows down the timed runs.
+    """
+    best = None
+    units = 0
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        units = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    peak_mb = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            function()
+            peak_mb = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+        finally:
+            tracemalloc.stop()
+    return units, best, peak_mb
+
+
+def run_benchmarks(
+        rows: int = 100000,
+        columns: int = 10,
+        dtypes: Optional[list] = None,
+        null_fraction: float = 0.1,
+        seed: int = 0,
+        sample: int = 2000,
+        repeat: int = 3,
+        backends: Optional[list] = None,
+        operations: Optional[list] = None,
+        memory: bool = True,
+        show_progress: bool = True
+) -> dict:
+    """
+    Runs the benchmark suite on deterministic synthetic data (see generate_dataframe()) loaded into each backend (see
+    load_backend()), and returns the configuration, environment and results as a JSON-serializable dictionary. Each
+    result holds the best of "repeat" timed runs and the peak memory allocated by Python during one traced run.
+
+    :param rows: The number of rows of the benchmark table
+    :param columns: The number of columns of the benchmark table
+    :param dtypes: The dtypes of the columns, see generate_dataframe()
+    :param null_fraction: The fraction of NULL values per column
+    :param seed: The seed of the synthetic data
+    :param sample: The number of rows (or values) used by the per-row operations, such as insert_values() and encrypt_value()
+    :param repeat: The number of timed runs per operation
+    :param backends: The backends to benchmark, defaults to all of BACKENDS
+    :param operations: The operations to benchmark, defaults to all of OPERATIONS
+    :param memory: Boolean indicating if the peak memory should be measured
+    :param show_progress: Boolean indicating if each result should be printed as it is measured
+    :return: dict - {'config': ..., 'environment': ..., 'results': [...]}
+    """
+    config = {
+        'rows': rows,
+        'columns': columns,
+        'dtypes': list(dtypes or DTYPES),
+        'null_fraction': null_fraction,
+        'seed': seed,
+        'sample': min(sample, rows),
+        'repeat': repeat,
+        'backends': list(backends or BACKENDS),
+        'operations': list(operations or OPERATIONS)
+    }
+    invalid = [i for i in config['backends'] if i not in BACKENDS] + [i for i in config['operations'] if i not in OPERATIONS]
+    if invalid:
+        raise ValueError(f'Invalid backends or operations: {invalid}. Backends: {BACKENDS}, operations: {OPERATIONS}')
+    environment = {
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'pandas': pd.__version__
+    }
+
+    dataframe = generate_dataframe(rows=rows, columns=columns, dtypes=config['dtypes'], null_fraction=null_fraction, seed=seed)
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        managers = {}
+        try:
+            uses_backends = any(i in BACKEND_OPERATIONS for i in config['operations'])
+            for backend in config['backends'] if uses_backends else []:
+                managers[backend] = load_backend(backend=backend, dataframe=dataframe, directory=directory, table_name=TABLE_NAME)
+            for operation, backend, unit, function in _operations(config=config, dataframe=dataframe, managers=managers, directory=directory):
+                result = {'operation': operation, 'backend': backend, 'unit': unit}
+                dependency = OPTIONAL_DEPENDENCIES.get(operation)
+                if dependency is not None and importlib.util.find_spec(dependency) is None:
+                    result['skipped'] = f'requires {dependency}'
+                else:
+                    units, seconds, peak_mb = _measure(function=function, repeat=repeat, memory=memory)
+                    result.update({'units': units, 'seconds': seconds, 'throughput': units / seconds if seconds else None, 'peak_mb': peak_mb})
+                results.append(result)
+                if show_progress:
+                    print(format_result(result=result))
+        finally:
+            for db in managers.values():
+                db.close(commit_on_quit=False)
+    return {'config': config, 'environment': environment, 'results': results}
+
+
+def compare_to_baseline(report: dict, baseline: dict, tolerance: float = 0.2) -> list:
+    """
+    Compares the results of run_benchmarks() to a saved baseline report. An operation has regressed if its throughput
+    dropped by more than "tolerance" (a fraction) or its peak memory grew by more than "tolerance" (and at least 1 MB).
+
+    :param report: The report returned by run_benchmarks()
+    :param baseline: A report saved earlier, see save_report()
+    :param tolerance: The allowed relative slowdown or memory growth
+    :return: list - A dictionary per result that is also in the baseline: operation, backend, throughput_change, peak_mb_change, regressed
+    """
+    baseline_results = {(i['operation'], i['backend']): i for i in baseline['results'] if 'skipped' not in i}
+    comparisons = []
+    for result in report['results']:
+        previous = baseline_results.get((result['operation'], result['backend']))
+        if previous is None or 'skipped' in result:
+            continue
+        throughput_change = result['throughput'] / previous['throughput'] - 1 if result['throughput'] and previous['throughput'] else None
+        peak_mb_change = None
+        if result.get('peak_mb') is not None and previous.get('peak_mb'):
+            peak_mb_change = result['peak_mb'] / previous['peak_mb'] - 1
+        regressed = (
+            (throughput_change is not None and throughput_change < -tolerance) or
+            (peak_mb_change is not None and peak_mb_change > tolerance and result['peak_mb'] - previous['peak_mb'] >= 1)
+        )
+        comparisons.append({
+            'operation': result['operation'],
+            'backend': result['backend'],
+            'throughput_change': throughput_change,
+            'peak_mb_change': peak_mb_change,
+            'regressed': regressed
+        })
+    return comparisons
+
+
+def format_result(result: dict, comparison: Optional[dict] = None) -> str:
+    """
+    Formats a single result (and its comparison to the baseline) as a line of the results table
+
+    :param result: A result of run_benchmarks()
+    :param comparison: The result's comparison returned by compare_to_baseline()
+    :return: str
+    """
+    name = f'{result["operation"]:<24} {result["backend"] or "-":<18}'
+    if 'skipped' in result:
+        return f'{name} skipped ({result["skipped"]})'
+    peak = '-' if result['peak_mb'] is None else f'{result["peak_mb"]:.1f}'
+    line = f'{name} {result["seconds"]:10.4f} s {result["throughput"]:14,.0f} {result["unit"] + "/s":<12} {peak:>8} MB'
+    if comparison is not None:
+        change = comparison['throughput_change']
+        line += f'  {"-" if change is None else f"{change:+.1%}":>8}'
+        if comparison['peak_mb_change'] is not None:
+            line += f' mem {comparison["peak_mb_change"]:+.1%}'
+        if comparison['regressed']:
+            line += '  REGRESSION'
+    return line
+
+
+def load_report(filepath: str) -> dict:
+    """
+    Reads a report saved with save_report()
+
+    :param filepath: The filepath of the JSON file
+    :return: dict
+    """
+    with open(filepath, mode='r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_report(report: dict, filepath: str) -> None:
+    """
+    Writes a report of run_benchmarks() to a JSON file, to be used as the baseline of later runs
+
+    :param report: The report returned by run_benchmarks()
+    :param filepath: The filepath of the JSON file
+    :return: None
+    """
+    directory = os.path.dirname(os.path.abspath(filepath))
+    os.makedirs(directory, exist_ok=True)
+    with open(filepath, mode='w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+
+def main(argv: Optional[list] = None) -> int:
+    """
+    The "python -m dbpd bench" command line entry point, see "python -m dbpd bench --help"
+
+    :param argv: The command line arguments after "bench", defaults to sys.argv[1:]
+    :return: int - The exit status, 1 if an operation regressed compared to the baseline
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m dbpd bench',
+        description='Benchmarks the dbpd hot paths on deterministic synthetic data and compares the results to a JSON baseline.'
+    )
+    parser.add_argument('--rows', type=int, default=100000, help='the number of rows of the benchmark table (default: %(default)s)')
+    parser.add_argument('--columns', type=int, default=10, help='the number of columns of the benchmark table (default: %(default)s)')
+    parser.add_argument('--dtypes', nargs='+', choices=DTYPES, default=DTYPES, help='the dtypes of the columns (default: all)')
+    parser.add_argument('--null-fraction', type=float, default=0.1, help='the fraction of NULL values per column (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=0, help='the seed of the synthetic data (default: %(default)s)')
+    parser.add_argument('--sample', type=int, default=2000, help='the rows or values used by the per-row operations (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=3, help='the number of timed runs per operation, the best is reported (default: %(default)s)')
+    parser.add_argument('--backends', nargs='+', choices=BACKENDS, default=BACKENDS, help='the backends to benchmark (default: all)')
+    parser.add_argument('--operations', nargs='+', choices=OPERATIONS, default=OPERATIONS, help='the operations to benchmark (default: all)')
+    parser.add_argument('--no-memory', action='store_true', help='skip the traced run that measures the peak memory')
+    parser.add_argument('--save', metavar='PATH', help='save the results as a JSON baseline')
+    parser.add_argument('--compare', metavar='PATH', help='compare the results to a JSON baseline saved with --save')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='the allowed slowdown or memory growth compared to the baseline (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    baseline = None if args.compare is None else load_report(filepath=args.compare)
+    print(f'dbpd benchmarks: {args.rows:,} rows x {args.columns} columns, best of {args.repeat}\n')
+    report = run_benchmarks(
+        rows=args.rows,
+        columns=args.columns,
+        dtypes=args.dtypes,
+        null_fraction=args.null_fraction,
+        seed=args.seed,
+        sample=args.sample,
+        repeat=args.repeat,
+        backends=args.backends,
+        operations=args.operations,
+        memory=not args.no_memory,
+        show_progress=baseline is None
+    )
+
+    status = 0
+    if baseline is not None:
+        differences = [key for key in ['rows', 'columns', 'dtypes', 'null_fraction', 'seed', 'sample'] if baseline['config'].get(key) != report['config'][key]]
+        if differences:
+            BaseDBPD._warn(f'The baseline was run with a different {", ".join(differences)}, the results are not comparable')
+        comparisons = {(i['operation'], i['backend']): i for i in compare_to_baseline(report=report, baseline=baseline, tolerance=args.tolerance)}
+        for result in report['results']:
+            print(format_result(result=result, comparison=comparisons.get((result['operation'], result['backend']))))
+        regressions = [i for i in comparisons.values() if i['regressed']]
+        if regressions:
+            print(f'\n{len(regressions)} operation(s) regressed by more than {args.tolerance:.0%} compared to {args.compare}')
+            status = 1
+    if args.save is not None:
+        save_report(report=report, filepath=args.save)
+        print(f'\nSaved the results to {args.save}')
+    return status
@@ -3,18 +3,119 @@ import inspect
 import numpy as np
 import os
 import pandas as pd
-import pyodbc
-import sqlalchemy
+import re
 import sqlite3
 import threading
+import time
 
-from cryptography.fernet import Fernet
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
 from hashlib import sha1, sha224, sha256, sha384, sha512
-from sqlalchemy import text, Engine
-from sqlalchemy.orm import sessionmaker, Session
-from typing import Any, Literal, Optional, Union
+from itertools import chain, islice
+from typing import Any, Iterable, Iterator, Literal, Optional, Union, TYPE_CHECKING
 from uuid import uuid4
-from win32com.client import Dispatch
+
+from .engine_registry import ENGINE_REGISTRY
+from .instrumentation import QueryRecord, QueryStats
+from .result_cache import ResultCache
+
+if TYPE_CHECKING:
+    # The drivers are imported where they are first used, so that importing dbpd (or using only SQLite) does not pay
+    # for loading SQLAlchemy, pyodbc, pywin32 or cryptography, and so that pyodbc/pywin32 are not required off Windows.
+    # sqlalchemy.ext.asyncio also requires greenlet at import time, it is only imported once an async method is used
+    import pyarrow as pa
+    import pyodbc
+    import sqlalchemy
+    from cryptography.fernet import Fernet, MultiFernet
+    from sqlalchemy import Engine, TextClause
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+    from sqlalchemy.orm import Session, SessionTransaction
+
+
+def _fernet_values(fernet_encryption_key: Union[bytes, tuple], values: list, decrypt: bool, encoding: str = 'utf-8', ttl: Optional[int] = None) -> list:
+    """
+    Encrypts or decrypts a chunk of (non-NULL) column values for BaseDBPD.encrypt_column() and BaseDBPD.decrypt_column(),
+    this is a module-level function so that it can be run in a process pool. The Fernet instance is cached per key
+    within each process.
+
+    :param fernet_encryption_key: The encryption key, or a tuple of keys for key rotation (see BaseDBPD._fernet())
+    :param values: The values to be encrypted (converted to strings and then bytes) or decrypted
+    :param decrypt: Boolean indicating if the values should be decrypted rather than encrypted
+    :param encoding: The encoding of the values to bytes, or the original encoding of the decrypted values
+    :param ttl: The timeout of the tokens when decrypting
+    :return: list - The encrypted bytes or the decrypted strings
+    """
+    fernet = BaseDBPD._fernet(fernet_encryption_key)
+    if decrypt:
+        return [fernet.decrypt(bytes(value) if isinstance(value, memoryview) else value, ttl).decode(encoding=encoding) for value in values]
+    return [fernet.encrypt(bytes(str(value), encoding=encoding)) for value in values]
+
+
+class _LockedSQLiteCursor(object):
+    """
+    A sqlite3 cursor of a _LockedSQLiteConnection, every method call holds the connection's lock
+    """
+
+    def __init__(self, cursor: sqlite3.Cursor, lock: threading.RLock):
+        self._cursor = cursor
+        self._lock = lock
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._cursor, name)
+        if not callable(value):
+            return value
+
+        def _locked(*args, **kwargs):
+            with self._lock:
+                result = value(*args, **kwargs)
+            return self if result is self._cursor else result
+        return _locked
+
+    def __iter__(self) -> Iterator[tuple]:
+        return iter(self.fetchone, None)
+
+
+class _LockedSQLiteConnection(object):
+    """
+    The sqlite3 connection of a thread-safe in-memory database, which all threads share as an in-memory database cannot
+    be opened twice. sqlite3 does not serialize the calls of several threads on one connection (they fail or corrupt
+    the results), so every method call of the connection and of its cursors holds a lock.
+
+    :param connection: The sqlite3 connection
+    """
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.sqlite_connection = connection
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self.sqlite_connection, name)
+        if not callable(value):
+            return value
+
+        def _locked(*args, **kwargs):
+            with self._lock:
+                result = value(*args, **kwargs)
+            return _LockedSQLiteCursor(cursor=result, lock=self._lock) if isinstance(result, sqlite3.Cursor) else result
+        return _locked
+
+    def backup(self, target: sqlite3.Connection, *, pages: int = -1, progress: Optional[callable] = None, **kwargs) -> None:
+        """
+        sqlite3.Connection.backup() that only holds the lock during each step of "pages" pages, it is released between the
+        steps (while "progress" is called) so that a stepped copy does not hold up the other threads for the whole copy
+        """
+        def _step(status: int, remaining: int, total: int) -> None:
+            self._lock.release()
+            try:
+                if progress is not None:
+                    progress(status, remaining, total)
+            finally:
+                self._lock.acquire()
+
+        with self._lock:
+            self.sqlite_connection.backup(target, pages=pages, progress=_step, **kwargs)
 
 
 class BaseDBPD(object):
@@ -53,6 +154,11 @@ class BaseDBPD(object):
             msg = f'Invalid "filepath" argument: "{filepath}". Files must be ".accdb" or ".mdb" files'
             super(BaseDBPD.AccessFileError, self).__init__(msg)
 
+    class DatabaseTypeError(AttributeError):
+        def __init__(self, method: str, database_type: str, supported: list):
+            msg = f'"{method}()" is only supported for {", ".join(supported)} databases, not "{database_type}"'
+            super(BaseDBPD.DatabaseTypeError, self).__init__(msg)
+
     class EncryptionKeyError(AttributeError):
         def __init__(self):
             super(BaseDBPD.EncryptionKeyError, self).__init__('No "fernet_encryption_key" attribute has been set')
@@ -122,6 +228,57 @@ class BaseDBPD(object):
         """
     }
 
+    # Statements that change the schema, these clear the table and column name cache when run through query()
+    DDL_PATTERN = re.compile(r'^\s*(?:(?:--[^\n]*(?:\n|$)|/\*.*?\*/)\s*)*(?:CREATE|DROP|ALTER|RENAME)\b', flags=re.IGNORECASE | re.DOTALL)
+
+    # Column types used when tables are created from DataFrames (copy_query_to(), export_query_to_access(), import_file()),
+    # keyed by dialect name (see _dialect_name())
+    CREATE_TABLE_TYPES = {
+        'access': {'int': 'INTEGER', 'float': 'DOUBLE', 'date': 'DATETIME', 'bool': 'BIT', 'other': 'VARCHAR'},
+        'sqlite': {'int': 'INTEGER', 'float': 'REAL', 'date': 'TIMESTAMP', 'bool': 'INTEGER', 'other': 'TEXT'},
+        'postgresql': {'int': 'BIGINT', 'float': 'DOUBLE PRECISION', 'date': 'TIMESTAMP', 'bool': 'BOOLEAN', 'other': 'TEXT'},
+        'mysql': {'int': 'BIGINT', 'float': 'DOUBLE', 'date': 'DATETIME(6)', 'bool': 'BOOLEAN', 'other': 'TEXT'},
+        'oracle': {'int': 'NUMBER(19)', 'float': 'BINARY_DOUBLE', 'date': 'TIMESTAMP', 'bool': 'NUMBER(1)', 'other': 'VARCHAR2(4000)'},
+        'mssql': {'int': 'BIGINT', 'float': 'FLOAT', 'date': 'DATETIME2', 'bool': 'BIT', 'other': 'NVARCHAR(MAX)'},
+        'default': {'int': 'BIGINT', 'float': 'DOUBLE PRECISION', 'date': 'TIMESTAMP', 'bool': 'BOOLEAN', 'other': 'VARCHAR(255)'}
+    }
+
+    # Keyword arguments accepted by sqlite3.connect(), which cannot be inspected on every Python version
+    SQLITE_CONNECT_ARGS = ['database', 'timeout', 'detect_types', 'isolation_level', 'check_same_thread', 'factory', 'cached_statements', 'uri', 'autocommit']
+
+    # Pragmas applied to SQLite connections by the "sqlite_performance_profile" argument, see set_sqlite_performance_profile()
+    #   balanced:   WAL journal (readers do not block the writer), fsync only at checkpoints, 64 MB page cache, 256 MB mmap
+    #   read_heavy: as balanced, with a 256 MB page cache and 1 GB of memory-mapped I/O
+    #   bulk_load:  as balanced, without any fsync (a power loss can lose or corrupt recent transactions) and a 256 MB cache
+    SQLITE_PERFORMANCE_PROFILES = {
+        'balanced': {'journal_mode': 'WAL', 'synchronous': 'NORMAL', 'cache_size': -65536, 'temp_store': 'MEMORY', 'mmap_size': 268435456},
+        'read_heavy': {'journal_mode': 'WAL', 'synchronous': 'NORMAL', 'cache_size': -262144, 'temp_store': 'MEMORY', 'mmap_size': 1073741824},
+        'bulk_load': {'journal_mode': 'WAL', 'synchronous': 'OFF', 'cache_size': -262144, 'temp_store': 'MEMORY', 'mmap_size': 268435456}
+    }
+
+    # Pragmas applied temporarily by sqlite_bulk_load(), databases in WAL mode stay in WAL mode
+    SQLITE_BULK_LOAD_PRAGMAS = {'journal_mode': 'MEMORY', 'synchronous': 'OFF', 'cache_size': -262144, 'temp_store': 'MEMORY'}
+
+    # Async SQLAlchemy drivers used by the async methods (aquery(), etc.), keyed by the backend name of the sync engine's URL
+    ASYNC_DRIVERS = {
+        'mysql': 'mysql+aiomysql',
+        'oracle': 'oracle+oracledb',
+        'postgresql': 'postgresql+asyncpg',
+        'sqlite': 'sqlite+aiosqlite'
+    }
+
+    # The number of rows fetched per round trip when building DataFrames from sqlite3 and pyodbc cursors
+    FETCHMANY_SIZE = 10000
+
+    # The maximum number of text() constructs kept by the SQLAlchemy statement cache, see statement_cache_info()
+    STATEMENT_CACHE_SIZE = 512
+
+    # String columns with at most this ratio of distinct values to rows are decoded as 'category' by compact_dataframe()
+    CATEGORY_MAX_RATIO = 0.5
+
+    # The table of the target database in which sync_table() stores the high-water mark of each synced table
+    SYNC_WATERMARK_TABLE = 'dbpd_sync_watermarks'
+
     COLUMN_NAME_QUERIES = {
         # Note that MS Access info will be handled by a pyodbc.connect.cursor object
         'oracle': """
@@ -172,7 +329,12 @@ class BaseDBPD(object):
             filepath: Optional[str] = None,
             sqlite_in_memory: Optional[bool] = False,
             show_description: bool = True,
-            fernet_encryption_key: Optional[bytes] = None,
+            fernet_encryption_key: Optional[Union[bytes, list]] = None,
+            schema_cache_ttl: Optional[float] = 60.0,
+            sqlite_performance_profile: Optional[Literal['balanced', 'read_heavy', 'bulk_load']] = None,
+            thread_safe: bool = False,
+            shared_engine: bool = False,
+            warm_up_connections: int = 0,
             **connection_kwargs
     ):
         self.description = description
@@ -181,31 +343,99 @@ class BaseDBPD(object):
         self.mysql_database_name = mysql_database_name
         self.fernet_encryption_key = fernet_encryption_key
 
-        self.db_conn: Union[sqlite3.Connection, pyodbc.Connection, Session]
-        self.engine: Optional[Engine] = None
+        self._db_conn: Union[sqlite3.Connection, 'pyodbc.Connection', 'Session']
+        self.engine: Optional['Engine'] = None
+        self.shared_engine = shared_engine  # the engine is shared through the ENGINE_REGISTRY and is not disposed by close()
+
+        # In thread-safe mode every connection (or Session) created for a thread is kept here, see the db_conn property
+        self.thread_safe = thread_safe
+        self._connect_kwargs: dict = {}
+        self._thread_local: Optional[threading.local] = None
+        self._thread_connections: Optional[list] = None
+        self._thread_lock = threading.Lock()
+
+        # Created on the first call of an async method, see the "Async methods" section
+        self.async_connection_credentials: Optional[str] = None
+        self.async_engine: Optional['AsyncEngine'] = None
+        self.async_db_conn: Optional['AsyncSession'] = None
+        self._async_executor: Optional[ThreadPoolExecutor] = None
         self.filepath: Optional[str] = None
         self.file_ext: Optional[str] = None
+        self.sqlite_performance_profile: Optional[str] = None
 
         self.recent_query: Optional[str] = None
         self.recent_df: Optional[pd.DataFrame] = None
+        self.recent_description: Optional[tuple] = None  # the DBAPI cursor.description of the most recent query_iter()
+        self.recent_query_many_timings: list = []
+        self.recent_column_crypto: Optional[dict] = None  # the values per second of the most recent encrypt_column()/decrypt_column()
+
+        # Query results are only cached once enable_result_cache() has been called
+        self.result_cache: Optional[ResultCache] = None
+
+        # The state of the transaction() blocks of each thread, see transaction()
+        self._transaction_local = threading.local()
+        self.recent_transaction: Optional[dict] = None  # the rows, commits and seconds of the most recent outermost transaction()
+        self.recent_sync: Optional[dict] = None  # the rows, watermarks and seconds of the most recent sync_table()
+
+        # Instrumentation, see add_query_hook() and enable_query_stats()
+        self.query_stats: Optional[QueryStats] = None
+        self._pre_execute_hooks: list = []
+        self._post_execute_hooks: list = []
+
+        # Table and column names are cached per connection, see schema_cache_info() and invalidate_schema_cache()
+        self.schema_cache_ttl = schema_cache_ttl
+        self.schema_cache_hits = 0
+        self.schema_cache_misses = 0
+        self._schema_cache = {}
+        self._schema_cache_lock = threading.Lock()  # the worker threads of query_many() read and fill the cache concurrently
+
+        # text() constructs of SQLAlchemy statements are reused per sql string, see _text() and statement_cache_info()
+        self.statement_cache_hits = 0
+        self.statement_cache_misses = 0
+        self._statement_cache = OrderedDict()
+        self._statement_cache_lock = threading.Lock()
 
         if filepath is None:  # Start In-Memory Sqlite Database OR SQLAlchemy Engine for Postgres or Oracle
             if sqlite_in_memory:
                 pass_kwargs = self._filter_callable_kwargs(func=sqlite3.connect, passed_kwargs=connection_kwargs)
-                self.db_conn = sqlite3.connect(database=':memory:', **pass_kwargs)
+                if thread_safe:
+                    # all threads share the in-memory database's one connection, its calls are serialized by a lock
+                    pass_kwargs.setdefault('check_same_thread', False)
+                    self.db_conn = _LockedSQLiteConnection(connection=sqlite3.connect(database=':memory:', **pass_kwargs))
+                else:
+                    self.db_conn = sqlite3.connect(database=':memory:', **pass_kwargs)
+                self._connect_kwargs = pass_kwargs
+                if sqlite_performance_profile is not None:
+                    self.set_sqlite_performance_profile(profile=sqlite_performance_profile)
             else:
+                import sqlalchemy
+                from sqlalchemy.orm import sessionmaker
                 pass_kwargs = self._filter_callable_kwargs(func=sqlalchemy.create_engine, passed_kwargs=connection_kwargs)
-                self.engine = sqlalchemy.create_engine(url=connection_credentials, **pass_kwargs)
-                self.db_conn = sessionmaker(bind=self.engine)()
+                if shared_engine:
+                    self.engine = ENGINE_REGISTRY.get_engine(url=connection_credentials, **pass_kwargs)
+                else:
+                    self.engine = ENGINE_REGISTRY.track(engine=sqlalchemy.create_engine(url=connection_credentials, **pass_kwargs))
+                if warm_up_connections > 0:
+                    ENGINE_REGISTRY.warm_up(engine=self.engine, connections=warm_up_connections)
+                if thread_safe:
+                    self.db_conn = self._scoped_session()
+                else:
+                    self.db_conn = sessionmaker(bind=self.engine)()
 
         else:
             if filepath.endswith('.sqlite') or filepath.endswith('.db'):
                 if not os.path.isfile(filepath):
                     self._warn(f'"{os.path.basename(filepath)}" does not exist, a blank database will be created.')
                 pass_kwargs = self._filter_callable_kwargs(func=sqlite3.connect, passed_kwargs=connection_kwargs)
+                if thread_safe:
+                    # each thread only uses its own connection, but close() commits and closes all of them from one thread
+                    pass_kwargs.setdefault('check_same_thread', False)
                 self.filepath = os.path.abspath(filepath).replace('\\', '/')
                 self.file_ext = os.path.splitext(self.filepath)[-1]
                 self.db_conn = sqlite3.connect(database=self.filepath, **pass_kwargs)
+                self._connect_kwargs = pass_kwargs
+                if sqlite_performance_profile is not None:
+                    self.set_sqlite_performance_profile(profile=sqlite_performance_profile)
 
             elif filepath.endswith('.accdb') or filepath.endswith('.mdb'):
                 if not os.path.isfile(filepath):
@@ -217,21 +447,54 @@ class BaseDBPD(object):
                         if os.path.isfile(fp):
                             os.remove(fp)
                         raise e
+                import pyodbc
                 pass_kwargs = self._filter_callable_kwargs(func=pyodbc.connect, passed_kwargs=connection_kwargs)
                 self.filepath = os.path.abspath(filepath).replace('\\', '/')
                 self.file_ext = os.path.splitext(self.filepath)[-1]
                 driver = self.access_driver(filepath=filepath)
                 self.db_conn = pyodbc.connect(driver, **pass_kwargs)
+                self._connect_kwargs = pass_kwargs
 
             else:
                 raise self.InitFileError(filepath=filepath)
 
+        # In-memory databases cannot be shared between connections, so all threads use the one sqlite3 connection
+        if thread_safe and self.filepath is not None:
+            self._thread_local = threading.local()
+            self._thread_local.connection = self._db_conn
+            self._thread_connections = [self._db_conn]
+
         if self.description is not None and show_description:
             print(f'{self.description}\n')
 
+    @property
+    def db_conn(self) -> Union[sqlite3.Connection, 'pyodbc.Connection', 'Session']:
+        """
+        The sqlite3 or pyodbc connection, or the SQLAlchemy Session, of the database.
+
+        In thread-safe mode (thread_safe=True) each thread gets its own sqlite3 or pyodbc connection to the database
+        file, created on the thread's first use, so that reads run concurrently (use a WAL journal, see the "balanced"
+        SQLite performance profile) and each thread commits its own transactions. For SQLAlchemy db_conn is a
+        scoped_session, which gives every thread its own Session from the engine's connection pool. In-memory SQLite
+        databases cannot be opened twice, their single connection is shared by all threads: each call on it holds a lock,
+        and the threads share its transaction (a commit() of one thread also commits the changes of the others).
+
+        :return: sqlite3.Connection, pyodbc.Connection or Session
+        """
+        if self._thread_local is None:
+            return self._db_conn
+        connection = getattr(self._thread_local, 'connection', None)
+        if connection is None:
+            connection = self._connect_thread()
+        return connection
+
+    @db_conn.setter
+    def db_conn(self, connection: Union[sqlite3.Connection, 'pyodbc.Connection', 'Session']) -> None:
+        self._db_conn = connection
+
     # Access and/or SQLite specific methods ##################################################################
-    @staticmethod
-    def _access_generate_create_table_sql_from_dataframe(dataframe: pd.DataFrame, table_name: str) -> str:
+    @classmethod
+    def _access_generate_create_table_sql_from_dataframe(cls, dataframe: pd.DataFrame, table_name: str) -> str:
         """
         Generates the CREATE TABLE sql statement for MS Access from a given DataFrame. This private method is used
         in the export_query_to_access() method, as pandas does not have support for MS Access with the
@@ -241,25 +504,7 @@ class BaseDBPD(object):
         :param table_name: The name of the table that should be created
         :return: str - The formatted CREATE TABLE sql statement
         """
-        columns = dataframe.columns
-        create_table_sql = f'CREATE TABLE {table_name} (\n\t'
-        col_types = []
-        for dtype, col in zip(dataframe.dtypes, columns):
-            dtype_str = str(dtype)
-            if dtype_str.startswith('int'):
-                access_type = 'INTEGER'
-            elif dtype_str.startswith('float'):
-                access_type = 'DOUBLE'
-            elif dtype_str.startswith('date'):
-                access_type = 'DATETIME'
-            elif dtype_str.startswith('bool'):
-                access_type = 'BIT'
-            else:
-                access_type = 'VARCHAR'
-            col_types.append(f'[{col}] {access_type}')
-        create_table_sql += ',\n\t'.join(col_types)
-        create_table_sql += '\n);'
-        return create_table_sql
+        return cls._generate_create_table_sql_from_dataframe(dataframe=dataframe, table_name=table_name, dialect='access')
 
     def _access_columns(self, table_name: str) -> list:
         """
@@ -275,7 +520,52 @@ class BaseDBPD(object):
         cursor.close()
         return columns
 
-    def _access_sqlite_query(self, sql: str, parameters: Optional[Union[dict, list]] = None) -> Optional[pd.DataFrame]:
+    def _access_sqlite_execute(
+            self,
+            sql: str,
+            parameters: Optional[Union[dict, list]] = None,
+            connection: Optional[Union[sqlite3.Connection, 'pyodbc.Connection']] = None
+    ) -> Any:
+        """
+        Executes a sql statement on a new cursor of the sqlite3 or pyodbc connection, passing the parameters
+        in the form that each driver expects. The caller is responsible for closing the returned cursor.
+
+        :param sql: The sql statement to be executed
+        :param parameters: Parameters for a parameterized query
+        :param connection: The connection to execute on, defaults to db_conn
+        :return: The executed cursor
+        """
+        if connection is None:
+            connection = self.db_conn
+        cursor = connection.cursor()
+        try:
+            if parameters is None:
+                cursor.execute(sql)
+            else:
+                if self.database_type == 'sqlite':
+                    if isinstance(parameters, dict):
+                        cursor.execute(sql, list(parameters.values()))
+                    else:
+                        cursor.execute(sql, parameters)
+                else:
+                    if isinstance(parameters, dict):
+                        cursor.execute(sql, *list(parameters.values()))
+                    else:
+                        cursor.execute(sql, *parameters)
+        except Exception as e:
+            cursor.close()
+            raise e
+        return cursor
+
+    def _access_sqlite_query(
+            self,
+            sql: str,
+            parameters: Optional[Union[dict, list]] = None,
+            connection: Optional[Union[sqlite3.Connection, 'pyodbc.Connection']] = None,
+            record: Optional[QueryRecord] = None,
+            compact_dtypes: bool = False,
+            downcast_floats: bool = False
+    ) -> Optional[pd.DataFrame]:
         """
         This private method is used by the main query() method. Because Access and SQLite are not using SQLAlchemy, the
         DataFrames have to be constructed differently, if the sql query returns zero results, either it DOES return zero
@@ -284,39 +574,39 @@ class BaseDBPD(object):
 
         :param sql: The sql statement to be executed
         :param parameters: Parameters for a parameterized query
+        :param connection: The connection to execute on, defaults to db_conn
+        :param record: A QueryRecord in which the execute, fetch and build times are stored
+        :param compact_dtypes: Boolean indicating if the columns should be decoded with compact_dataframe()
+        :param downcast_floats: Boolean indicating if compact_dataframe() should downcast float64 columns to float32
         :return: DataFrame of the query results or None
         """
-        cursor = self.db_conn.cursor()
-        if parameters is None:
-            cursor.execute(sql)
-        else:
-            if self.database_type == 'sqlite':
-                if isinstance(parameters, dict):
-                    cursor.execute(sql, list(parameters.values()))
-                else:
-                    cursor.execute(sql, parameters)
-            else:
-                if isinstance(parameters, dict):
-                    cursor.execute(sql, *list(parameters.values()))
-                else:
-                    cursor.execute(sql, *parameters)
+        start = time.perf_counter()
+        cursor = self._access_sqlite_execute(sql=sql, parameters=parameters, connection=connection)
+        fetched = time.perf_counter()
+        if record is not None:
+            record.execute_seconds += fetched - start
 
         # Modify queries (UPDATE, INSERT, etc) will not have a cursor description, so return None
         if cursor.description is None:
             cursor.close()
             return None
 
-        columns = [i[0] for i in cursor.description]
-        data = cursor.fetchall()
+        description = cursor.description
+        columns = [i[0] for i in description]
+        data = self._fetch_array(cursor=cursor, column_count=len(columns))
         cursor.close()
-        if data:
-            df_data = {}
-            for row in data:
-                for i, column in enumerate(columns):
-                    if column not in df_data:
-                        df_data[column] = []
-                    df_data[column].append(row[i])
-            return pd.DataFrame(data=df_data, columns=columns)
+        built = time.perf_counter()
+        if record is not None:
+            record.fetch_seconds += built - fetched
+        if len(data) > 0:
+            if compact_dtypes:
+                column_types = self._result_column_types(sql=sql, description=description, connection=connection)
+                df = self.compact_dataframe(dataframe=pd.DataFrame(data=data, columns=columns), column_types=column_types, downcast_floats=downcast_floats)
+            else:
+                df = self._array_to_dataframe(data=data, columns=columns)
+            if record is not None:
+                record.build_seconds += time.perf_counter() - built
+            return df
         else:
             return None
 
@@ -340,6 +630,7 @@ class BaseDBPD(object):
         :param filepath: The filepath at which the database should be created
         :return: str - The filepath with forward slashes replaced with backslashes
         """
+        from win32com.client import Dispatch
         try:
             fp = os.path.abspath(filepath).replace('/', '\\')
             access_app = Dispatch("Access.Application")
@@ -361,7 +652,7 @@ class BaseDBPD(object):
 
     @staticmethod
     def _create_access_sqlite_database(
-            connection: Union[pyodbc.connect, sqlite3.connect],
+            connection: Union['pyodbc.Connection', sqlite3.Connection],
             create_table_schema_sql_list: Optional[list] = None
     ) -> None:
         """
@@ -384,9 +675,587 @@ class BaseDBPD(object):
         finally:
             cursor.close()
 
+    def _share_sqlite_connection(self) -> None:
+        """
+        Reopens the sqlite3 connection with check_same_thread=False, so that it can be used by another thread than the one
+        that created it. sqlite3 only allows this when connecting, so it is done on the first use of the async methods
+        (which run the sqlite3 calls in a worker thread) and by SQLiteInMemory.start_snapshots(), rather than for every
+        connection. An in-memory database is copied into the new connection with the backup API.
+
+        Connections opened with check_same_thread=False and the per-thread connections of thread-safe mode are left as is.
+
+        :return: None
+        """
+        if self.database_type != 'sqlite' or self._thread_local is not None or self._connect_kwargs.get('check_same_thread', True) is False:
+            return
+        if self.db_conn.in_transaction:
+            raise RuntimeError(
+                'The SQLite connection is reopened for use by a worker thread and has uncommitted changes, '
+                'call commit() or rollback() before the first async call (or pass check_same_thread=False)'
+            )
+        kwargs = {**self._connect_kwargs, 'check_same_thread': False}
+        connection = sqlite3.connect(database=':memory:' if self.filepath is None else self.filepath, **kwargs)
+        if self.filepath is None:
+            self.db_conn.backup(connection)
+        if self.sqlite_performance_profile is not None:
+            self._sqlite_pragmas(connection=connection, pragmas=self.SQLITE_PERFORMANCE_PROFILES[self.sqlite_performance_profile])
+        previous, self.db_conn = self.db_conn, connection
+        previous.close()
+        self._connect_kwargs = kwargs
+
+    @staticmethod
+    def _sqlite_pragmas(connection: sqlite3.Connection, pragmas: dict) -> dict:
+        """
+        Sets pragmas on a SQLite connection
+
+        :param connection: The sqlite3 connection
+        :param pragmas: The pragma names and their new values
+        :return: dict - The previous value of each pragma, pragmas that do not apply to the connection are skipped
+        """
+        previous = {}
+        cursor = connection.cursor()
+        try:
+            for pragma, value in pragmas.items():
+                row = cursor.execute(f'PRAGMA {pragma}').fetchone()
+                if row is None:  # e.g. mmap_size on in-memory databases
+                    continue
+                previous[pragma] = row[0]
+                cursor.execute(f'PRAGMA {pragma} = {value}')
+        finally:
+            cursor.close()
+        return previous
+
+    def set_sqlite_performance_profile(self, profile: Literal['balanced', 'read_heavy', 'bulk_load']) -> None:
+        """
+        Applies one of the SQLITE_PERFORMANCE_PROFILES to the SQLite connection (this is done on connect when the
+        "performance_profile" argument is given to SQLite or SQLiteInMemory). The journal mode (WAL) is stored in the
+        database file, the other pragmas only apply to this connection. The journal mode and memory-mapped I/O do not
+        apply to in-memory databases.
+
+        :param profile: 'balanced', 'read_heavy' or 'bulk_load'
+        :return: None
+        """
+        if self.database_type != 'sqlite':
+            raise self.DatabaseTypeError(method='set_sqlite_performance_profile', database_type=self.database_type, supported=['sqlite'])
+        if profile not in self.SQLITE_PERFORMANCE_PROFILES:
+            raise ValueError(f'Invalid "profile" argument: "{profile}". Must be one of {list(self.SQLITE_PERFORMANCE_PROFILES)}')
+        self.db_conn.commit()  # the journal mode cannot be changed within a transaction
+        self._sqlite_pragmas(connection=self.db_conn, pragmas=self.SQLITE_PERFORMANCE_PROFILES[profile])
+        self.sqlite_performance_profile = profile
+
+    @contextmanager
+    def sqlite_bulk_load(self) -> Iterator[None]:
+        """
+        A context manager that switches the SQLite connection into a fast, non-durable mode for loading large amounts
+        of data (SQLITE_BULK_LOAD_PRAGMAS: no fsync, in-memory rollback journal, large page cache). On exit the
+        changes are committed (or rolled back if an exception was raised), the previous pragmas are restored and the
+        database file is synced to disk, so that durability only lapses for the duration of the load.
+
+        A database in WAL mode stays in WAL mode. Leaving WAL mode requires that no other connection uses the database.
+
+        Example:
+            with db.sqlite_bulk_load():
+                db.insert_dataframe(table_name='measurements', dataframe=df)
+
+        :return: None
+        """
+        if self.database_type != 'sqlite':
+            raise self.DatabaseTypeError(method='sqlite_bulk_load', database_type=self.database_type, supported=['sqlite'])
+        self.db_conn.commit()
+        pragmas = dict(self.SQLITE_BULK_LOAD_PRAGMAS)
+        cursor = self.db_conn.cursor()
+        wal = cursor.execute('PRAGMA journal_mode').fetchone()[0].lower() == 'wal'
+        cursor.close()
+        if wal:
+            pragmas.pop('journal_mode')
+        previous = self._sqlite_pragmas(connection=self.db_conn, pragmas=pragmas)
+        try:
+            yield
+        except BaseException:
+            self.rollback()
+            raise
+        else:
+            self.commit()
+        finally:
+            self._sqlite_pragmas(connection=self.db_conn, pragmas=previous)
+            if self.filepath is not None:
+                if wal:
+                    self.db_conn.execute('PRAGMA wal_checkpoint(FULL)').close()
+                with open(self.filepath, mode='rb+') as f:
+                    os.fsync(f.fileno())
+
     # Private Utility methods ########################################################################################################################
     @staticmethod
-    def _filter_callable_kwargs(func: callable, passed_kwargs: dict) -> dict:
+    def _array_to_dataframe(data: np.ndarray, columns: list) -> pd.DataFrame:
+        """
+        Builds a DataFrame from a 2-dimensional object array of fetched rows. The array is handed to pandas in one step,
+        infer_objects() then gives each column the same dtype that pandas would have inferred from a list of that
+        column's values.
+
+        :param data: An object array of shape (rows, columns)
+        :param columns: The column names
+        :return: DataFrame
+        """
+        return pd.DataFrame(data=data, columns=columns).infer_objects()
+
+    @staticmethod
+    def _arrow_table(
+            df: pd.DataFrame,
+            schema: Optional['pa.Schema'] = None,
+            description: Optional[tuple] = None,
+            column_types: Optional[dict] = None
+    ) -> 'pa.Table':
+        """
+        Converts a chunk of query results to an Arrow table for the Parquet and Feather exports. The schema is derived
+        from the first chunk: columns the DBAPI cursor.description reports a Python type for (pyodbc) get the matching
+        Arrow type, all-NULL columns get the type of their kind in "column_types" (int64, float64, bool or string, strings
+        if the kind is unknown), otherwise the type is inferred from the values. Later chunks are cast to that schema so
+        that every row group / record batch of a file has the same schema.
+
+        :param df: The chunk of query results
+        :param schema: The schema of the file, None for the first chunk
+        :param description: The cursor.description of the query, used for the first chunk
+        :param column_types: The lower-cased column names and their kind (see _result_column_types()), used for the first chunk
+        :return: pyarrow.Table
+        """
+        import pyarrow as pa
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # SQLite columns are dynamically typed, mixed-type columns are written as strings
+            df = df.copy()
+            for column in df.columns[df.dtypes == object]:
+                df[column] = df[column].map(lambda value: value if value is None else str(value))
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        if schema is None:
+            python_types = {
+                int: pa.int64(), float: pa.float64(), str: pa.string(), bool: pa.bool_(), bytes: pa.binary(),
+                bytearray: pa.binary(), datetime.datetime: pa.timestamp('us'), datetime.date: pa.date32()
+            }
+            kinds = {'boolean': pa.bool_(), 'integer': pa.int64(), 'float': pa.float64(), 'number': pa.float64(), 'string': pa.string()}
+            if column_types is None:
+                column_types = {}
+            if description is None or len(description) != table.num_columns:
+                description = [(None, None)] * table.num_columns
+            fields = []
+            for field, column_description in zip(table.schema, description):
+                type_code = column_description[1]
+                if isinstance(type_code, type) and type_code in python_types:
+                    field = field.with_type(python_types[type_code])
+                elif pa.types.is_null(field.type):
+                    field = field.with_type(kinds.get(column_types.get(field.name.lower()), pa.string()))
+                fields.append(field)
+            schema = pa.schema(fields)
+        try:
+            return table.cast(schema)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+            raise ValueError(
+                f'A chunk of the query results does not match the schema of the first chunk ({e}). SQLite columns are '
+                f'dynamically typed, use CAST() in the sql statement to give each column a single type'
+            ) from e
+
+    @staticmethod
+    def _batched(iterable: Iterable, batch_size: int) -> Iterator[list]:
+        """
+        Splits an iterable into lists of at most "batch_size" items
+
+        :param iterable: The iterable to be split
+        :param batch_size: The maximum number of items in each list
+        :return: Iterator of lists
+        """
+        iterator = iter(iterable)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def _before_execute(self, sql: str) -> None:
+        """
+        Called before a user defined sql statement is executed (by query(), query_iter(), query_many(), aquery() and the
+        batched inserts), clears the schema cache for DDL statements and invalidates cached results for write statements.
+
+        :param sql: The sql statement about to be executed
+        :return: None
+        """
+        if self.DDL_PATTERN.match(sql):
+            self.invalidate_schema_cache()
+        if self.result_cache is not None and self.result_cache.is_write(sql):
+            self.result_cache.invalidate(sql)
+
+    @staticmethod
+    def _column_kind(type_code: Any, dbapi: Any = None) -> Optional[str]:
+        """
+        Maps the type of a result column to the kind of values that compact_dataframe() decodes it to. The type can be
+        a declared column type (e.g. 'INTEGER', 'VARCHAR(20)' or 'TIMESTAMP', matched like SQLite's type affinity rules),
+        a Python type (the pyodbc cursor.description type code) or a DBAPI type code that is compared to the DBAPI
+        module's NUMBER, DATETIME and STRING type objects.
+
+        :param type_code: The declared type, Python type or DBAPI type code
+        :param dbapi: The DBAPI module of the driver, only needed for DBAPI type codes
+        :return: str - 'boolean', 'integer', 'float', 'number', 'datetime' or 'string', or None if the type is unknown
+        """
+        if type_code is None:
+            return None
+        if isinstance(type_code, str):
+            declared = type_code.upper()
+            if 'BOOL' in declared or declared in ['BIT', 'YESNO']:
+                return 'boolean'
+            if 'INT' in declared:
+                return 'integer'
+            if 'DATE' in declared or 'TIMESTAMP' in declared:
+                return 'datetime'
+            if any(i in declared for i in ['CHAR', 'CLOB', 'TEXT', 'STRING']):
+                return 'string'
+            if any(i in declared for i in ['REAL', 'FLOA', 'DOUB']):
+                return 'float'
+            if any(i in declared for i in ['NUMERIC', 'DECIMAL', 'NUMBER']):
+                return 'number'
+            return None
+        if isinstance(type_code, type):
+            if issubclass(type_code, bool):
+                return 'boolean'
+            if issubclass(type_code, int):
+                return 'integer'
+            if issubclass(type_code, float):
+                return 'float'
+            if issubclass(type_code, (datetime.date, datetime.datetime)):
+                return 'datetime'
+            if issubclass(type_code, str):
+                return 'string'
+            return 'number' if type_code.__name__ == 'Decimal' else None
+        for kind, type_object in [('datetime', 'DATETIME'), ('number', 'NUMBER'), ('string', 'STRING')]:
+            try:
+                if hasattr(dbapi, type_object) and type_code == getattr(dbapi, type_object):
+                    return kind
+            except Exception:
+                continue
+        return None
+
+    def _connect_thread(self) -> Union[sqlite3.Connection, 'pyodbc.Connection']:
+        """
+        Opens a new connection to the database file for the current thread (thread-safe mode), using the same connection
+        keyword arguments and SQLite performance profile as the manager's first connection
+
+        :return: sqlite3.Connection or pyodbc.Connection
+        """
+        if self.database_type == 'access':
+            import pyodbc
+            connection = pyodbc.connect(self.access_driver(filepath=self.filepath), **self._connect_kwargs)
+        else:
+            connection = sqlite3.connect(database=self.filepath, **self._connect_kwargs)
+            if self.sqlite_performance_profile is not None:
+                self._sqlite_pragmas(connection=connection, pragmas=self.SQLITE_PERFORMANCE_PROFILES[self.sqlite_performance_profile])
+        self._thread_local.connection = connection
+        with self._thread_lock:
+            self._thread_connections.append(connection)
+        return connection
+
+    def _dialect_name(self) -> str:
+        """
+        Returns the name of the sql dialect of this manager: 'access' or 'sqlite' for the file/in-memory databases,
+        otherwise the dialect name of the SQLAlchemy engine ('postgresql', 'mysql', 'oracle', 'sqlite', etc.)
+
+        :return: str - The dialect name
+        """
+        if self.engine is not None:
+            return self.engine.dialect.name
+        return self.database_type
+
+    def _driver_name(self) -> str:
+        """
+        Returns the name of the driver used by db_conn: 'sqlite3', 'pyodbc' or 'sqlalchemy'
+
+        :return: str
+        """
+        if self.engine is not None:
+            return 'sqlalchemy'
+        return 'pyodbc' if self.database_type == 'access' else 'sqlite3'
+
+    def _executemany_insert(
+            self,
+            table_name: str,
+            columns: list,
+            records: Iterable[tuple],
+            batch_size: int = 10000,
+            fast_executemany: bool = False
+    ) -> int:
+        """
+        Used by insert_many() and insert_dataframe() to insert records in batches with a single prepared statement. Access
+        and SQLite use the cursor's executemany(), SQLAlchemy connections execute an insert() construct with a list of
+        parameter sets so that the dialect can use its "insertmanyvalues" or executemany() batching.
+
+        :param table_name: The name of the table to insert values
+        :param columns: The (already filtered) column names
+        :param records: Tuples of values, in the same order as columns
+        :param batch_size: The number of records sent to the database per executemany() call
+        :param fast_executemany: Sets pyodbc's fast_executemany on the cursor (ignored for other drivers)
+        :return: int - The number of records inserted
+        """
+        if batch_size < 1:
+            raise ValueError(f'"batch_size" must be a positive integer, got {batch_size}')
+        inserted = 0
+        if self.database_type in ['access', 'sqlite']:
+            if self.database_type == 'access':
+                columns = [f'[{column}]' for column in columns]
+            sql = f"""INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join(['?' for _ in columns])})"""
+            self.recent_query = sql
+            self._before_execute(sql)
+            record = self._start_query_record(sql=sql, method='insert_many')
+            cursor = self.db_conn.cursor()
+            if self.database_type == 'access':
+                cursor.fast_executemany = fast_executemany
+            try:
+                for batch in self._batched(records, batch_size):
+                    cursor.executemany(sql, batch)
+                    inserted += len(batch)
+            except Exception as e:
+                self._finish_query_record(record=record, error=e)
+                raise e
+            finally:
+                cursor.close()
+        else:
+            import sqlalchemy
+            statement = sqlalchemy.insert(self._sqlalchemy_table(table_name=table_name, columns=columns))
+            self.recent_query = str(statement)
+            self._before_execute(self.recent_query)
+            record = self._start_query_record(sql=self.recent_query, method='insert_many')
+            try:
+                for batch in self._batched(records, batch_size):
+                    self.db_conn.execute(statement, [dict(zip(columns, row)) for row in batch])
+                    inserted += len(batch)
+            except Exception as e:
+                self._finish_query_record(record=record, error=e)
+                raise e
+        if record is not None:
+            record.rows = inserted
+            self._finish_query_record(record=record)
+        self._transaction_write(rows=inserted)
+        return inserted
+
+    @classmethod
+    def _generate_create_table_sql_from_dataframe(cls, dataframe: pd.DataFrame, table_name: str, dialect: str) -> str:
+        """
+        Generates the CREATE TABLE sql statement for a given database dialect from a DataFrame's dtypes, using the
+        CREATE_TABLE_TYPES mapping (dialects without an entry use the 'default' types). MS Access column names are
+        wrapped in brackets, for other dialects the column names are lower-cased and only quoted if they are not
+        plain identifiers, so that they match the unquoted names used by insert_values() and insert_dataframe().
+
+        :param dataframe: The dataframe which will represent the table schema
+        :param table_name: The name of the table that should be created
+        :param dialect: The dialect name, see _dialect_name()
+        :return: str - The formatted CREATE TABLE sql statement
+        """
+        types = cls.CREATE_TABLE_TYPES.get(dialect, cls.CREATE_TABLE_TYPES['default'])
+        col_types = []
+        for col, dtype in zip(dataframe.columns, dataframe.dtypes):
+            if pd.api.types.is_bool_dtype(dtype):
+                col_type = types['bool']
+            elif pd.api.types.is_integer_dtype(dtype):
+                col_type = types['int']
+            elif pd.api.types.is_float_dtype(dtype):
+                col_type = types['float']
+            elif pd.api.types.is_datetime64_any_dtype(dtype):
+                col_type = types['date']
+            else:
+                col_type = types['other']
+
+            if dialect == 'access':
+                col = f'[{col}]'
+            else:
+                col = str(col).lower()
+                if not re.match(r'^[a-z_][a-z0-9_]*$', col):
+                    quote = '`' if dialect == 'mysql' else '"'
+                    col = f'{quote}{col}{quote}'
+            col_types.append(f'{col} {col_type}')
+        create_table_sql = f'CREATE TABLE {table_name} (\n\t'
+        create_table_sql += ',\n\t'.join(col_types)
+        create_table_sql += '\n);'
+        return create_table_sql
+
+    @classmethod
+    def _fetch_array(cls, cursor: Any, column_count: int, size: Optional[int] = None) -> np.ndarray:
+        """
+        Fetches the remaining rows of a cursor in batches of "size" using fetchmany() and copies each batch into a
+        2-dimensional object array. Only one batch of row tuples is held in memory at a time, the batches are then joined
+        into a single (rows x columns) array that can be handed to pandas in one step.
+
+        :param cursor: An executed cursor (sqlite3 or pyodbc) that returns rows
+        :param column_count: The number of columns in the cursor's description
+        :param size: The number of rows to fetch per batch, defaults to FETCHMANY_SIZE
+        :return: np.ndarray - An object array of shape (rows, column_count)
+        """
+        if size is None:
+            size = cls.FETCHMANY_SIZE
+        chunks = []
+        while True:
+            rows = cursor.fetchmany(size)
+            if not rows:
+                break
+            chunks.append(cls._rows_to_array(rows=rows, column_count=column_count))
+        if not chunks:
+            return np.empty((0, column_count), dtype=object)
+        elif len(chunks) == 1:
+            return chunks[0]
+        return np.concatenate(chunks)
+
+    def _finish_query_record(self, record: Optional[QueryRecord], error: Optional[BaseException] = None) -> None:
+        """
+        Completes a QueryRecord created by _start_query_record(), adds it to the query stats and calls the post-execute hooks
+
+        :param record: The QueryRecord (nothing is done if this is None)
+        :param error: The exception raised by the statement, if any
+        :return: None
+        """
+        if record is None:
+            return
+        record.finish(error=error)
+        if self.query_stats is not None:
+            self.query_stats.add(record)
+        for hook in self._post_execute_hooks:
+            hook(record)
+
+    def _export_query_stream(
+            self,
+            out_filepath: str,
+            in_sql: str,
+            in_parameters: Optional[Union[dict, list]],
+            chunksize: int,
+            file_format: Literal['csv', 'feather', 'parquet'],
+            compression: Optional[str],
+            **to_csv_kwargs
+    ) -> int:
+        """
+        Streams the results of a query into a CSV, Feather or Parquet file one chunk at a time, used by the
+        export_query_to_csv(), export_query_to_feather() and export_query_to_parquet() methods. The file is only
+        created once the first chunk has been fetched, and is removed again if the export fails.
+
+        :param out_filepath: The filepath of the new file to be created
+        :param in_sql: The sql statement to be executed
+        :param in_parameters: The parameters associated with a parameterized query
+        :param chunksize: The number of rows fetched and written at a time
+        :param file_format: 'csv', 'feather' or 'parquet'
+        :param compression: The compression of the file
+        :param to_csv_kwargs: Keyword arguments for DataFrame.to_csv()
+        :return: int - The number of rows exported
+        """
+        fp = os.path.abspath(out_filepath).replace('\\', '/')
+        file_already_existed = os.path.isfile(fp)
+        writer = None
+        schema = None
+        rows = 0
+        try:
+            for df in self.query_iter(sql=in_sql, parameters=in_parameters, chunksize=chunksize):
+                if file_format == 'csv':
+                    df.to_csv(fp, mode='w' if writer is None else 'a', header=writer is None, index=False, compression=compression, **to_csv_kwargs)
+                    writer = fp
+                elif writer is not None:
+                    writer.write_table(self._arrow_table(df=df, schema=schema))
+                else:
+                    # the declared types give all-NULL columns of the first chunk the type of the values of later chunks
+                    column_types = self._result_column_types(sql=in_sql, description=self.recent_description)
+                    table = self._arrow_table(df=df, description=self.recent_description, column_types=column_types)
+                    schema = table.schema
+                    if file_format == 'parquet':
+                        import pyarrow.parquet as pq
+                        writer = pq.ParquetWriter(fp, schema=schema, compression=compression or 'none')
+                    else:
+                        import pyarrow as pa
+                        writer = pa.ipc.new_file(fp, schema=schema, options=pa.ipc.IpcWriteOptions(compression=compression))
+                    writer.write_table(table)
+                rows += len(df)
+            if writer is not None and file_format != 'csv':
+                writer.close()
+        except Exception as e:
+            if writer is not None and file_format != 'csv':
+                try:
+                    writer.close()
+                except Exception:
+                    pass
+            if not file_already_existed and os.path.isfile(fp):
+                os.remove(fp)
+            raise e
+        if rows == 0:
+            self._warn(f'Nothing to export, {file_format} file will not be created')
+        return rows
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _fernet(fernet_encryption_key: Union[bytes, tuple]) -> Union['Fernet', 'MultiFernet']:
+        """
+        Returns a Fernet instance for an encryption key, or a MultiFernet for a tuple of keys (the first key encrypts,
+        every key is tried to decrypt, so that keys can be rotated). Instances are cached per key, so that the key is
+        only parsed once rather than for every value.
+
+        :param fernet_encryption_key: The encryption key or a tuple of keys
+        :return: Fernet or MultiFernet
+        """
+        from cryptography.fernet import Fernet, MultiFernet
+        if isinstance(fernet_encryption_key, tuple):
+            return MultiFernet([Fernet(key) for key in fernet_encryption_key])
+        return Fernet(fernet_encryption_key)
+
+    def _fernet_column(
+            self,
+            dataframe: pd.DataFrame,
+            column: str,
+            decrypt: bool,
+            encoding: str = 'utf-8',
+            ttl: Optional[int] = None,
+            workers: Optional[int] = None,
+            chunksize: int = 10000,
+            executor: Literal['thread', 'process'] = 'thread'
+    ) -> pd.DataFrame:
+        """
+        Used by encrypt_column() and decrypt_column() to encrypt or decrypt the non-NULL values of a column in chunks of
+        "chunksize" values. Chunks are processed in a thread or process pool of "workers" workers if there is more than
+        one chunk, otherwise in the calling thread. The values per second are stored in the "recent_column_crypto" attribute.
+
+        :return: DataFrame - A copy of the DataFrame with the encrypted or decrypted column
+        """
+        key = self.fernet_encryption_key
+        if key is None:
+            raise self.EncryptionKeyError()
+        if isinstance(key, list):
+            key = tuple(key)
+        if chunksize < 1:
+            raise ValueError(f'"chunksize" must be a positive integer, got {chunksize}')
+        if executor not in ['thread', 'process']:
+            raise ValueError(f'Invalid "executor" argument: "{executor}". Must be "thread" or "process"')
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        start = time.perf_counter()
+        series = dataframe[column]
+        valid = series.notna().to_numpy()
+        values = series.to_numpy(dtype=object)[valid].tolist()
+        chunks = [values[i:i + chunksize] for i in range(0, len(values), chunksize)]
+        run = partial(_fernet_values, key, decrypt=decrypt, encoding=encoding, ttl=ttl)
+        if workers > 1 and len(chunks) > 1:
+            pool = ProcessPoolExecutor if executor == 'process' else ThreadPoolExecutor
+            with pool(max_workers=min(workers, len(chunks))) as pool_executor:
+                results = list(pool_executor.map(run, chunks))
+        else:
+            results = [run(chunk) for chunk in chunks]
+
+        data = np.full(len(series), None, dtype=object)
+        data[valid] = list(chain.from_iterable(results)) if results else []
+        df = dataframe.copy(deep=False)
+        df[column] = pd.Series(data, index=series.index, dtype=str if decrypt and valid.all() else object)
+        seconds = time.perf_counter() - start
+        self.recent_column_crypto = {
+            'operation': 'decrypt' if decrypt else 'encrypt',
+            'column': column,
+            'values': len(values),
+            'seconds': seconds,
+            'values_per_second': len(values) / seconds if seconds > 0 else float('inf'),
+            'workers': min(workers, len(chunks)) if workers > 1 and len(chunks) > 1 else 1,
+            'executor': executor if workers > 1 and len(chunks) > 1 else None
+        }
+        return df
+
+    @classmethod
+    def _filter_callable_kwargs(cls, func: callable, passed_kwargs: dict) -> dict:
         """
         Filters the keyword arguments, getting only the key-value pairs that can
         actually be passed to a particular function/method ("func")
@@ -395,7 +1264,19 @@ class BaseDBPD(object):
         :param passed_kwargs: The keyword arguments trying to be passed to the function/method
         :return: dict - The filtered keyword arguments
         """
-        return {k: v for k, v in passed_kwargs.items() if k in inspect.getfullargspec(func).args}
+        try:
+            spec = inspect.getfullargspec(func)
+            if spec.varkw is not None:
+                # e.g. sqlalchemy.create_engine(url, **kwargs), which validates the kwargs (pool_size, etc.) itself
+                return dict(passed_kwargs)
+            allowed = spec.args + spec.kwonlyargs
+        except TypeError:
+            # Built-in functions such as sqlite3.connect() and pyodbc.connect() do not always expose a signature
+            if func is sqlite3.connect:
+                allowed = cls.SQLITE_CONNECT_ARGS
+            else:
+                return dict(passed_kwargs)
+        return {k: v for k, v in passed_kwargs.items() if k in allowed}
 
     def _info_query_list(
             self,
@@ -404,26 +1285,40 @@ class BaseDBPD(object):
             show_names: bool = False
     ) -> list:
         """
-        Used by the table_names() and column_names() public methods to abstract getting this info for various database types
+        Used by the table_names() and column_names() public methods to abstract getting this info for various database types.
+        Results are served from the schema cache while they are younger than "schema_cache_ttl" seconds.
 
         :param info_type: Either 'tables' or 'columns'
         :param table_name: If getting the column names, the name of the table needs to be passed
         :param show_names: Boolean indicating if the table or column names should be printed to the console
         :return: list - Either an empty list or a list of the table or column names
         """
+        cache_key = ('tables',) if info_type == 'tables' else ('columns', str(table_name).lower())
+        info = self._schema_cache_get(cache_key=cache_key)
+        if info is None:
+            info = self._info_query_list_uncached(info_type=info_type, table_name=table_name)
+            self._schema_cache_set(cache_key=cache_key, info=info)
+
+        if show_names and info:
+            new_lines = '\n'.join(info)
+            print(f'{new_lines}\n')
+        return info
+
+    def _info_query_list_uncached(self, info_type: Literal['tables', 'columns'] = 'tables', table_name: Optional[str] = None) -> list:
+        """
+        Queries the database catalog for the table names or the column names of a table, used by _info_query_list()
+
+        :param info_type: Either 'tables' or 'columns'
+        :param table_name: If getting the column names, the name of the table needs to be passed
+        :return: list - Either an empty list or a list of the lower-cased table or column names
+        """
         if info_type == 'tables':
             if self.database_type == 'access':
                 info = self._access_tables()
                 if not info:
                     info = None
             else:
-                if self.postgres_schema is not None:
-                    sql = self.TABLE_NAME_QUERIES[self.database_type].format(schema=self.postgres_schema)
-                elif self.mysql_database_name is not None:
-                    sql = self.TABLE_NAME_QUERIES[self.database_type].format(database_name=self.mysql_database_name)
-                else:
-                    sql = self.TABLE_NAME_QUERIES[self.database_type]
-                info = self.query(sql=sql, show_head=False, warn_is_none=False)
+                info = self.query(sql=self._info_query_sql(info_type=info_type), show_head=False, warn_is_none=False)
                 if info is not None:
                     info = info['name'].tolist()
         else:
@@ -432,51 +1327,589 @@ class BaseDBPD(object):
                 if not info:
                     info = None
             else:
-                sql = self.COLUMN_NAME_QUERIES[self.database_type].format(table_name=table_name)
-                info = self.query(sql=sql, show_head=False, warn_is_none=False)
+                info = self.query(sql=self._info_query_sql(info_type=info_type, table_name=table_name), show_head=False, warn_is_none=False)
                 if info is not None:
                     info = info['name'].tolist()
 
         if info is not None:
-            info = [i.lower() for i in info]
-            if show_names:
-                new_lines = '\n'.join(info)
-                print(f'{new_lines}\n')
-            return info
+            return [i.lower() for i in info]
         else:
             return []
 
-    @staticmethod
-    def _warn(text: str) -> None:
-        """
-        Prints a yellow-colored warning to the console
-
-        :param text: The warning message
-        :return: None
+    def _info_query_sql(self, info_type: Literal['tables', 'columns'] = 'tables', table_name: Optional[str] = None) -> str:
         """
-        print(f'\033[0;33;49mWARNING: {text} \033[0m' + '\n')
+        Formats the catalog query for the table names or the column names of a table (not used for MS Access). Managers
+        without one of the database types of the catalog queries, such as a SQLAlchemy engine connected to SQLite, use
+        the queries of their dialect.
 
-    # Public Utility methods #########################################################################################################################
-    @classmethod
-    def access_driver(cls, filepath: str) -> str:
+        :param info_type: Either 'tables' or 'columns'
+        :param table_name: If getting the column names, the name of the table needs to be passed
+        :return: str - The sql statement
         """
-        Creates the MS Access Driver string that can be used by pyodbc.connect()
+        database_type = self.database_type if self.database_type in self.TABLE_NAME_QUERIES else self._dialect_name()
+        if info_type == 'tables':
+            if self.postgres_schema is not None:
+                return self.TABLE_NAME_QUERIES[database_type].format(schema=self.postgres_schema)
+            elif self.mysql_database_name is not None:
+                return self.TABLE_NAME_QUERIES[database_type].format(database_name=self.mysql_database_name)
+            else:
+                return self.TABLE_NAME_QUERIES[database_type]
+        else:
+            return self.COLUMN_NAME_QUERIES[database_type].format(table_name=table_name)
 
-        :param filepath: The filepath of the Access database
-        :return: str - The filepath with backward slashes replaced with forward slashes
+    def _insert_values_sql(self, table_name: str, allowable_columns: list, column_value_pairs: dict) -> tuple:
         """
-        if not filepath.endswith('.accdb') and not filepath.endswith('mdb'):
-            raise cls.AccessFileError(filepath=filepath)
-        fp = os.path.abspath(filepath).replace('\\', '/')
-        return f'DRIVER={{Microsoft Access Driver (*.mdb, *.accdb)}};DBQ={fp};'
+        Builds the INSERT statement for insert_values() and ainsert_values()
 
-    @classmethod
-    def convert_numpy_value(cls, value: Any, column: Optional[str] = None, null_zeroes_for_columns: Optional[list] = None) -> Any:
+        :param table_name: The name of the table to insert values
+        :param allowable_columns: The column names of the table
+        :param column_value_pairs: The column names and their respective values
+        :return: tuple - The sql statement and the filtered column_value_pairs to be used as its parameters
         """
-        Possibly converts a numpy value (typically this value comes from a DataFrame) to its respective Python value
+        column_value_pairs = {column.lower(): value for column, value in column_value_pairs.items() if column.lower() in allowable_columns}
+        columns = list(column_value_pairs.keys())
+        if self.database_type in ['access', 'sqlite']:
+            values = ['?' for _ in columns]
+        else:
+            values = [f':{column}' for column in columns]
+        sql = f"""INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join(values)})"""
+        return sql, column_value_pairs
 
-        :param value: The value to be possibly be converted
-        :param column: The column name of the DataFrame in which the value resides - This is only used for nulling zero values
+    def _result_column_types(
+            self,
+            sql: str,
+            description: Optional[tuple],
+            connection: Optional[sqlite3.Connection] = None
+    ) -> dict:
+        """
+        Determines the kind of values of each result column (see _column_kind()) for compact_dataframe() and the Parquet
+        and Feather exports. sqlite3 reports no types in cursor.description, so for SQLite (also through SQLAlchemy) the
+        declared types of the columns of the tables named in the statement are read with PRAGMA table_info (and kept in
+        the schema cache), result columns are matched to them by name. pyodbc reports a Python type per column and other
+        SQLAlchemy connections report the driver's DBAPI type codes.
+
+        :param sql: The sql statement of the results
+        :param description: The DBAPI cursor.description of the results
+        :param connection: The sqlite3 connection to read the declared types with, defaults to db_conn
+        :return: dict - The lower-cased column names and their kind, columns of an unknown kind are left out
+        """
+        if description is None:
+            return {}
+        column_types = {}
+        if self._dialect_name() == 'sqlite':
+            if connection is None:
+                connection = self.db_conn if self.engine is None else self.db_conn.connection().connection
+            declared = {}
+            for table_name in ResultCache.tables(sql):
+                cache_key = ('column_types', table_name)
+                info = self._schema_cache_get(cache_key=cache_key)
+                if info is None:
+                    schema, _, name = table_name.rpartition('.')
+                    cursor = connection.cursor()
+                    try:
+                        info = [(row[1].lower(), row[2]) for row in cursor.execute(f'PRAGMA {schema + "." if schema else ""}table_info("{name}")')]
+                    except sqlite3.Error:
+                        info = []
+                    finally:
+                        cursor.close()
+                    self._schema_cache_set(cache_key=cache_key, info=info)
+                for column, type_name in info:
+                    kind = self._column_kind(type_code=type_name)
+                    # columns of the same name with different kinds in joined tables cannot be matched
+                    declared[column] = kind if declared.get(column, kind) == kind else None
+            for column in description:
+                kind = declared.get(column[0].lower())
+                if kind is not None:
+                    column_types[column[0].lower()] = kind
+        else:
+            dbapi = None if self.engine is None else getattr(self.engine.dialect, 'loaded_dbapi', None)
+            for column in description:
+                kind = self._column_kind(type_code=column[1], dbapi=dbapi)
+                if kind is not None:
+                    column_types[column[0].lower()] = kind
+        return column_types
+
+    @staticmethod
+    def _rows_to_array(rows: list, column_count: int) -> np.ndarray:
+        """
+        Copies a batch of row tuples (or pyodbc.Row objects) into a 2-dimensional object array
+
+        :param rows: The rows returned by fetchmany() or fetchall()
+        :param column_count: The number of columns in each row
+        :return: np.ndarray - An object array of shape (len(rows), column_count)
+        """
+        array = np.empty((len(rows), column_count), dtype=object)
+        array[:] = rows
+        return array
+
+    def _sqlalchemy_query(
+            self,
+            sql: str,
+            parameters: Optional[Union[dict, list]] = None,
+            connection: Optional[Union['sqlalchemy.Connection', 'Session']] = None,
+            record: Optional[QueryRecord] = None,
+            compact_dtypes: bool = False,
+            downcast_floats: bool = False
+    ) -> Optional[pd.DataFrame]:
+        """
+        This private method is used by the main query() method for databases connected through SQLAlchemy.
+
+        :param sql: The sql statement to be executed
+        :param parameters: Parameters for a parameterized query
+        :param connection: The SQLAlchemy Connection or Session to execute on, defaults to db_conn
+        :param record: A QueryRecord in which the execute, fetch and build times are stored
+        :param compact_dtypes: Boolean indicating if the columns should be decoded with compact_dataframe()
+        :param downcast_floats: Boolean indicating if compact_dataframe() should downcast float64 columns to float32
+        :return: DataFrame of the query results or None
+        """
+        if connection is None:
+            connection = self.db_conn
+        start = time.perf_counter()
+        if parameters is not None:
+            executed = connection.execute(self._text(sql), parameters)
+        else:
+            executed = connection.execute(self._text(sql))
+        fetched = time.perf_counter()
+        if record is not None:
+            record.execute_seconds += fetched - start
+        if executed.returns_rows:
+            # the cursor is closed once all rows are fetched, its description is read first
+            description = getattr(executed.cursor, 'description', None)
+            data = executed.fetchall()
+            built = time.perf_counter()
+            if record is not None:
+                record.fetch_seconds += built - fetched
+            columns = list(executed.keys())
+            try:
+                if compact_dtypes and data:
+                    df = self.compact_dataframe(
+                        dataframe=pd.DataFrame(data=self._rows_to_array(rows=data, column_count=len(columns)), columns=columns),
+                        column_types=self._result_column_types(sql=sql, description=description),
+                        downcast_floats=downcast_floats
+                    )
+                else:
+                    df = pd.DataFrame(data=data, columns=columns)
+            except ValueError:
+                return None
+            if record is not None:
+                record.build_seconds += time.perf_counter() - built
+            return df
+        return None
+
+    @staticmethod
+    def _sqlalchemy_table(table_name: str, columns: list) -> 'sqlalchemy.TableClause':
+        """
+        Returns a lightweight SQLAlchemy table construct (without any reflection) for building insert and upsert
+        statements, a "schema.table" name is split into its schema and table
+
+        :param table_name: The name of the table, optionally prefixed with its schema
+        :param columns: The column names
+        :return: TableClause
+        """
+        if '.' in table_name:
+            schema, name = table_name.split('.', 1)
+        else:
+            schema, name = None, table_name
+        import sqlalchemy
+        return sqlalchemy.table(name, *[sqlalchemy.column(column) for column in columns], schema=schema)
+
+    def _scoped_session(self) -> 'Session':
+        """
+        Creates a scoped_session on the engine for thread-safe mode, every Session it creates is kept so that close()
+        can commit and close the Sessions of all threads
+
+        :return: scoped_session
+        """
+        from sqlalchemy.orm import scoped_session, sessionmaker
+        factory = sessionmaker(bind=self.engine)
+        self._thread_connections = []
+
+        def _new_session() -> 'Session':
+            session = factory()
+            with self._thread_lock:
+                self._thread_connections.append(session)
+            return session
+
+        return scoped_session(_new_session)
+
+    def _schema_cache_get(self, cache_key: tuple) -> Optional[list]:
+        """
+        Returns the cached table names, column names or declared column types for a cache key, or None if they are not cached or have expired
+
+        :param cache_key: ('tables',), ('columns', <lower-cased table name>) or ('column_types', <lower-cased table name>)
+        :return: list or None
+        """
+        with self._schema_cache_lock:
+            cached = self._schema_cache.get(cache_key)
+            if cached is not None and (self.schema_cache_ttl is None or time.monotonic() - cached[0] < self.schema_cache_ttl):
+                self.schema_cache_hits += 1
+                return list(cached[1])
+            self.schema_cache_misses += 1
+            return None
+
+    def _schema_cache_set(self, cache_key: tuple, info: list) -> None:
+        """
+        Stores table names, column names or declared column types in the schema cache, unless the cache is disabled (schema_cache_ttl of 0)
+
+        :param cache_key: ('tables',), ('columns', <lower-cased table name>) or ('column_types', <lower-cased table name>)
+        :param info: The table names, column names or (column name, declared type) tuples
+        :return: None
+        """
+        if self.schema_cache_ttl is None or self.schema_cache_ttl > 0:
+            with self._schema_cache_lock:
+                self._schema_cache[cache_key] = (time.monotonic(), tuple(info))
+
+    def _start_query_record(self, sql: str, parameters: Optional[Union[dict, list]] = None, method: str = 'query') -> Optional[QueryRecord]:
+        """
+        Creates a QueryRecord and calls the pre-execute hooks, only when hooks or query stats are in use
+        (so that there is no overhead otherwise)
+
+        :param sql: The sql statement about to be executed
+        :param parameters: The parameters associated with a parameterized query
+        :param method: The name of the method executing the statement
+        :return: QueryRecord or None
+        """
+        if self.query_stats is None and not self._pre_execute_hooks and not self._post_execute_hooks:
+            return None
+        deep_memory = self.query_stats is not None and self.query_stats.deep_memory
+        record = QueryRecord(sql=sql, parameters=parameters, method=method, driver=self._driver_name(), deep_memory=deep_memory)
+        for hook in self._pre_execute_hooks:
+            hook(record)
+        return record
+
+    def _table_exists(self, table_name: str) -> bool:
+        """
+        Checks if a table is in table_names(). Names are compared case-insensitively without quotes, and a schema-qualified
+        name matches an unqualified one by its table name, as table_names() returns "schema.table" for Postgres.
+
+        :param table_name: The name of the table, optionally qualified with its schema
+        :return: bool
+        """
+        def _parts(name: str) -> list:
+            return [part.strip('"`[] ') for part in str(name).lower().split('.')]
+
+        name = _parts(table_name)
+        for existing in self.table_names(show_names=False):
+            existing = _parts(existing)
+            if existing == name or ((len(existing) == 1) != (len(name) == 1) and existing[-1] == name[-1]):
+                return True
+        return False
+
+    def _text(self, sql: str) -> 'TextClause':
+        """
+        Returns the SQLAlchemy text() construct of a sql statement from a least-recently-used cache of at most
+        STATEMENT_CACHE_SIZE statements. Building a text() construct parses the statement for its bind parameters,
+        reusing it skips this for statements that run repeatedly; the compiled form is then found in the engine's
+        compiled cache (see the "query_cache_size" argument of sqlalchemy.create_engine()).
+
+        :param sql: The sql statement
+        :return: TextClause
+        """
+        with self._statement_cache_lock:
+            clause = self._statement_cache.get(sql)
+            if clause is not None:
+                self._statement_cache.move_to_end(sql)
+                self.statement_cache_hits += 1
+                return clause
+        from sqlalchemy import text
+        clause = text(sql)
+        with self._statement_cache_lock:
+            self.statement_cache_misses += 1
+            self._statement_cache[sql] = clause
+            while len(self._statement_cache) > self.STATEMENT_CACHE_SIZE:
+                self._statement_cache.popitem(last=False)
+        return clause
+
+    @staticmethod
+    def _sync_watermark_from_text(text: str, watermark_type: str) -> Any:
+        """
+        Restores a high-water mark stored by sync_table() to a value that can be compared against the watermark column
+
+        :param text: The stored text of the watermark
+        :param watermark_type: The stored type of the watermark, see _sync_watermark_to_text()
+        :return: The watermark
+        """
+        if watermark_type == 'datetime':
+            return datetime.datetime.fromisoformat(text)
+        elif watermark_type == 'date':
+            return datetime.date.fromisoformat(text)
+        elif watermark_type == 'int':
+            return int(text)
+        elif watermark_type == 'float':
+            return float(text)
+        return text
+
+    @staticmethod
+    def _sync_watermark_to_text(value: Any) -> tuple:
+        """
+        Converts a high-water mark to the text and type stored in the SYNC_WATERMARK_TABLE by sync_table(), so that the
+        watermark survives the round trip regardless of the column types of the target database
+
+        :param value: The watermark, the maximum of the watermark column
+        :return: tuple - The text and the type ('datetime', 'date', 'int', 'float' or 'str') of the watermark
+        """
+        if isinstance(value, pd.Timestamp):
+            value = value.to_pydatetime()
+        if isinstance(value, datetime.datetime):
+            return value.isoformat(), 'datetime'
+        elif isinstance(value, datetime.date):
+            return value.isoformat(), 'date'
+        elif isinstance(value, (int, np.integer)) and not isinstance(value, (bool, np.bool_)):
+            return str(int(value)), 'int'
+        elif isinstance(value, (float, np.floating)):
+            return repr(float(value)), 'float'
+        return str(value), 'str'
+
+    def _transaction_begin(self) -> None:
+        """
+        Starts the transaction of the outermost transaction() block (and of each group after a group commit, and of
+        import_file()) explicitly for SQLite, as sqlite3 (also through SQLAlchemy) does not begin a transaction before
+        DDL statements such as CREATE TABLE or before a SAVEPOINT. Otherwise these would be committed as they run
+        instead of being rolled back with the block.
+
+        :return: None
+        """
+        if self.engine is not None:
+            if self._dialect_name() == 'sqlite':
+                connection = self.db_conn.connection()
+                if not connection.connection.dbapi_connection.in_transaction:
+                    connection.exec_driver_sql('BEGIN')
+        elif self.database_type == 'sqlite' and not self.db_conn.in_transaction:
+            self.db_conn.execute('BEGIN')
+
+    def _transaction_commit(self, state: dict, force: bool = False) -> None:
+        """
+        The group commit of transaction(): commits once "commit_every_rows" rows have been written or "commit_every_seconds"
+        have passed since the previous commit (or always if "force" is True). Nothing is committed while a nested
+        transaction() (savepoint) is open, as a commit would release its savepoint.
+
+        :param state: The state of the outermost transaction() of the current thread
+        :param force: Boolean indicating if the transaction should be committed regardless of the thresholds
+        :return: None
+        """
+        if len(state['savepoints']) > 0 and not force:
+            return
+        rows_due = state['commit_every_rows'] is not None and state['pending_rows'] >= state['commit_every_rows']
+        seconds_due = state['commit_every_seconds'] is not None and time.monotonic() - state['last_commit'] >= state['commit_every_seconds']
+        if force or rows_due or seconds_due:
+            self.db_conn.commit()
+            state['commits'] += 1
+            state['pending_rows'] = 0
+            state['last_commit'] = time.monotonic()
+            if not force:
+                self._transaction_begin()
+
+    def _transaction_rollback(self, state: dict) -> None:
+        """
+        The rollback() within a transaction() block: rolls back the writes of the current thread's innermost block, to
+        its savepoint for a nested block or to the most recent group commit for the outermost block. The block stays
+        open (a nested block gets a new savepoint) and the rolled back rows are no longer counted.
+
+        :param state: The state of the outermost transaction() of the current thread
+        :return: None
+        """
+        if len(state['savepoints']) > 0:
+            savepoint, rows, pending_rows = state['savepoints'][-1]
+            if self.engine is not None:
+                savepoint.rollback()
+                state['savepoints'][-1] = (self._transaction_savepoint(state=state), rows, pending_rows)
+            else:
+                # the savepoint stays open after ROLLBACK TO
+                self.db_conn.execute(f'ROLLBACK TO SAVEPOINT {savepoint}')
+            state['rows'], state['pending_rows'] = rows, pending_rows
+        else:
+            self.db_conn.rollback()
+            state['rows'] -= state['pending_rows']
+            state['pending_rows'] = 0
+            self._transaction_begin()
+
+    def _transaction_savepoint(self, state: dict) -> Union[str, 'SessionTransaction']:
+        """
+        Starts the savepoint of a nested transaction() block
+
+        :param state: The state of the outermost transaction() of the current thread
+        :return: str or SessionTransaction - The name of the sqlite3 savepoint, or the nested SQLAlchemy transaction
+        """
+        # a SAVEPOINT outside a transaction starts one that its RELEASE would commit, together with the outer writes
+        self._transaction_begin()
+        if self.engine is not None:
+            return self.db_conn.begin_nested()
+        savepoint = f'dbpd_savepoint_{len(state["savepoints"]) + 1}'
+        self.db_conn.execute(f'SAVEPOINT {savepoint}')
+        return savepoint
+
+    def _transaction_write(self, rows: int, sql: Optional[str] = None) -> None:
+        """
+        Counts the rows written within a transaction() block and commits if a group commit is due. Called after the
+        batched inserts and upserts with their number of rows, and by query() with 1 row per write statement.
+
+        :param rows: The number of rows written
+        :param sql: The sql statement, if given only write statements (see ResultCache.is_write()) are counted
+        :return: None
+        """
+        state = getattr(self._transaction_local, 'state', None)
+        if state is None or (sql is not None and not ResultCache.is_write(sql)):
+            return
+        state['rows'] += rows
+        state['pending_rows'] += rows
+        self._transaction_commit(state=state)
+
+    def _upsert_statement(self, table_name: str, columns: list, key_columns: list, update_columns: list) -> tuple:
+        """
+        Used by upsert_dataframe() to build the "insert or update" statement of the manager's dialect:
+            sqlite, postgresql: INSERT ... ON CONFLICT (key_columns) DO UPDATE SET (DO NOTHING without update_columns)
+            mysql:              INSERT ... ON DUPLICATE KEY UPDATE (MySQL matches on any primary or unique key)
+            oracle, mssql:      MERGE INTO ... USING (one row of parameters) ON (key_columns)
+
+        sqlite3 connections get a qmark-style sql string that takes tuples of values, SQLAlchemy connections get an
+        insert() construct (so that the dialect can batch the rows into multi-row VALUES) or a text() MERGE statement,
+        both take dictionaries keyed by the returned parameter names.
+
+        :param table_name: The name of the table
+        :param columns: The (already filtered) column names, including the key columns
+        :param key_columns: The columns that identify a row, these need a primary key or unique constraint
+        :param update_columns: The columns that are updated when a row with the same key already exists
+        :return: tuple - (statement, the statement as a sql string, the parameter names in the order of columns or None for tuples)
+        """
+        dialect = self._dialect_name()
+        supported = ['sqlite', 'postgresql', 'mysql', 'oracle', 'mssql']
+        if dialect not in supported:
+            raise self.DatabaseTypeError(method='upsert_dataframe', database_type=dialect, supported=supported)
+        if self.engine is None:
+            set_clause = ', '.join(f'{column} = excluded.{column}' for column in update_columns)
+            conflict = f'DO UPDATE SET {set_clause}' if update_columns else 'DO NOTHING'
+            sql = f"""INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join(['?' for _ in columns])}) ON CONFLICT ({', '.join(key_columns)}) {conflict}"""
+            return sql, sql, None
+
+        table = self._sqlalchemy_table(table_name=table_name, columns=columns)
+        if dialect in ['sqlite', 'postgresql']:
+            if dialect == 'sqlite':
+                from sqlalchemy.dialects.sqlite import insert
+            else:
+                from sqlalchemy.dialects.postgresql import insert
+            statement = insert(table)
+            if update_columns:
+                statement = statement.on_conflict_do_update(index_elements=key_columns, set_={column: statement.excluded[column] for column in update_columns})
+            else:
+                statement = statement.on_conflict_do_nothing(index_elements=key_columns)
+        elif dialect == 'mysql':
+            from sqlalchemy.dialects.mysql import insert
+            statement = insert(table)
+            if update_columns:
+                statement = statement.on_duplicate_key_update({column: statement.inserted[column] for column in update_columns})
+            else:
+                statement = statement.on_duplicate_key_update({key_columns[0]: table.c[key_columns[0]]})
+        else:
+            if dialect == 'oracle':
+                source = f"""(SELECT {', '.join(f':p{i} AS {column}' for i, column in enumerate(columns))} FROM dual) src"""
+                target = f'{table_name} tgt'
+            else:
+                source = f"""(VALUES ({', '.join(f':p{i}' for i in range(len(columns)))})) AS src ({', '.join(columns)})"""
+                target = f'{table_name} AS tgt'
+            sql = f"""MERGE INTO {target} USING {source} ON ({' AND '.join(f'tgt.{column} = src.{column}' for column in key_columns)})"""
+            if update_columns:
+                sql += f""" WHEN MATCHED THEN UPDATE SET {', '.join(f'tgt.{column} = src.{column}' for column in update_columns)}"""
+            sql += f""" WHEN NOT MATCHED THEN INSERT ({', '.join(columns)}) VALUES ({', '.join(f'src.{column}' for column in columns)})"""
+            if dialect == 'mssql':
+                sql += ';'
+            return self._text(sql), sql, [f'p{i}' for i in range(len(columns))]
+        return statement, str(statement.compile(dialect=self.engine.dialect)), columns
+
+    @staticmethod
+    def _warn(text: str) -> None:
+        """
+        Prints a yellow-colored warning to the console
+
+        :param text: The warning message
+        :return: None
+        """
+        print(f'\033[0;33;49mWARNING: {text} \033[0m' + '\n')
+
+    # Public Utility methods #########################################################################################################################
+    @classmethod
+    def access_driver(cls, filepath: str) -> str:
+        """
+        Creates the MS Access Driver string that can be used by pyodbc.connect()
+
+        :param filepath: The filepath of the Access database
+        :return: str - The filepath with backward slashes replaced with forward slashes
+        """
+        if not filepath.endswith('.accdb') and not filepath.endswith('mdb'):
+            raise cls.AccessFileError(filepath=filepath)
+        fp = os.path.abspath(filepath).replace('\\', '/')
+        return f'DRIVER={{Microsoft Access Driver (*.mdb, *.accdb)}};DBQ={fp};'
+
+    @classmethod
+    def compact_dataframe(cls, dataframe: pd.DataFrame, column_types: Optional[dict] = None, downcast_floats: bool = False) -> pd.DataFrame:
+        """
+        Converts the columns of a DataFrame to compact dtypes, used by query(compact_dtypes=True). The kind of each column
+        is taken from "column_types" (the declared types of the results, see _column_kind()) or, if it is not given,
+        inferred from the values of object columns:
+            integers:     int32 if the values fit, otherwise int64, nullable Int32/Int64 if there are NULLs
+            booleans:     bool, or nullable boolean if there are NULLs (also 0/1 columns declared as BOOLEAN/BIT)
+            dates:        datetime64 (also text columns declared as DATE/DATETIME/TIMESTAMP if every value parses)
+            strings:      category if at most CATEGORY_MAX_RATIO of the values are distinct
+            floats:       float32 if "downcast_floats" is True (float32 has about 7 significant digits)
+        Columns of other values (such as Decimal or bytes) keep the dtype that pandas infers. Columns that are all NULL
+        get the dtype of their kind in "column_types" (e.g. Int32 for an INTEGER column), otherwise they are of object dtype.
+
+        :param dataframe: The DataFrame, columns of object dtype are inspected value by value
+        :param column_types: The lower-cased column names and their kind: 'boolean', 'integer', 'float', 'number', 'datetime', 'string' or 'category'
+        :param downcast_floats: Boolean indicating if float64 columns should be downcast to float32
+        :return: DataFrame
+        """
+        if column_types is None:
+            column_types = {}
+        if len(dataframe.columns) == 0:
+            return dataframe.copy()
+        int32 = np.iinfo(np.int32)
+        columns = {}
+        for position, column in enumerate(dataframe.columns):
+            series = dataframe.iloc[:, position]
+            kind = column_types.get(str(column).lower())
+            if series.dtype == object:
+                inferred = pd.api.types.infer_dtype(series, skipna=True)
+                if inferred != 'mixed':
+                    series = series.infer_objects()
+            else:
+                inferred = pd.api.types.infer_dtype(series, skipna=True)
+            valid = series.notna()
+            has_nulls = not valid.all()
+
+            if kind == 'category' or (inferred == 'string' and kind in [None, 'string'] and len(series) > 0 and series.nunique() <= cls.CATEGORY_MAX_RATIO * len(series)):
+                series = series.astype('category')
+            elif inferred in ['datetime', 'datetime64', 'date'] or (kind == 'datetime' and inferred in ['string', 'empty']):
+                try:
+                    converted = pd.to_datetime(series, errors='coerce', format='ISO8601' if inferred == 'string' else None)
+                except (TypeError, ValueError):
+                    converted = None
+                if converted is not None and converted.notna().sum() == valid.sum():
+                    series = converted
+            elif inferred == 'boolean' or (kind == 'boolean' and inferred in ['integer', 'floating', 'mixed-integer-float', 'empty'] and series[valid].isin([0, 1]).all()):
+                series = series.astype('boolean' if has_nulls else bool)
+            elif inferred == 'integer' or (kind == 'integer' and inferred in ['floating', 'mixed-integer-float', 'empty'] and (series[valid] % 1 == 0).all()):
+                fits = not valid.any() or (series[valid].min() >= int32.min and series[valid].max() <= int32.max)
+                if has_nulls:
+                    series = series.astype('Int32' if fits else 'Int64')
+                else:
+                    series = series.astype(np.int32 if fits else np.int64)
+            elif inferred in ['floating', 'mixed-integer-float'] or (kind == 'float' and inferred == 'empty'):
+                series = series.astype(np.float32 if downcast_floats else np.float64)
+            elif series.dtype == object:
+                series = series.infer_objects()
+            columns[position] = series
+        df = pd.concat(columns, axis=1)
+        df.columns = dataframe.columns
+        df.index = dataframe.index
+        return df
+
+    @classmethod
+    def convert_numpy_value(cls, value: Any, column: Optional[str] = None, null_zeroes_for_columns: Optional[list] = None) -> Any:
+        """
+        Possibly converts a numpy value (typically this value comes from a DataFrame) to its respective Python value
+
+        :param value: The value to be possibly be converted
+        :param column: The column name of the DataFrame in which the value resides - This is only used for nulling zero values
         :param null_zeroes_for_columns: A list of columns where zeros should be nullified
         :return: The converted value
         """
@@ -497,6 +1930,43 @@ class BaseDBPD(object):
                     v = None
         return v
 
+    @classmethod
+    def dataframe_to_db_rows(cls, dataframe: pd.DataFrame, null_zeroes_for_columns: Optional[list] = None) -> list:
+        """
+        Converts a whole DataFrame into a list of row tuples that can be passed to executemany(), giving the same values
+        as calling convert_numpy_value() on every cell but working one column at a time: NaN/NaT/None become None,
+        NumPy integers, floats and booleans become their Python equivalents, datetime columns become datetime.datetime
+        values and zeros are nullified in the "null_zeroes_for_columns" columns. The index is not included.
+
+        :param dataframe: The DataFrame to be converted
+        :param null_zeroes_for_columns: A list of columns where zeros should be nullified
+        :return: list - A list of tuples, one per row, in the order of the DataFrame's columns
+        """
+        if len(dataframe.columns) == 0:
+            return [() for _ in range(len(dataframe))]
+        columns = []
+        for i, column in enumerate(dataframe.columns):
+            series = dataframe.iloc[:, i]
+            # Converting to an object array turns NumPy scalars into Python ints, floats and bools (in C)
+            if pd.api.types.is_datetime64_any_dtype(series.dtype):
+                # Drivers such as sqlite3 cannot bind pd.Timestamp, only datetime.datetime
+                values = np.array(series.dt.to_pydatetime(), dtype=object)
+            else:
+                values = series.to_numpy(dtype=object, copy=True)
+            if values.dtype != object:
+                values = values.astype(object)
+            if series.dtype == object or isinstance(series.dtype, pd.CategoricalDtype):
+                # Object columns can still hold NumPy scalars, only these need to be converted one at a time
+                for j, value in enumerate(values):
+                    if isinstance(value, np.generic):
+                        values[j] = value.item()
+            null_mask = series.isna().to_numpy()
+            if null_zeroes_for_columns is not None and column in null_zeroes_for_columns:
+                null_mask = null_mask | (series == 0).to_numpy(dtype=bool, na_value=False)
+            values[null_mask] = None
+            columns.append(values)
+        return list(zip(*columns))
+
     @classmethod
     def create_access_database(cls, filepath: str, create_table_schema_sql_list: Optional[list] = None) -> str:
         """
@@ -514,6 +1984,7 @@ class BaseDBPD(object):
         except Exception as e:
             raise e
 
+        import pyodbc
         driver = cls.access_driver(filepath=filepath)
         conn = pyodbc.connect(driver)
         try:
@@ -589,19 +2060,49 @@ class BaseDBPD(object):
             self.rollback()
             raise e
 
+    def decrypt_column(
+            self,
+            dataframe: pd.DataFrame,
+            column: str,
+            original_encoding: str = 'utf-8',
+            ttl: Optional[int] = None,
+            workers: Optional[int] = None,
+            chunksize: int = 10000,
+            executor: Literal['thread', 'process'] = 'thread'
+    ) -> pd.DataFrame:
+        """
+        Decrypts every value of a column that was encrypted with encrypt_value() or encrypt_column(), reusing a single
+        Fernet instance (a MultiFernet if "fernet_encryption_key" is a list of keys). NULL values stay NULL. The values are
+        decrypted in chunks of "chunksize" values, spread over a pool of "workers" threads or processes. The number of
+        values per second is stored in the "recent_column_crypto" attribute.
+
+        :param dataframe: The DataFrame containing the encrypted column
+        :param column: The name of the encrypted column
+        :param original_encoding: The original encoding of the values
+        :param ttl: The timeout of the key
+        :param workers: The number of threads or processes, defaults to the number of CPUs (1 decrypts in the calling thread)
+        :param chunksize: The number of values per chunk
+        :param executor: Either 'thread' or 'process', a process pool avoids the GIL but has to send the values to each process
+        :return: DataFrame - A copy of the DataFrame with the decrypted column
+        """
+        return self._fernet_column(
+            dataframe=dataframe, column=column, decrypt=True, encoding=original_encoding, ttl=ttl, workers=workers, chunksize=chunksize, executor=executor
+        )
+
     @staticmethod
-    def decrypt_value_static(fernet_encryption_key: bytes, value: bytes, original_encoding: str = 'utf-8', ttl: Optional[int] = None) -> str:
+    def decrypt_value_static(fernet_encryption_key: Union[bytes, list], value: bytes, original_encoding: str = 'utf-8', ttl: Optional[int] = None) -> str:
         """
         This static method can be used directly if the user has an encryption key but would not like to start a database session
 
-        :param fernet_encryption_key: The encryption key
+        :param fernet_encryption_key: The encryption key, or a list of keys (tried in order) for key rotation
         :param value: The value to be decrypted
         :param original_encoding: The original encoding of the value
         :param ttl: The timeout of the key
         :return: str - The string representation of the decrypted value
         """
-        fernet = Fernet(fernet_encryption_key)
-        return fernet.decrypt(token=value, ttl=ttl).decode(encoding=original_encoding)
+        if isinstance(fernet_encryption_key, list):
+            fernet_encryption_key = tuple(fernet_encryption_key)
+        return BaseDBPD._fernet(fernet_encryption_key).decrypt(value, ttl).decode(encoding=original_encoding)
 
     def decrypt_value(self, value: bytes, original_encoding: str = 'utf-8', ttl: Optional[int] = None) -> Any:
         """
@@ -618,19 +2119,47 @@ class BaseDBPD(object):
             raise self.EncryptionKeyError()
         return self.decrypt_value_static(fernet_encryption_key=self.fernet_encryption_key, value=value, original_encoding=original_encoding, ttl=ttl)
 
+    def encrypt_column(
+            self,
+            dataframe: pd.DataFrame,
+            column: str,
+            encoding: str = 'utf-8',
+            workers: Optional[int] = None,
+            chunksize: int = 10000,
+            executor: Literal['thread', 'process'] = 'thread'
+    ) -> pd.DataFrame:
+        """
+        Encrypts every value of a column, the same as encrypt_value() but reusing a single Fernet instance (a MultiFernet
+        if "fernet_encryption_key" is a list of keys, the first key encrypts). NULL values stay NULL. The values are
+        encrypted in chunks of "chunksize" values, spread over a pool of "workers" threads or processes. The number of
+        values per second is stored in the "recent_column_crypto" attribute.
+
+        :param dataframe: The DataFrame containing the column
+        :param column: The name of the column to be encrypted, note that the values will be turned into strings and then bytes before encryption
+        :param encoding: The encoding of the values to bytes
+        :param workers: The number of threads or processes, defaults to the number of CPUs (1 encrypts in the calling thread)
+        :param chunksize: The number of values per chunk
+        :param executor: Either 'thread' or 'process', a process pool avoids the GIL but has to send the values to each process
+        :return: DataFrame - A copy of the DataFrame with the encrypted column
+        """
+        return self._fernet_column(
+            dataframe=dataframe, column=column, decrypt=False, encoding=encoding, workers=workers, chunksize=chunksize, executor=executor
+        )
+
     @staticmethod
-    def encrypt_value_static(fernet_encryption_key: bytes, value: Any, encoding: str = 'utf-8') -> bytes:
+    def encrypt_value_static(fernet_encryption_key: Union[bytes, list], value: Any, encoding: str = 'utf-8') -> bytes:
         """
         This static method can be used directly if the user has an encryption key but would not like to start a database session
 
-        :param fernet_encryption_key: The encryption key
+        :param fernet_encryption_key: The encryption key, or a list of keys for key rotation (the first key encrypts)
         :param value: The value to be encrypted, note that this value will be turned into a string and then bytes before encryption
         :param encoding: The encoding of the value to bytes
         :return: bytes - The encrypted value
         """
+        if isinstance(fernet_encryption_key, list):
+            fernet_encryption_key = tuple(fernet_encryption_key)
         value = bytes(str(value), encoding=encoding)
-        fernet = Fernet(fernet_encryption_key)
-        return fernet.encrypt(data=value)
+        return BaseDBPD._fernet(fernet_encryption_key).encrypt(value)
 
     def encrypt_value(self, value: Any, encoding: str = 'utf-8') -> bytes:
         """
@@ -671,6 +2200,7 @@ class BaseDBPD(object):
 
         :return: bytes - The Fernet Encryption Key
         """
+        from cryptography.fernet import Fernet
         cls._warn('Generating Fernet encryption key, make sure to save this key somewhere secure')
         return Fernet.generate_key()
 
@@ -722,32 +2252,98 @@ class BaseDBPD(object):
     # Transaction methods ##########################################################################################
     def close(self, commit_on_quit: bool = True) -> None:
         """
-        Closes the current session with the database.
+        Closes the current session with the database. In thread-safe mode the connections (or Sessions) of all threads
+        are committed and closed, so this should be called once the threads are done with the database. The engine of
+        a SQLAlchemy connection is disposed of, unless it is shared (shared_engine=True) in which case the Session only
+        returns its connection to the shared pool.
 
         :param commit_on_quit: Boolean indicating if a final commit should be transacted before close
         :return: None
         """
-        if commit_on_quit:
-            self.db_conn.commit()
-
-        # pyodbc with MS Access can sometimes close very slowly ~15 seconds, here we just throw it in a thread to not hold anything up
-        if self.database_type == 'access':
-            t = threading.Thread(target=self.db_conn.close)
-            t.start()
+        if self._thread_connections is not None:
+            with self._thread_lock:
+                connections, self._thread_connections = self._thread_connections, []
         else:
-            self.db_conn.close()
+            connections = [self.db_conn]
 
-        # SqlAlchemy engines will be disposed of
-        if self.engine is not None:
+        for connection in connections:
+            if commit_on_quit:
+                connection.commit()
+
+            # pyodbc with MS Access can sometimes close very slowly ~15 seconds, here we just throw it in a thread to not hold anything up
+            if self.database_type == 'access':
+                t = threading.Thread(target=connection.close)
+                t.start()
+            else:
+                connection.close()
+
+        if self.thread_safe and self.engine is not None:
+            self.db_conn.remove()
+
+        # SqlAlchemy engines will be disposed of, unless they are shared with other managers
+        if self.engine is not None and not self.shared_engine:
             self.engine.dispose()
 
     def commit(self) -> None:
         """
-        Commits current transactions to the database
+        Commits current transactions to the database. Within a transaction() block the commit is grouped instead, it
+        only happens once one of the block's thresholds is reached (or when the block ends).
         :return: None
         """
+        state = getattr(self._transaction_local, 'state', None)
+        if state is not None:
+            self._transaction_commit(state=state)
+            return
         self.db_conn.commit()
 
+    def copy_query_to(
+            self,
+            target: 'BaseDBPD',
+            table_name: str,
+            sql: str,
+            parameters: Optional[Union[dict, list]] = None,
+            chunksize: int = 10000,
+            create_table: bool = True,
+            commit: bool = True
+    ) -> int:
+        """
+        Copies the results of a query into a table of another (or the same) database manager of any type. The results are
+        streamed from this database with query_iter() and each chunk is inserted into the target with insert_dataframe(),
+        so the full result is never held in memory.
+
+        If the table does not exist in the target and "create_table" is True, it is created from the dtypes of the first
+        chunk (see CREATE_TABLE_TYPES). Columns of the results that are not in an existing target table are ignored.
+
+        Example:
+            copied = postgres.copy_query_to(target=sqlite, table_name='sales_2023', sql='SELECT * FROM sales WHERE year = 2023')
+
+        :param target: The database manager the results should be copied to
+        :param table_name: The name of the table in the target database
+        :param sql: The sql statement to be executed on this database
+        :param parameters: The parameters associated with a parameterized query
+        :param chunksize: The number of rows read and inserted at a time
+        :param create_table: Boolean indicating if the table should be created in the target if it does not exist
+        :param commit: Boolean indicating if the target should be committed after the copy (it is rolled back on error, with the table if it was created by the copy)
+        :return: int - The number of rows copied
+        """
+        copied = 0
+        try:
+            if commit:
+                # a table created for the copy is rolled back with the rows if the copy fails
+                target._transaction_begin()
+            for df in self.query_iter(sql=sql, parameters=parameters, chunksize=chunksize):
+                if copied == 0 and create_table and not target._table_exists(table_name=table_name):
+                    create_table_sql = target._generate_create_table_sql_from_dataframe(dataframe=df, table_name=table_name, dialect=target._dialect_name())
+                    target.query(sql=create_table_sql, show_head=False, warn_is_none=False)
+                copied += target.insert_dataframe(table_name=table_name, dataframe=df, batch_size=chunksize)
+            if commit:
+                target.commit()
+        except Exception as e:
+            if commit:
+                target.rollback()
+            raise e
+        return copied
+
     def drop_all_tables(self, commit: bool = True) -> None:
         """
         Drops all tables from the database.
@@ -817,16 +2413,7 @@ class BaseDBPD(object):
             db_mgr.query(sql=create_table_sql, show_head=False, warn_is_none=False)
             db_mgr.commit()
         try:
-            secure_cols = [f'[{i}]' for i in df.columns]
-            for i in df.index:
-                insert_values = [self.convert_numpy_value(value=ii) for ii in df.iloc[i].tolist()]
-                # Although it may seem wise to create "place_holders" and "insert" above-outside of the for-loop because
-                # the "insert_values" length will always be the same "columns" length, however it is actually
-                # significantly (~7x) slower to do so, the reason is unknown to me currently, it may have to do
-                # with Python memory allocation or with pyodbc itself
-                place_holders = ['?' for _ in range(len(insert_values))]
-                insert = f"""INSERT INTO {out_table_name} ({', '.join(secure_cols)}) VALUES ({', '.join(place_holders)});"""
-                db_mgr.query(sql=insert, parameters=insert_values, show_head=False, warn_is_none=False)
+            db_mgr.insert_dataframe(table_name=out_table_name, dataframe=df)
             db_mgr.commit()
             return df
         except Exception as e:
@@ -834,6 +2421,29 @@ class BaseDBPD(object):
         finally:
             db_mgr.close()
 
+    def export_query_to_csv(
+            self,
+            out_filepath: str,
+            in_sql: str,
+            in_parameters: Optional[Union[dict, list]] = None,
+            chunksize: int = 100000,
+            compression: Optional[Literal['infer', 'gzip', 'bz2', 'xz', 'zstd']] = 'infer',
+            **to_csv_kwargs
+    ) -> int:
+        """
+        Will export query results to a CSV file, only if the query returns results. The results are streamed with
+        query_iter() and each chunk is appended to the file, so the full result is never held in memory.
+
+        :param out_filepath: The filepath of the new CSV file to be created
+        :param in_sql: The sql statement to be executed
+        :param in_parameters: The parameters associated with a parameterized query
+        :param chunksize: The number of rows fetched and written at a time
+        :param compression: The compression of the file, 'infer' derives it from the extension (.gz, .bz2, .xz, .zst)
+        :param to_csv_kwargs: Any keyword arguments that should be passed to DataFrame.to_csv() (sep, date_format, etc.)
+        :return: int - The number of rows exported
+        """
+        return self._export_query_stream(out_filepath=out_filepath, in_sql=in_sql, in_parameters=in_parameters, chunksize=chunksize, file_format='csv', compression=compression, **to_csv_kwargs)
+
     def export_query_to_excel(
             self,
             out_filepath: str,
@@ -870,6 +2480,53 @@ class BaseDBPD(object):
                     os.remove(fp)
             raise e
 
+    def export_query_to_feather(
+            self,
+            out_filepath: str,
+            in_sql: str,
+            in_parameters: Optional[Union[dict, list]] = None,
+            chunksize: int = 100000,
+            compression: Optional[Literal['lz4', 'zstd']] = 'lz4'
+    ) -> int:
+        """
+        Will export query results to a Feather (Arrow IPC) file, only if the query returns results. The results are
+        streamed with query_iter() and each chunk is written as a record batch, so the full result is never held in
+        memory. See _arrow_table() for how the schema is derived. Requires pyarrow.
+
+        :param out_filepath: The filepath of the new Feather file to be created
+        :param in_sql: The sql statement to be executed
+        :param in_parameters: The parameters associated with a parameterized query
+        :param chunksize: The number of rows fetched and written at a time
+        :param compression: The compression of the record batches, 'lz4', 'zstd' or None
+        :return: int - The number of rows exported
+        """
+        return self._export_query_stream(out_filepath=out_filepath, in_sql=in_sql, in_parameters=in_parameters, chunksize=chunksize, file_format='feather', compression=compression)
+
+    def export_query_to_parquet(
+            self,
+            out_filepath: str,
+            in_sql: str,
+            in_parameters: Optional[Union[dict, list]] = None,
+            chunksize: int = 100000,
+            compression: Optional[Literal['snappy', 'gzip', 'brotli', 'lz4', 'zstd']] = 'snappy'
+    ) -> int:
+        """
+        Will export query results to a Parquet file, only if the query returns results. The results are streamed with
+        query_iter() and each chunk is written as a row group, so the full result is never held in memory. See
+        _arrow_table() for how the schema is derived. Requires pyarrow.
+
+        Example:
+            rows = db.export_query_to_parquet('sales.parquet', 'SELECT * FROM sales', chunksize=500000, compression='zstd')
+
+        :param out_filepath: The filepath of the new Parquet file to be created
+        :param in_sql: The sql statement to be executed
+        :param in_parameters: The parameters associated with a parameterized query
+        :param chunksize: The number of rows fetched and written at a time (the row group size)
+        :param compression: The compression codec, 'snappy', 'gzip', 'brotli', 'lz4', 'zstd' or None
+        :return: int - The number of rows exported
+        """
+        return self._export_query_stream(out_filepath=out_filepath, in_sql=in_sql, in_parameters=in_parameters, chunksize=chunksize, file_format='parquet', compression=compression)
+
     def export_query_to_sqlite(
             self,
             out_filepath: str,
@@ -910,6 +2567,188 @@ class BaseDBPD(object):
                     os.remove(fp)
             raise e
 
+    def import_file(
+            self,
+            table_name: str,
+            filepath: str,
+            chunksize: int = 100000,
+            create_table: bool = True,
+            file_format: Optional[Literal['csv', 'parquet', 'feather']] = None,
+            batch_size: int = 10000,
+            null_zeroes_for_columns: Optional[list] = None,
+            fast_executemany: bool = False,
+            show_progress: bool = True,
+            commit: bool = True,
+            **read_csv_kwargs
+    ) -> int:
+        """
+        Loads a CSV, Parquet or Feather file into a table. The file is read in chunks of "chunksize" rows (Parquet and
+        Feather files require pyarrow) and each chunk is inserted with insert_dataframe() (batched executemany), all
+        within one transaction that is committed at the end, or rolled back if the import fails (with the table, if it
+        was created by the import).
+
+        If the table does not exist and "create_table" is True, it is created from the dtypes of the first chunk using
+        the types of this database's dialect (see CREATE_TABLE_TYPES). Columns of the file that are not columns of an
+        existing table are ignored. Because CSV dtypes are inferred per chunk, pass "dtype" (a read_csv() argument) for
+        columns whose first chunk is not representative, e.g. a column that is empty in the first rows.
+
+        Example:
+            db.import_file('daily_sales', 'exports/daily_sales.csv.gz', chunksize=200000, parse_dates=['sold_at'])
+
+        :param table_name: The name of the table to be loaded
+        :param filepath: The filepath of the CSV, Parquet or Feather file
+        :param chunksize: The number of rows read from the file at a time
+        :param create_table: Boolean indicating if the table should be created if it does not exist
+        :param file_format: 'csv', 'parquet' or 'feather', defaults to the file extension (CSV for anything else)
+        :param batch_size: The number of rows sent to the database per executemany() call
+        :param null_zeroes_for_columns: A list of columns where zeros should be nullified
+        :param fast_executemany: Sets pyodbc's fast_executemany on the cursor, only for ODBC drivers that support parameter arrays
+        :param show_progress: Boolean indicating if the rows imported and rows per second should print to the console after each chunk
+        :param commit: Boolean indicating if the transaction should be committed after the import (it is rolled back on error)
+        :param read_csv_kwargs: Any keyword arguments that should be passed to pandas.read_csv() (sep, dtype, parse_dates, etc.)
+        :return: int - The number of rows imported
+        """
+        if file_format is None:
+            extension = os.path.splitext(filepath)[-1].lower()
+            file_format = {'.parquet': 'parquet', '.pq': 'parquet', '.feather': 'feather', '.arrow': 'feather'}.get(extension, 'csv')
+
+        if file_format == 'csv':
+            chunks = pd.read_csv(filepath, chunksize=chunksize, **read_csv_kwargs)
+        elif file_format == 'parquet':
+            import pyarrow.parquet as pq
+            chunks = (batch.to_pandas() for batch in pq.ParquetFile(filepath).iter_batches(batch_size=chunksize))
+        elif file_format == 'feather':
+            import pyarrow as pa
+            reader = pa.ipc.open_file(filepath)
+            chunks = (
+                batch.slice(offset, chunksize).to_pandas()
+                for batch in (reader.get_batch(i) for i in range(reader.num_record_batches))
+                for offset in range(0, batch.num_rows, chunksize)
+            )
+        else:
+            raise ValueError(f'Invalid "file_format" argument: "{file_format}". Must be "csv", "parquet" or "feather"')
+
+        imported = 0
+        start = time.perf_counter()
+        try:
+            if commit:
+                # a table created for the import is rolled back with the rows if the import fails
+                self._transaction_begin()
+            for df in chunks:
+                if imported == 0 and create_table and not self._table_exists(table_name=table_name):
+                    create_table_sql = self._generate_create_table_sql_from_dataframe(dataframe=df, table_name=table_name, dialect=self._dialect_name())
+                    self.query(sql=create_table_sql, show_head=False, warn_is_none=False)
+                imported += self.insert_dataframe(
+                    table_name=table_name,
+                    dataframe=df,
+                    batch_size=batch_size,
+                    null_zeroes_for_columns=null_zeroes_for_columns,
+                    fast_executemany=fast_executemany
+                )
+                if show_progress:
+                    elapsed = time.perf_counter() - start
+                    print(f'{os.path.basename(filepath)}: {imported:,} rows imported into {table_name} ({imported / elapsed:,.0f} rows/s)')
+            if commit:
+                self.commit()
+        except Exception as e:
+            if commit:
+                self.rollback()
+            raise e
+        finally:
+            if file_format == 'csv':
+                chunks.close()
+        return imported
+
+    def insert_dataframe(
+            self,
+            table_name: str,
+            dataframe: pd.DataFrame,
+            batch_size: int = 10000,
+            null_zeroes_for_columns: Optional[list] = None,
+            fast_executemany: bool = False
+    ) -> int:
+        """
+        Inserts the rows of a DataFrame into a given table in batches. DataFrame columns that are not columns of the table
+        are ignored (matched case-insensitively, the same as insert_values()), the index is not inserted. Values are
+        converted one batch at a time with dataframe_to_db_rows() so that NaN/NaT become NULL.
+
+        Note that this method does not commit, use commit() afterwards (or rollback() on error).
+
+        :param table_name: The name of the table to insert values
+        :param dataframe: The DataFrame whose rows should be inserted
+        :param batch_size: The number of rows sent to the database per executemany() call
+        :param null_zeroes_for_columns: A list of columns where zeros should be nullified
+        :param fast_executemany: Sets pyodbc's fast_executemany on the cursor, only for ODBC drivers that support parameter arrays
+        :return: int - The number of rows inserted
+        """
+        allowable_columns = self.column_names(table_name=table_name, show_names=False)
+        columns = [column for column in dataframe.columns if str(column).lower() in allowable_columns]
+        if not columns:
+            raise ValueError(f'None of the DataFrame columns are columns of "{table_name}"')
+        dataframe = dataframe[columns]
+        records = chain.from_iterable(
+            self.dataframe_to_db_rows(dataframe=dataframe.iloc[start:start + batch_size], null_zeroes_for_columns=null_zeroes_for_columns)
+            for start in range(0, len(dataframe), batch_size)
+        )
+        return self._executemany_insert(
+            table_name=table_name,
+            columns=[str(column).lower() for column in columns],
+            records=records,
+            batch_size=batch_size,
+            fast_executemany=fast_executemany
+        )
+
+    def insert_many(
+            self,
+            table_name: str,
+            rows: list,
+            columns: Optional[list] = None,
+            batch_size: int = 10000,
+            fast_executemany: bool = False
+    ) -> int:
+        """
+        Inserts many rows into a given table in batches, the column names are checked against the table only once and a single
+        INSERT statement is prepared for all of the rows. Rows can either be dictionaries of column-value pairs (like the
+        keyword arguments of insert_values()), in which case the keys of the first row determine the columns, or sequences
+        of values in the order of the "columns" argument. Columns that are not in the table are ignored.
+
+        Note that this method does not commit, use commit() afterwards (or rollback() on error).
+
+        :param table_name: The name of the table to insert values
+        :param rows: A list of dictionaries or a list of sequences
+        :param columns: The column names of the values in each row, required if rows are sequences
+        :param batch_size: The number of rows sent to the database per executemany() call
+        :param fast_executemany: Sets pyodbc's fast_executemany on the cursor, only for ODBC drivers that support parameter arrays
+        :return: int - The number of rows inserted
+        """
+        if len(rows) == 0:
+            return 0
+        rows_are_dicts = isinstance(rows[0], dict)
+        if columns is None:
+            if not rows_are_dicts:
+                raise ValueError('The "columns" argument is required when rows are not dictionaries')
+            columns = list(rows[0].keys())
+
+        allowable_columns = self.column_names(table_name=table_name, show_names=False)
+        positions = [i for i, column in enumerate(columns) if column.lower() in allowable_columns]
+        if not positions:
+            raise ValueError(f'None of the columns {columns} are columns of "{table_name}"')
+
+        if rows_are_dicts:
+            keys = [columns[i] for i in positions]
+            records = (tuple(row.get(key) for key in keys) for row in rows)
+        elif len(positions) == len(columns):
+            records = (tuple(row) for row in rows)
+        else:
+            records = (tuple(row[i] for i in positions) for row in rows)
+        return self._executemany_insert(
+            table_name=table_name,
+            columns=[columns[i].lower() for i in positions],
+            records=records,
+            batch_size=batch_size,
+            fast_executemany=fast_executemany
+        )
+
     def insert_values(self, table_name: str, **column_value_pairs) -> None:
         """
         This method can be used to insert values into a given table. The column_value_pairs keyword arguments can be used to
@@ -920,13 +2759,7 @@ class BaseDBPD(object):
         :return: None
         """
         allowable_columns = self.column_names(table_name=table_name, show_names=False)
-        column_value_pairs = {column.lower(): value for column, value in column_value_pairs.items() if column.lower() in allowable_columns}
-        columns = list(column_value_pairs.keys())
-        if self.database_type in ['access', 'sqlite']:
-            values = ['?' for _ in columns]
-        else:
-            values = [f':{column}' for column in columns]
-        sql = f"""INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({', '.join(values)})"""
+        sql, column_value_pairs = self._insert_values_sql(table_name=table_name, allowable_columns=allowable_columns, column_value_pairs=column_value_pairs)
         try:
             self.query(sql=sql, parameters=column_value_pairs, show_head=False, warn_is_none=False)
         except Exception as e:
@@ -938,7 +2771,11 @@ class BaseDBPD(object):
             parameters: Optional[Union[dict, list]] = None,
             show_head: bool = True,
             index: Optional[Union[str, list]] = None,
-            warn_is_none: bool = True
+            warn_is_none: bool = True,
+            use_cache: bool = True,
+            compact_dtypes: bool = False,
+            downcast_floats: bool = False,
+            decrypt_columns: Optional[list] = None
     ) -> Optional[pd.DataFrame]:
         """
         Executes any user defined sql statement and if this sql statement returns data such as from a SELECT statement,
@@ -952,29 +2789,46 @@ class BaseDBPD(object):
         :param show_head: Boolean indicating if the head of the resulting DataFrame should be printed to the console
         :param index: Can be used to set the index of the resulting DataFrame
         :param warn_is_none: Boolean indicating if a warning should be printed to the console when the query returns zero results
+        :param use_cache: Boolean indicating if the result cache may be used (only applies once enable_result_cache() has been called)
+        :param compact_dtypes: Boolean indicating if the columns should be decoded to compact dtypes using the declared column types, see compact_dataframe()
+        :param downcast_floats: Boolean indicating if float64 columns should be downcast to float32 (only applies with compact_dtypes)
+        :param decrypt_columns: Columns of the results that should be decrypted with decrypt_column() (cached results stay encrypted)
         :return: DataFrame or None
         """
         self.recent_query = sql
-        df = None
-        if self.database_type in ['access', 'sqlite']:
-            df = self._access_sqlite_query(sql=sql, parameters=parameters)
-        else:
-            sql = text(sql)
-            if parameters is not None:
-                executed = self.db_conn.execute(sql, parameters)
-            else:
-                executed = self.db_conn.execute(sql)
-            if executed.returns_rows:
-                try:
-                    df = pd.DataFrame(data=executed.fetchall(), columns=list(executed.keys()))
-                except ValueError:
-                    pass  # df defaults to None
+        self._before_execute(sql)
+        record = self._start_query_record(sql=sql, parameters=parameters, method='query')
+        try:
+            cache_key = None
+            df = None
+            if use_cache and self.result_cache is not None and self.result_cache.is_read(sql):
+                variant = f'compact_dtypes={compact_dtypes},downcast_floats={downcast_floats}' if compact_dtypes else ''
+                cache_key = self.result_cache.make_key(sql=sql, parameters=parameters, variant=variant)
+                df = self.result_cache.get(key=cache_key)
+                if df is not None and record is not None:
+                    record.cached = True
+            if df is None:
+                if self.database_type in ['access', 'sqlite']:
+                    df = self._access_sqlite_query(sql=sql, parameters=parameters, record=record, compact_dtypes=compact_dtypes, downcast_floats=downcast_floats)
+                else:
+                    df = self._sqlalchemy_query(sql=sql, parameters=parameters, record=record, compact_dtypes=compact_dtypes, downcast_floats=downcast_floats)
+                if cache_key is not None and df is not None and len(df) > 0:
+                    self.result_cache.put(key=cache_key, sql=sql, df=df)
+        except Exception as e:
+            self._finish_query_record(record=record, error=e)
+            raise e
+        if record is not None:
+            record.add_result(df=df)
+            self._finish_query_record(record=record)
+        self._transaction_write(rows=1, sql=sql)
 
         if df is None or len(df) == 0:
             if warn_is_none:
                 self._warn(f'Query returned zero results, return object will be None')
             return None
         else:
+            for column in decrypt_columns or []:
+                df = self.decrypt_column(dataframe=df, column=column)
             if index is not None:
                 df.set_index(index, inplace=True)
             if show_head:
@@ -982,15 +2836,721 @@ class BaseDBPD(object):
             self.recent_df = df
             return df
 
+    def query_iter(
+            self,
+            sql: str,
+            parameters: Optional[Union[dict, list]] = None,
+            chunksize: int = 10000,
+            index: Optional[Union[str, list]] = None,
+            compact_dtypes: bool = False,
+            downcast_floats: bool = False
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Executes a user defined sql statement and yields the results as DataFrames of at most "chunksize" rows. Rows are
+        pulled from the database with fetchmany(), and SQLAlchemy connections request a server-side cursor
+        (stream_results) where the dialect supports one, so only one chunk of the results is held in memory at a time.
+
+        Note that if the query does not return data OR the query returns zero results, nothing will be yielded.
+
+        The dtypes are inferred for each chunk on its own, as with pandas.read_sql(chunksize=...): a chunk in which a
+        column has no NULLs gets the same dtype as query() would give, but a column that is all NULL in a chunk is of
+        object dtype in that chunk, and an INTEGER column with NULLs in some chunks is int64 in the others. Cast the
+        chunks with astype() where a single set of dtypes is needed.
+
+        Example:
+            for df in db.query_iter('SELECT * FROM big_table', chunksize=50000):
+                process(df)
+
+        :param sql: The sql statement to be executed
+        :param parameters: The parameters associated with a parameterized query
+        :param chunksize: The maximum number of rows in each yielded DataFrame
+        :param index: Can be used to set the index of each resulting DataFrame
+        :param compact_dtypes: Boolean indicating if the columns should be decoded to compact dtypes, see compact_dataframe(). Columns
+                               that are decoded as 'category' in the first chunk are decoded as 'category' in every chunk.
+        :param downcast_floats: Boolean indicating if float64 columns should be downcast to float32 (only applies with compact_dtypes)
+        :return: Iterator of DataFrames
+        """
+        if chunksize < 1:
+            raise ValueError(f'"chunksize" must be a positive integer, got {chunksize}')
+        self.recent_query = sql
+        self._before_execute(sql)
+        record = self._start_query_record(sql=sql, parameters=parameters, method='query_iter')
+        error = None
+        try:
+            if self.database_type in ['access', 'sqlite']:
+                start = time.perf_counter()
+                source = self._access_sqlite_execute(sql=sql, parameters=parameters)
+                self.recent_description = source.description
+                if source.description is None:
+                    columns = None
+                else:
+                    columns = [i[0] for i in source.description]
+            else:
+                start = time.perf_counter()
+                source = self.db_conn.execute(self._text(sql), parameters, execution_options={'stream_results': True, 'yield_per': chunksize})
+                self.recent_description = getattr(getattr(source, 'cursor', None), 'description', None)
+                columns = list(source.keys()) if source.returns_rows else None
+            if record is not None:
+                record.execute_seconds += time.perf_counter() - start
+            if compact_dtypes and columns is not None:
+                column_types = self._result_column_types(sql=sql, description=self.recent_description)
+
+            try:
+                while columns is not None:
+                    start = time.perf_counter()
+                    rows = source.fetchmany(chunksize)
+                    fetched = time.perf_counter()
+                    if not rows:
+                        break
+                    if compact_dtypes:
+                        df = pd.DataFrame(data=self._rows_to_array(rows=rows, column_count=len(columns)), columns=columns)
+                        df = self.compact_dataframe(dataframe=df, column_types=column_types, downcast_floats=downcast_floats)
+                        column_types.update({str(column).lower(): 'category' for column, dtype in df.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)})
+                    elif self.database_type in ['access', 'sqlite']:
+                        df = self._array_to_dataframe(data=self._rows_to_array(rows=rows, column_count=len(columns)), columns=columns)
+                    else:
+                        df = pd.DataFrame(data=rows, columns=columns)
+                    del rows
+                    if record is not None:
+                        record.fetch_seconds += fetched - start
+                        record.build_seconds += time.perf_counter() - fetched
+                        record.add_result(df=df)
+                    if index is not None:
+                        df.set_index(index, inplace=True)
+                    yield df
+            finally:
+                source.close()
+        except GeneratorExit:
+            raise
+        except Exception as e:
+            error = e
+            raise e
+        finally:
+            self._finish_query_record(record=record, error=error)
+
+    def query_many(
+            self,
+            queries: list,
+            max_workers: int = 4,
+            index: Optional[Union[str, list]] = None,
+            compact_dtypes: bool = False,
+            downcast_floats: bool = False
+    ) -> list:
+        """
+        Executes a list of independent sql statements concurrently and returns their results in the same order as the
+        statements. Each statement runs on its own connection: a pooled connection of the SQLAlchemy engine or a new
+        sqlite3 connection to the database file. In-memory SQLite and MS Access databases cannot share their connection
+        across threads, for these the statements are run one after another through query().
+
+        The elapsed seconds of each statement are stored in the "recent_query_many_timings" attribute.
+
+        Note that the worker connections do not see uncommitted changes made through this manager, and each statement
+        is committed on its own connection, so this method is intended for read queries such as report refreshes.
+
+        Example:
+            sales_df, users_df = db.query_many([
+                'SELECT * FROM sales',
+                ('SELECT * FROM users WHERE active = :active', {'active': 1})
+            ], max_workers=8)
+
+        :param queries: A list of sql statements, or tuples of (sql statement, parameters)
+        :param max_workers: The maximum number of statements executed at the same time
+        :param index: Can be used to set the index of each resulting DataFrame
+        :param compact_dtypes: Boolean indicating if the columns should be decoded to compact dtypes, see compact_dataframe()
+        :param downcast_floats: Boolean indicating if float64 columns should be downcast to float32 (only applies with compact_dtypes)
+        :return: list - A DataFrame (or None for zero results) for each statement
+        """
+        statements = [(query, None) if isinstance(query, str) else tuple(query) for query in queries]
+        concurrent = self.engine is not None or (self.database_type == 'sqlite' and self.filepath is not None)
+
+        def _run(sql: str, parameters: Optional[Union[dict, list]]) -> tuple:
+            start = time.perf_counter()
+            if not concurrent:
+                df = self.query(sql=sql, parameters=parameters, show_head=False, warn_is_none=False, compact_dtypes=compact_dtypes, downcast_floats=downcast_floats)
+            else:
+                self._before_execute(sql)
+                record = self._start_query_record(sql=sql, parameters=parameters, method='query_many')
+                try:
+                    if self.engine is not None:
+                        with self.engine.connect() as connection:
+                            df = self._sqlalchemy_query(sql=sql, parameters=parameters, connection=connection, record=record, compact_dtypes=compact_dtypes, downcast_floats=downcast_floats)
+                            connection.commit()
+                    else:
+                        connection = sqlite3.connect(database=self.filepath)
+                        if self.sqlite_performance_profile is not None:
+                            self._sqlite_pragmas(connection=connection, pragmas=self.SQLITE_PERFORMANCE_PROFILES[self.sqlite_performance_profile])
+                        try:
+                            df = self._access_sqlite_query(sql=sql, parameters=parameters, connection=connection, record=record, compact_dtypes=compact_dtypes, downcast_floats=downcast_floats)
+                            connection.commit()
+                        finally:
+                            connection.close()
+                except Exception as e:
+                    self._finish_query_record(record=record, error=e)
+                    raise e
+                if record is not None:
+                    record.add_result(df=df)
+                    self._finish_query_record(record=record)
+            if df is not None and len(df) == 0:
+                df = None
+            if df is not None and index is not None:
+                df.set_index(index, inplace=True)
+            return df, time.perf_counter() - start
+
+        if concurrent:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(lambda statement: _run(*statement), statements))
+        else:
+            results = [_run(*statement) for statement in statements]
+
+        self.recent_query_many_timings = [elapsed for _, elapsed in results]
+        return [df for df, _ in results]
+
     def rollback(self) -> None:
         """
-        Rolls back the database to its most recent state.
+        Rolls back the database to its most recent state. The schema cache and result cache are cleared as well because
+        the rolled back transaction may have contained CREATE, DROP or ALTER statements, or cached uncommitted data.
+
+        Within a transaction() block only the writes of the innermost block are rolled back (to its savepoint, or to the
+        most recent group commit of the outermost block) and the block stays open.
+
+        :return: None
+        """
+        state = getattr(self._transaction_local, 'state', None)
+        if state is not None:
+            self._transaction_rollback(state=state)
+        else:
+            self.db_conn.rollback()
+        self.invalidate_schema_cache()
+        if self.result_cache is not None:
+            self.result_cache.invalidate()
+
+    def sync_table(
+            self,
+            target: 'BaseDBPD',
+            table_name: str,
+            watermark_column: str,
+            key_columns: Optional[Union[str, list]] = None,
+            target_table_name: Optional[str] = None,
+            chunksize: int = 10000,
+            create_table: bool = True,
+            full_refresh: bool = False
+    ) -> int:
+        """
+        Incrementally copies a table of this database into a table of another database manager, only the rows whose
+        "watermark_column" (e.g. an auto-incrementing id or an updated_at timestamp) is beyond the high-water mark of the
+        previous sync are pulled. The high-water mark is stored in the SYNC_WATERMARK_TABLE of the target, which is created
+        if it does not exist. The rows are streamed from this database with query_iter() and applied in batches of
+        "chunksize" rows, and the whole sync runs in a single target transaction() together with the new high-water mark,
+        so a failed sync is rolled back and the next sync starts again from the previous high-water mark.
+
+        With "key_columns", rows are applied with upsert_dataframe() so that changed rows replace their previous version,
+        and rows equal to the high-water mark are pulled again (a row written with the same watermark value after the
+        previous sync is not missed). Without "key_columns", the table is treated as append-only: rows are inserted with
+        insert_dataframe() and only rows strictly beyond the high-water mark are pulled. Deleted rows are not synced.
+
+        If the target table does not exist and "create_table" is True, it is created from the dtypes of the first chunk
+        (see CREATE_TABLE_TYPES), with a unique index on the key columns for the upserts of later syncs.
+
+        Example:
+            synced = postgres.sync_table(target=sqlite, table_name='orders', watermark_column='updated_at', key_columns='order_id')
+
+        :param target: The database manager the rows should be synced to
+        :param table_name: The name of the table in this database
+        :param watermark_column: The column whose maximum is stored as the high-water mark, it should increase whenever a row is inserted (or changed)
+        :param key_columns: The column (or list of columns) that identifies a row, None for append-only tables
+        :param target_table_name: The name of the table in the target database, defaults to "table_name"
+        :param chunksize: The number of rows read and applied at a time
+        :param create_table: Boolean indicating if the table should be created in the target if it does not exist
+        :param full_refresh: Boolean indicating if the stored high-water mark should be ignored and all rows pulled again
+        :return: int - The number of rows pulled from this database
+        """
+        if chunksize < 1:
+            raise ValueError(f'"chunksize" must be a positive integer, got {chunksize}')
+        if isinstance(key_columns, str):
+            key_columns = [key_columns]
+        if target_table_name is None:
+            target_table_name = table_name
+        start = time.monotonic()
+        target_placeholder = '?' if target.database_type in ['access', 'sqlite'] else ':target_table'
+        target_parameters = [target_table_name.lower()] if target.database_type in ['access', 'sqlite'] else {'target_table': target_table_name.lower()}
+
+        synced = 0
+        with target.transaction():
+            if not target._table_exists(table_name=self.SYNC_WATERMARK_TABLE):
+                # IF NOT EXISTS where the dialect supports it, in case the table is outside of the listed schema
+                if_not_exists = ' IF NOT EXISTS' if target._dialect_name() in ['sqlite', 'postgresql', 'mysql'] else ''
+                target.query(
+                    sql=f"""CREATE TABLE{if_not_exists} {self.SYNC_WATERMARK_TABLE} (
+                        target_table VARCHAR(255) PRIMARY KEY,
+                        watermark_column VARCHAR(255),
+                        watermark VARCHAR(255),
+                        watermark_type VARCHAR(16),
+                        synced_at VARCHAR(32)
+                    )""",
+                    show_head=False,
+                    warn_is_none=False
+                )
+            previous = None
+            stored = target.query(
+                sql=f'SELECT watermark_column, watermark, watermark_type FROM {self.SYNC_WATERMARK_TABLE} WHERE target_table = {target_placeholder}',
+                parameters=target_parameters,
+                show_head=False,
+                warn_is_none=False
+            )
+            if stored is not None and not full_refresh:
+                stored_column, text, watermark_type = stored.iloc[0].tolist()
+                if str(stored_column).lower() != watermark_column.lower():
+                    raise ValueError(
+                        f'"{target_table_name}" was synced with the watermark column "{stored_column}", '
+                        f'use full_refresh=True to sync it with "{watermark_column}"'
+                    )
+                previous = self._sync_watermark_from_text(text=text, watermark_type=watermark_type)
+
+            sql = f'SELECT * FROM {table_name}'
+            parameters = None
+            if previous is not None:
+                # qmark parameters for the sqlite3 and pyodbc connections, named parameters for SQLAlchemy (see insert_values())
+                if self.database_type in ['access', 'sqlite']:
+                    sql += f' WHERE {watermark_column} {">=" if key_columns else ">"} ?'
+                    parameters = [previous]
+                else:
+                    sql += f' WHERE {watermark_column} {">=" if key_columns else ">"} :watermark'
+                    parameters = {'watermark': previous}
+
+            watermark = previous
+            for df in self.query_iter(sql=sql, parameters=parameters, chunksize=chunksize):
+                column = [i for i in df.columns if str(i).lower() == watermark_column.lower()]
+                if not column:
+                    raise ValueError(f'The watermark column "{watermark_column}" is not a column of "{table_name}"')
+                if synced == 0 and create_table and not target._table_exists(table_name=target_table_name):
+                    create_table_sql = target._generate_create_table_sql_from_dataframe(dataframe=df, table_name=target_table_name, dialect=target._dialect_name())
+                    target.query(sql=create_table_sql, show_head=False, warn_is_none=False)
+                    if key_columns:
+                        target.query(
+                            sql=f'CREATE UNIQUE INDEX ix_{target_table_name.replace(".", "_")}_sync_key ON {target_table_name} ({", ".join(key_columns)})',
+                            show_head=False,
+                            warn_is_none=False
+                        )
+                if key_columns:
+                    target.upsert_dataframe(table_name=target_table_name, dataframe=df, key_columns=key_columns, batch_size=chunksize)
+                else:
+                    target.insert_dataframe(table_name=target_table_name, dataframe=df, batch_size=chunksize)
+                synced += len(df)
+
+                chunk_watermark = df[column[0]].max()
+                if not self.isna(chunk_watermark) and (watermark is None or chunk_watermark > watermark):
+                    watermark = chunk_watermark
+
+            if watermark is not None and synced > 0:
+                text, watermark_type = self._sync_watermark_to_text(value=watermark)
+                target.query(
+                    sql=f'DELETE FROM {self.SYNC_WATERMARK_TABLE} WHERE target_table = {target_placeholder}',
+                    parameters=target_parameters,
+                    show_head=False,
+                    warn_is_none=False
+                )
+                target.insert_values(
+                    table_name=self.SYNC_WATERMARK_TABLE,
+                    target_table=target_table_name.lower(),
+                    watermark_column=watermark_column,
+                    watermark=text,
+                    watermark_type=watermark_type,
+                    synced_at=self.dt_now().isoformat(timespec='seconds')
+                )
+
+        self.recent_sync = {
+            'table_name': target_table_name,
+            'rows': synced,
+            'previous_watermark': previous,
+            'watermark': self.convert_numpy_value(watermark),
+            'seconds': time.monotonic() - start
+        }
+        return synced
+
+    @contextmanager
+    def transaction(self, commit_every_rows: Optional[int] = None, commit_every_seconds: Optional[float] = None) -> Iterator['BaseDBPD']:
+        """
+        Groups the writes within the block into as few commits as possible. Calls to commit() within the block (including
+        those made by drop_table(), init_table_schemas_from_sql(), import_file(), etc.) are deferred, the block commits
+        once when it ends and rolls back as a unit if it raises an exception. For sqlite3 the block begins its
+        transaction explicitly, so that DDL statements are rolled back with it. A rollback() within the block (including
+        those on the error paths of these methods) only rolls back the innermost block, which stays open.
+
+        For long-running writers, "commit_every_rows" and/or "commit_every_seconds" commit the block in groups: after a
+        write, once that many rows have been written (rows of insert_many(), insert_dataframe() and upsert_dataframe(),
+        and 1 per write statement run through query() such as insert_values()) or seconds have passed since the previous
+        commit. An exception then only rolls back the writes since the most recent group commit. Note that the seconds
+        are only checked when a write happens, there is no background timer.
+
+        Nested transaction() blocks use savepoints (SAVEPOINT for sqlite3, Session.begin_nested() for SQLAlchemy), an
+        exception in a nested block only rolls back that block and is re-raised. The thresholds of nested blocks are
+        ignored and no group commit happens while a nested block is open, the rows of a rolled back nested block are not
+        counted. MS Access does not support savepoints, nested blocks there are part of the outer block. Each thread has
+        its own transaction() blocks (see thread_safe).
+
+        Example:
+            with db.transaction(commit_every_rows=10000):
+                for row in rows:
+                    db.insert_values('events', **row)
+
+        The rows, commits and seconds of the most recent outermost block are stored in the "recent_transaction" attribute.
+
+        :param commit_every_rows: Commit once this many rows have been written since the previous commit
+        :param commit_every_seconds: Commit once this many seconds have passed since the previous commit
+        :return: Iterator - Yields the manager
+        """
+        state = getattr(self._transaction_local, 'state', None)
+        if state is None:
+            if commit_every_rows is not None and commit_every_rows < 1:
+                raise ValueError(f'"commit_every_rows" must be a positive integer, got {commit_every_rows}')
+            state = {
+                'commit_every_rows': commit_every_rows,
+                'commit_every_seconds': commit_every_seconds,
+                'rows': 0,
+                'pending_rows': 0,
+                'commits': 0,
+                'savepoints': [],
+                'started': time.monotonic(),
+                'last_commit': time.monotonic()
+            }
+            self._transaction_local.state = state
+            self._transaction_begin()
+            try:
+                yield self
+            except BaseException:
+                self._transaction_local.state = None
+                self.rollback()
+                raise
+            else:
+                self._transaction_local.state = None
+                self._transaction_commit(state=state, force=True)
+            finally:
+                self._transaction_local.state = None
+                self.recent_transaction = {
+                    'rows': state['rows'],
+                    'commits': state['commits'],
+                    'seconds': time.monotonic() - state['started']
+                }
+            return
+
+        if self.database_type == 'access':
+            yield self
+            return
+        # the rows written in the block no longer count once its savepoint is rolled back (no group commit happens in between)
+        state['savepoints'].append((self._transaction_savepoint(state=state), state['rows'], state['pending_rows']))
+        try:
+            yield self
+        except BaseException:
+            savepoint, state['rows'], state['pending_rows'] = state['savepoints'][-1]
+            try:
+                if self.engine is not None:
+                    savepoint.rollback()
+                else:
+                    self.db_conn.execute(f'ROLLBACK TO SAVEPOINT {savepoint}')
+                    self.db_conn.execute(f'RELEASE SAVEPOINT {savepoint}')
+            except Exception:
+                # the savepoint is gone (e.g. the connection itself was rolled back), the block's exception is raised instead
+                pass
+            self.invalidate_schema_cache()
+            if self.result_cache is not None:
+                self.result_cache.invalidate()
+            raise
+        else:
+            savepoint = state['savepoints'][-1][0]
+            if self.engine is not None:
+                savepoint.commit()
+            else:
+                self.db_conn.execute(f'RELEASE SAVEPOINT {savepoint}')
+        finally:
+            state['savepoints'].pop()
+
+    def upsert_dataframe(
+            self,
+            table_name: str,
+            dataframe: pd.DataFrame,
+            key_columns: Union[str, list],
+            update_columns: Optional[list] = None,
+            batch_size: int = 10000,
+            null_zeroes_for_columns: Optional[list] = None
+    ) -> int:
+        """
+        Inserts the rows of a DataFrame into a given table, rows whose key already exists in the table are updated instead.
+        A single "insert or update" statement of the database's dialect is prepared (see _upsert_statement()) and executed
+        with "batch_size" rows per round trip, so that a sync does not need a SELECT per key. The table needs a primary
+        key or unique constraint on the key columns (MySQL matches on any primary or unique key of the table).
+
+        Columns are matched case-insensitively and columns that are not in the table are ignored, the same as
+        insert_dataframe(). If the DataFrame contains the same key more than once, only the last of these rows is used.
+
+        Note that this method does not commit, use commit() afterwards (or rollback() on error).
+
+        :param table_name: The name of the table to insert or update values
+        :param dataframe: The DataFrame whose rows should be inserted or updated
+        :param key_columns: The column (or list of columns) that identifies a row
+        :param update_columns: The columns updated for existing rows, defaults to all non-key columns (an empty list only inserts new rows)
+        :param batch_size: The number of rows sent to the database per round trip
+        :param null_zeroes_for_columns: A list of columns where zeros should be nullified
+        :return: int - The number of affected rows as reported by the driver (MySQL counts an updated row twice), batches
+                       for which the driver does not report a count are counted by their number of rows
+        """
+        if batch_size < 1:
+            raise ValueError(f'"batch_size" must be a positive integer, got {batch_size}')
+        if isinstance(key_columns, str):
+            key_columns = [key_columns]
+        allowable_columns = self.column_names(table_name=table_name, show_names=False)
+        columns = [column for column in dataframe.columns if str(column).lower() in allowable_columns]
+        lower_columns = [str(column).lower() for column in columns]
+        keys = [str(column).lower() for column in key_columns]
+        missing = [column for column in keys if column not in lower_columns]
+        if not keys or missing:
+            raise ValueError(f'The key columns {missing or key_columns} must be columns of both the DataFrame and "{table_name}"')
+        if update_columns is None:
+            updates = [column for column in lower_columns if column not in keys]
+        else:
+            updates = [str(column).lower() for column in update_columns]
+            missing = [column for column in updates if column not in lower_columns or column in keys]
+            if missing:
+                raise ValueError(f'The update columns {missing} must be non-key columns of both the DataFrame and "{table_name}"')
+        if len(dataframe) == 0:
+            return 0
+
+        dataframe = dataframe[columns]
+        dataframe = dataframe[~dataframe.duplicated(subset=[columns[lower_columns.index(column)] for column in keys], keep='last')]
+        statement, sql, parameter_names = self._upsert_statement(table_name=table_name, columns=lower_columns, key_columns=keys, update_columns=updates)
+        self.recent_query = sql
+        self._before_execute(sql)
+        record = self._start_query_record(sql=sql, method='upsert_dataframe')
+        affected = 0
+        cursor = self.db_conn.cursor() if parameter_names is None else None
+        try:
+            for start in range(0, len(dataframe), batch_size):
+                batch = self.dataframe_to_db_rows(dataframe=dataframe.iloc[start:start + batch_size], null_zeroes_for_columns=null_zeroes_for_columns)
+                if cursor is not None:
+                    cursor.executemany(statement, batch)
+                    rowcount = cursor.rowcount
+                else:
+                    rowcount = self.db_conn.execute(statement, [dict(zip(parameter_names, row)) for row in batch]).rowcount
+                affected += rowcount if rowcount is not None and rowcount >= 0 else len(batch)
+        except Exception as e:
+            self._finish_query_record(record=record, error=e)
+            raise e
+        finally:
+            if cursor is not None:
+                cursor.close()
+        if record is not None:
+            record.rows = affected
+            self._finish_query_record(record=record)
+        # the group commit counts the input rows, as the affected count depends on the driver (MySQL counts updates twice)
+        self._transaction_write(rows=len(dataframe))
+        return affected
+
+    # Instrumentation methods ##########################################################################################
+    def add_query_hook(self, pre_execute: Optional[callable] = None, post_execute: Optional[callable] = None) -> None:
+        """
+        Registers functions that are called around every statement executed by query(), query_iter(), query_many(),
+        aquery(), insert_many() and insert_dataframe(), for the sqlite3, pyodbc and SQLAlchemy connections alike.
+
+        Each function is called with a single dbpd.QueryRecord argument. Pre-execute hooks are called before the statement
+        runs (the sql and parameters are set), post-execute hooks after it has finished or raised an exception (the
+        execute, fetch and DataFrame-build times, row count, result bytes and error are set).
+
+        Example:
+            def log_slow(record):
+                if record.total_seconds > 5:
+                    print(f'{record.total_seconds:.1f}s {record.normalized_sql}')
+
+            db.add_query_hook(post_execute=log_slow)
+
+        :param pre_execute: A function to be called before each statement
+        :param post_execute: A function to be called after each statement
+        :return: None
+        """
+        if pre_execute is not None:
+            self._pre_execute_hooks.append(pre_execute)
+        if post_execute is not None:
+            self._post_execute_hooks.append(post_execute)
+
+    def disable_query_stats(self) -> None:
+        """
+        Stops collecting query statistics.
+
+        :return: None
+        """
+        self.query_stats = None
+
+    def enable_query_stats(self, window: int = 1000, max_records: int = 1000, deep_memory: bool = False) -> QueryStats:
+        """
+        Starts collecting a rolling statistics table of the executed statements, grouped by their normalized sql
+        (whitespace collapsed). See query_stats_df() and query_records_df().
+
+        :param window: The number of most recent durations kept per statement for the p50/p95
+        :param max_records: The number of most recent individual QueryRecords kept
+        :param deep_memory: Boolean indicating if the result bytes should include the memory of Python objects such as strings (slower)
+        :return: QueryStats - The statistics object
+        """
+        self.query_stats = QueryStats(window=window, max_records=max_records, deep_memory=deep_memory)
+        return self.query_stats
+
+    def pool_stats(self) -> Optional[dict]:
+        """
+        Returns the state and statistics of the SQLAlchemy engine's connection pool: the connections checked out, idle
+        (checked in) and in overflow, the number of checkouts, checkins, new connections and pool timeouts, and the time
+        spent waiting for a connection from the pool (see EngineRegistry.pool_stats()). Waits that are long compared to
+        the query durations (see query_stats_df()) point at pool starvation rather than slow sql. The statistics of a
+        shared engine include the checkouts of every manager that shares it. Returns None if there is no engine.
+
+        :return: dict or None
+        """
+        if self.engine is None:
+            return None
+        return ENGINE_REGISTRY.pool_stats(engine=self.engine)
+
+    def query_records_df(self) -> Optional[pd.DataFrame]:
+        """
+        Returns the most recent individual statements (one row per QueryRecord), or None if query stats are not enabled.
+
+        :return: DataFrame or None
+        """
+        if self.query_stats is None:
+            return None
+        return self.query_stats.records_dataframe()
+
+    def query_stats_df(self) -> Optional[pd.DataFrame]:
+        """
+        Returns the slow-query log: count, errors, rows, result bytes and the mean/p50/p95/max seconds per normalized sql
+        statement, slowest (by p95) first. Returns None if query stats are not enabled.
+
+        :return: DataFrame or None
+        """
+        if self.query_stats is None:
+            return None
+        return self.query_stats.to_dataframe()
+
+    def remove_query_hook(self, hook: callable) -> None:
+        """
+        Removes a function registered with add_query_hook().
+
+        :param hook: The pre-execute or post-execute function
+        :return: None
+        """
+        self._pre_execute_hooks = [i for i in self._pre_execute_hooks if i is not hook]
+        self._post_execute_hooks = [i for i in self._post_execute_hooks if i is not hook]
+
+    # Result cache methods ##########################################################################################
+    def clear_result_cache(self) -> None:
+        """
+        Removes every cached query result (in memory and on disk).
 
         :return: None
         """
-        self.db_conn.rollback()
+        if self.result_cache is not None:
+            self.result_cache.clear()
+
+    def disable_result_cache(self, clear: bool = False) -> None:
+        """
+        Stops caching query results.
+
+        :param clear: Boolean indicating if the cached results should also be removed (including on-disk results)
+        :return: None
+        """
+        if clear:
+            self.clear_result_cache()
+        self.result_cache = None
+
+    def enable_result_cache(
+            self,
+            max_bytes: int = 256 * 1024 * 1024,
+            ttl: Optional[float] = 300.0,
+            disk_dir: Optional[str] = None,
+            disk_format: Literal['parquet', 'feather'] = 'parquet'
+    ) -> ResultCache:
+        """
+        Turns on caching of SELECT results for query(). Repeated calls with the same sql (ignoring whitespace differences)
+        and parameters return a copy of the cached DataFrame without going to the database.
+
+        Cached results are invalidated when a write statement run through this manager touches one of their tables, and
+        all results are invalidated by DDL statements and rollback(). Changes made by other connections are only picked up
+        once the ttl expires, pass use_cache=False to query() to bypass the cache for a single call.
+
+        :param max_bytes: The maximum total size (in bytes) of the DataFrames kept in memory, least recently used results are evicted first
+        :param ttl: The number of seconds a result stays valid, None for no expiry
+        :param disk_dir: A directory where results are also stored as files so that they survive restarts, None to keep results in memory only
+        :param disk_format: Either 'parquet' or 'feather' (both require pyarrow)
+        :return: ResultCache - The cache object
+        """
+        if self.filepath is not None:
+            namespace = self.filepath
+        elif self.engine is not None:
+            namespace = self.engine.url.render_as_string(hide_password=True)
+        else:
+            namespace = f':memory:{id(self)}'
+        self.result_cache = ResultCache(max_bytes=max_bytes, ttl=ttl, disk_dir=disk_dir, disk_format=disk_format, namespace=namespace)
+        return self.result_cache
+
+    def result_cache_info(self) -> Optional[dict]:
+        """
+        Returns the statistics of the result cache, or None if the result cache is not enabled.
+
+        :return: dict - The hits, misses, evictions, invalidations, number of entries and size in bytes
+        """
+        if self.result_cache is None:
+            return None
+        return self.result_cache.info()
 
     # Info methods ##########################################################################################
+    def invalidate_schema_cache(self, table_name: Optional[str] = None) -> None:
+        """
+        Clears cached table and column names so that the next call to table_names() or column_names() queries the database.
+        This is done automatically when CREATE, DROP, ALTER or RENAME statements are run through query() and on rollback(),
+        but should be called manually if the schema is changed by another connection.
+
+        :param table_name: If passed, only the cached column names of this table (and the table names) are cleared
+        :return: None
+        """
+        with self._schema_cache_lock:
+            if table_name is None:
+                self._schema_cache.clear()
+            else:
+                self._schema_cache.pop(('tables',), None)
+                self._schema_cache.pop(('columns', table_name.lower()), None)
+                self._schema_cache.pop(('column_types', table_name.lower()), None)
+
+    def schema_cache_info(self) -> dict:
+        """
+        Returns the statistics of the table and column name cache.
+
+        :return: dict - The hits, misses, current number of cached entries and the ttl (in seconds)
+        """
+        with self._schema_cache_lock:
+            return {
+                'hits': self.schema_cache_hits,
+                'misses': self.schema_cache_misses,
+                'entries': len(self._schema_cache),
+                'ttl': self.schema_cache_ttl
+            }
+
+    def clear_statement_cache(self) -> None:
+        """
+        Removes every text() construct from the SQLAlchemy statement cache.
+
+        :return: None
+        """
+        with self._statement_cache_lock:
+            self._statement_cache.clear()
+
+    def statement_cache_info(self) -> dict:
+        """
+        Returns the statistics of the SQLAlchemy statement cache (see _text()).
+
+        :return: dict - The hits, misses, current number of cached statements and the maximum size
+        """
+        return {
+            'hits': self.statement_cache_hits,
+            'misses': self.statement_cache_misses,
+            'entries': len(self._statement_cache),
+            'max_size': self.STATEMENT_CACHE_SIZE
+        }
+
     def column_names(self, table_name: str, show_names: bool = False) -> list:
         """
         Returns a list of column names for a given table.
@@ -1015,4 +3575,188 @@ class BaseDBPD(object):
         return self._info_query_list(
             info_type='tables',
             show_names=show_names
-        )
\ No newline at end of file
+        )
+
+    # Async methods ##########################################################################################
+    def _get_async_engine(self) -> 'AsyncEngine':
+        """
+        Creates (on first use) the async SQLAlchemy engine and session. The async URL is the sync engine's URL with the
+        driver replaced according to ASYNC_DRIVERS, unless "async_connection_credentials" has been set. In-memory SQLite
+        URLs ("sqlite://") are rejected, as the async engine would connect to a different database than the sync engine.
+
+        :return: AsyncEngine
+        """
+        if self.async_engine is None:
+            from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+            if self.async_connection_credentials is not None:
+                url = self.async_connection_credentials
+            else:
+                backend = self.engine.url.get_backend_name()
+                if backend not in self.ASYNC_DRIVERS:
+                    raise ValueError(f'No async driver is known for "{backend}", set the "async_connection_credentials" attribute')
+                if backend == 'sqlite' and self.engine.url.database in [None, '', ':memory:']:
+                    # each connection to ":memory:" opens its own database, the async engine would not see the sync one's tables
+                    raise ValueError(
+                        'The async methods cannot use an in-memory SQLite database of a SQLAlchemy engine, as the async '
+                        'engine would connect to a new, empty database. Use a database file or SQLiteInMemory instead'
+                    )
+                url = self.engine.url.set(drivername=self.ASYNC_DRIVERS[backend]).difference_update_query(['threaded'])
+            self.async_engine = create_async_engine(url)
+            self.async_db_conn = async_sessionmaker(bind=self.async_engine)()
+        return self.async_engine
+
+    async def _run_in_async_executor(self, func: callable, **kwargs) -> Any:
+        """
+        Runs a blocking method in this manager's single worker thread, used by the async methods for sqlite3 and pyodbc
+        connections. Using one thread keeps the calls in order and off of the event loop. On first use, a sqlite3
+        connection is reopened so that the worker thread may use it (see _share_sqlite_connection()).
+
+        :param func: The method to be run
+        :param kwargs: The keyword arguments of the method
+        :return: The return value of the method
+        """
+        if self._async_executor is None:
+            self._share_sqlite_connection()
+            self._async_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='dbpd-async')
+        import asyncio
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._async_executor, partial(func, **kwargs))
+
+    async def aclose(self, commit_on_quit: bool = True) -> None:
+        """
+        The async version of close(), closes the async session and engine (if any) as well as the sync connection.
+
+        :param commit_on_quit: Boolean indicating if a final commit should be transacted before close
+        :return: None
+        """
+        if self.async_db_conn is not None:
+            if commit_on_quit:
+                await self.async_db_conn.commit()
+            await self.async_db_conn.close()
+            await self.async_engine.dispose()
+            self.async_db_conn = None
+            self.async_engine = None
+        await self._run_in_async_executor(self.close, commit_on_quit=commit_on_quit)
+        self._async_executor.shutdown(wait=False)
+        self._async_executor = None
+
+    async def acolumn_names(self, table_name: str) -> list:
+        """
+        The async version of column_names(), the schema cache is shared with the sync methods.
+
+        :param table_name: The name of the table in which the column names should be queried
+        :return: list - The list of the column names
+        """
+        if self.engine is None:
+            return await self._run_in_async_executor(self.column_names, table_name=table_name, show_names=False)
+        cache_key = ('columns', table_name.lower())
+        info = self._schema_cache_get(cache_key=cache_key)
+        if info is None:
+            df = await self.aquery(sql=self._info_query_sql(info_type='columns', table_name=table_name), warn_is_none=False)
+            info = [] if df is None else [i.lower() for i in df['name'].tolist()]
+            self._schema_cache_set(cache_key=cache_key, info=info)
+        return info
+
+    async def acommit(self) -> None:
+        """
+        The async version of commit()
+
+        :return: None
+        """
+        if self.engine is None:
+            await self._run_in_async_executor(self.commit)
+        elif self.async_db_conn is not None:
+            await self.async_db_conn.commit()
+
+    async def ainsert_values(self, table_name: str, **column_value_pairs) -> None:
+        """
+        The async version of insert_values()
+
+        :param table_name: The name of the table to insert values
+        :param column_value_pairs: Keyword arguments that represent the column names and their respective values
+        :return: None
+        """
+        allowable_columns = await self.acolumn_names(table_name=table_name)
+        sql, column_value_pairs = self._insert_values_sql(table_name=table_name, allowable_columns=allowable_columns, column_value_pairs=column_value_pairs)
+        await self.aquery(sql=sql, parameters=column_value_pairs, warn_is_none=False)
+
+    async def aquery(
+            self,
+            sql: str,
+            parameters: Optional[Union[dict, list]] = None,
+            index: Optional[Union[str, list]] = None,
+            warn_is_none: bool = True
+    ) -> Optional[pd.DataFrame]:
+        """
+        The async version of query(), it returns the same DataFrames (or None) without blocking the event loop.
+
+        Databases connected through SQLAlchemy use an async engine and session (AsyncSession) alongside the sync ones, an async
+        driver must be installed for this (asyncpg, aiomysql, oracledb or aiosqlite, see ASYNC_DRIVERS). Like the sync session,
+        changes need to be committed with acommit(). In-memory SQLite URLs ("sqlite://") are not supported, as the async
+        engine cannot open the sync engine's database (use SQLiteInMemory). SQLite and MS Access calls are run in a worker
+        thread instead, for which the first async call reopens a SQLite connection with check_same_thread=False (commit or
+        roll back pending changes before it, see _share_sqlite_connection()).
+
+        Note that one manager's async session should not be used by several tasks at the same time, await each call
+        (or use one manager per task).
+
+        :param sql: The sql statement to be executed
+        :param parameters: The parameters associated with a parameterized query
+        :param index: Can be used to set the index of the resulting DataFrame
+        :param warn_is_none: Boolean indicating if a warning should be printed to the console when the query returns zero results
+        :return: DataFrame or None
+        """
+        if self.engine is None:
+            return await self._run_in_async_executor(self.query, sql=sql, parameters=parameters, show_head=False, index=index, warn_is_none=warn_is_none)
+
+        self._get_async_engine()
+        self.recent_query = sql
+        self._before_execute(sql)
+        record = self._start_query_record(sql=sql, parameters=parameters, method='aquery')
+        df = None
+        try:
+            start = time.perf_counter()
+            executed = await self.async_db_conn.execute(self._text(sql), parameters)
+            fetched = time.perf_counter()
+            if executed.returns_rows:
+                data = executed.fetchall()
+                built = time.perf_counter()
+                try:
+                    df = pd.DataFrame(data=data, columns=list(executed.keys()))
+                except ValueError:
+                    pass  # df defaults to None
+                if record is not None:
+                    record.fetch_seconds += built - fetched
+                    record.build_seconds += time.perf_counter() - built
+            if record is not None:
+                record.execute_seconds += fetched - start
+        except Exception as e:
+            self._finish_query_record(record=record, error=e)
+            raise e
+        if record is not None:
+            record.add_result(df=df)
+            self._finish_query_record(record=record)
+
+        if df is None or len(df) == 0:
+            if warn_is_none:
+                self._warn(f'Query returned zero results, return object will be None')
+            return None
+        if index is not None:
+            df.set_index(index, inplace=True)
+        self.recent_df = df
+        return df
+
+    async def arollback(self) -> None:
+        """
+        The async version of rollback()
+
+        :return: None
+        """
+        if self.engine is None:
+            await self._run_in_async_executor(self.rollback)
+        elif self.async_db_conn is not None:
+            await self.async_db_conn.rollback()
+            self.invalidate_schema_cache()
+            if self.result_cache is not None:
+                self.result_cache.invalidate()
@@ -0,0 +1,241 @@
+import hashlib
+import threading
+import time
+import weakref
+
+import pandas as pd
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine, URL
+
+
+class EngineRegistry(object):
+    """
+    A process-wide registry of SQLAlchemy engines, so that short-lived database managers of the same database share one
+    engine and its connection pool instead of connecting (and disposing of the pool) every time. Engines are keyed by
+    their URL and sqlalchemy.create_engine() keyword arguments. Use the ENGINE_REGISTRY instance of this module through
+    the "shared_engine" argument of BaseDBPD (and Postgres, MySQL, Oracle) rather than creating this class directly.
+
+    Every engine created by a BaseDBPD (shared or not) is also tracked for pool statistics: the number of checkouts,
+    checkins, new connections and pool timeouts, and the time spent waiting for a connection from the pool. A high wait
+    time (or timeouts) with all connections checked out points at pool starvation, rather than at slow sql.
+    """
+
+    STATS_COLUMNS = [
+        'url', 'pool', 'size', 'checked_out', 'checked_in', 'overflow', 'checkouts', 'checkins', 'connects', 'timeouts',
+        'wait_seconds', 'mean_wait_seconds', 'max_wait_seconds'
+    ]
+
+    def __init__(self):
+        # (url without password, sha256 of url and create_engine kwargs) -> Engine
+        self._engines = {}
+        # Engine -> {'checkouts', 'checkins', 'connects', 'waits', 'timeouts', 'wait_seconds', 'max_wait_seconds'}
+        self._stats = weakref.WeakKeyDictionary()
+        self._lock = threading.RLock()
+
+    # Private methods ##############################################################################################
+    @staticmethod
+    def _empty_stats() -> dict:
+        """
+        Returns the statistics of an engine before its first checkout
+        """
+        return {'checkouts': 0, 'checkins': 0, 'connects': 0, 'waits': 0, 'timeouts': 0, 'wait_seconds': 0.0, 'max_wait_seconds': 0.0}
+
+    @staticmethod
+    def _key(url: Union[str, 'URL'], create_engine_kwargs: dict) -> tuple:
+        """
+        Returns the registry key of an engine: the URL without its password and a sha256 digest of the full URL and the
+        kwargs (compared by their repr as they can hold unhashable values such as a "connect_args" dict), so that the
+        registry does not hold credentials in plain text
+        """
+        from sqlalchemy.engine import make_url
+        url = make_url(url)
+        digest = hashlib.sha256(
+            f'{url.render_as_string(hide_password=False)}\n{sorted(create_engine_kwargs.items())!r}'.encode()
+        ).hexdigest()
+        return url.render_as_string(hide_password=True), digest
+
+    @staticmethod
+    def _pool_value(pool, method: str) -> Optional[int]:
+        """
+        Returns the result of a status method of a pool (size(), checkedin(), checkedout(), overflow()), or None if the
+        pool class does not have the method
+        """
+        value = getattr(pool, method, None)
+        return value() if callable(value) else None
+
+    def _time_pool(self, pool, stats: dict) -> None:
+        """
+        Times the wait of every connection taken from a pool. There is no pool event before a checkout, so the pool's
+        public connect() (which blocks until a connection is returned to a full pool, or opens a new connection) is
+        wrapped on the pool instance. engine.dispose() replaces the pool, track() calls this again for the new pool.
+
+        :param pool: The pool of the engine
+        :param stats: The statistics of the engine
+        :return: None
+        """
+        from sqlalchemy import exc
+        connect = pool.connect
+        lock = self._lock
+
+        def _timed_connect():
+            start = time.perf_counter()
+            timed_out = False
+            try:
+                return connect()
+            except exc.TimeoutError:
+                timed_out = True
+                raise
+            finally:
+                wait = time.perf_counter() - start
+                with lock:
+                    stats['waits'] += 1
+                    stats['timeouts'] += timed_out
+                    stats['wait_seconds'] += wait
+                    stats['max_wait_seconds'] = max(stats['max_wait_seconds'], wait)
+
+        pool.connect = _timed_connect
+
+    # Public methods ###############################################################################################
+    def dispose(self, engine: Optional['Engine'] = None) -> None:
+        """
+        Disposes of a shared engine (closing its pooled connections) and removes it from the registry, or of every shared
+        engine if "engine" is None. Managers that still use a disposed engine reconnect on their next statement.
+
+        :param engine: The engine, None for all engines
+        :return: None
+        """
+        with self._lock:
+            keys = [key for key, value in self._engines.items() if engine is None or value is engine]
+            engines = [self._engines.pop(key) for key in keys]
+        for i in engines:
+            i.dispose()
+
+    def engines(self) -> list:
+        """
+        Returns the shared engines of the registry
+
+        :return: list of Engines
+        """
+        with self._lock:
+            return list(self._engines.values())
+
+    def get_engine(self, url: Union[str, 'URL'], **create_engine_kwargs) -> 'Engine':
+        """
+        Returns the shared engine of a URL and keyword arguments, it is created with sqlalchemy.create_engine() (and
+        tracked for pool statistics) on first use
+
+        :param url: The SQLAlchemy URL of the database
+        :param create_engine_kwargs: Keyword arguments for sqlalchemy.create_engine()
+        :return: Engine
+        """
+        key = self._key(url=url, create_engine_kwargs=create_engine_kwargs)
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is None:
+                import sqlalchemy
+                engine = sqlalchemy.create_engine(url=url, **create_engine_kwargs)
+                self.track(engine=engine)
+                self._engines[key] = engine
+        return engine
+
+    def pool_stats(self, engine: 'Engine') -> dict:
+        """
+        Returns the current state and the statistics of an engine's connection pool. The size, checked_in and overflow
+        are None for pools that do not have them (e.g. NullPool). The wait seconds are the time spent getting a
+        connection from the pool, including connecting when the pool opens a new connection.
+
+        :param engine: The engine
+        :return: dict - With the keys of STATS_COLUMNS
+        """
+        pool = engine.pool
+        with self._lock:
+            stats = dict(self._stats.get(engine) or self._empty_stats())
+        overflow = self._pool_value(pool=pool, method='overflow')
+        return {
+            'url': engine.url.render_as_string(hide_password=True),
+            'pool': type(pool).__name__,
+            'size': self._pool_value(pool=pool, method='size'),
+            'checked_out': self._pool_value(pool=pool, method='checkedout'),
+            'checked_in': self._pool_value(pool=pool, method='checkedin'),
+            'overflow': None if overflow is None else max(overflow, 0),
+            'checkouts': stats['checkouts'],
+            'checkins': stats['checkins'],
+            'connects': stats['connects'],
+            'timeouts': stats['timeouts'],
+            'wait_seconds': stats['wait_seconds'],
+            'mean_wait_seconds': stats['wait_seconds'] / stats['waits'] if stats['waits'] else 0.0,
+            'max_wait_seconds': stats['max_wait_seconds']
+        }
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Returns the pool statistics of every shared engine as a DataFrame, one row per engine
+
+        :return: DataFrame
+        """
+        return pd.DataFrame(data=[self.pool_stats(engine=engine) for engine in self.engines()], columns=self.STATS_COLUMNS)
+
+    def track(self, engine: 'Engine') -> 'Engine':
+        """
+        Starts collecting pool statistics for an engine (see pool_stats()). Engines that are already tracked are left as is.
+        The checkouts, checkins and new connections are counted with pool events, the waits are timed around the pool's
+        connect() and the timing is attached again to the new pool when the engine is disposed.
+
+        :param engine: The engine
+        :return: Engine - The same engine
+        """
+        from sqlalchemy import event
+        with self._lock:
+            if engine in self._stats:
+                return engine
+            stats = self._empty_stats()
+            self._stats[engine] = stats
+        lock = self._lock
+
+        def _counter(name: str) -> callable:
+            def _count(*args):
+                with lock:
+                    stats[name] += 1
+            return _count
+
+        # pool listeners are carried over to the pool that replaces a disposed one
+        event.listen(engine.pool, 'checkout', _counter('checkouts'))
+        event.listen(engine.pool, 'checkin', _counter('checkins'))
+        event.listen(engine.pool, 'connect', _counter('connects'))
+        event.listen(engine, 'engine_disposed', lambda disposed: self._time_pool(pool=disposed.pool, stats=stats))
+        self._time_pool(pool=engine.pool, stats=stats)
+        return engine
+
+    @classmethod
+    def warm_up(cls, engine: 'Engine', connections: int) -> int:
+        """
+        Opens connections of an engine's pool ahead of time (concurrently, so the handshakes overlap), so that the first
+        statements do not pay for connecting. Connections already idle in the pool count towards "connections", and the
+        pool only keeps up to its "pool_size" idle connections. Pools that do not keep idle connections for every thread
+        (such as the SingletonThreadPool of an in-memory SQLite engine) are not warmed up.
+
+        :param engine: The engine
+        :param connections: The number of idle connections the pool should hold
+        :return: int - The number of connections opened
+        """
+        size = cls._pool_value(pool=engine.pool, method='size')
+        checked_in = cls._pool_value(pool=engine.pool, method='checkedin')
+        if size is None or checked_in is None:
+            # pools without idle connections to share between threads (NullPool, SingletonThreadPool, StaticPool)
+            return 0
+        needed = min(connections, size) - checked_in
+        if needed <= 0:
+            return 0
+        with ThreadPoolExecutor(max_workers=needed) as executor:
+            opened = list(executor.map(lambda _: engine.raw_connection(), range(needed)))
+        for connection in opened:
+            connection.close()
+        return len(opened)
+
+
+# The registry shared by every BaseDBPD of the process
+ENGINE_REGISTRY = EngineRegistry()
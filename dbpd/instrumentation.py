@@ -0,0 +1,200 @@
+import datetime
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from collections import deque
+from typing import Optional, Union
+
+
+class QueryRecord(object):
+    """
+    The timing and size measurements of a single statement executed by a BaseDBPD manager. Records are passed to the
+    pre-execute hooks (before execution, only "sql", "parameters", "method", "driver" and "started" are set) and
+    to the post-execute hooks (after execution, or after the statement raised an exception).
+
+    Attributes:
+        sql:             The sql statement
+        normalized_sql:  The sql statement with all whitespace collapsed, used to group statements in QueryStats
+        parameters:      The parameters associated with a parameterized query
+        method:          The BaseDBPD method that executed the statement (query, query_iter, query_many, aquery, insert_many, upsert_dataframe)
+        driver:          'sqlite3', 'pyodbc' or 'sqlalchemy'
+        started:         The datetime at which the statement started
+        cached:          True if the result came from the result cache
+        execute_seconds: Seconds spent executing the statement
+        fetch_seconds:   Seconds spent fetching rows from the cursor
+        build_seconds:   Seconds spent building the DataFrame
+        total_seconds:   Seconds from start to finish
+        rows:            The number of rows returned (or inserted, or affected by upsert_dataframe())
+        result_bytes:    The memory usage of the resulting DataFrame(s)
+        error:           The exception raised by the statement, if any
+    """
+
+    COLUMNS = [
+        'started', 'method', 'driver', 'sql', 'cached', 'execute_seconds', 'fetch_seconds',
+        'build_seconds', 'total_seconds', 'rows', 'result_bytes', 'error'
+    ]
+
+    def __init__(
+            self,
+            sql: str,
+            parameters: Optional[Union[dict, list]] = None,
+            method: str = 'query',
+            driver: str = 'sqlalchemy',
+            deep_memory: bool = False
+    ):
+        self.sql = sql
+        self.normalized_sql = ' '.join(sql.split())
+        self.parameters = parameters
+        self.method = method
+        self.driver = driver
+        self.started = datetime.datetime.now()
+        self.cached = False
+        self.execute_seconds = 0.0
+        self.fetch_seconds = 0.0
+        self.build_seconds = 0.0
+        self.total_seconds = 0.0
+        self.rows = 0
+        self.result_bytes = 0
+        self.error: Optional[BaseException] = None
+        self.deep_memory = deep_memory
+        self._start = time.perf_counter()
+
+    def __repr__(self):
+        return f'<QueryRecord {self.method} {self.total_seconds:.6f}s rows={self.rows} "{self.normalized_sql[:60]}">'
+
+    def add_result(self, df: Optional[pd.DataFrame]) -> None:
+        """
+        Adds the row count and memory usage of a resulting DataFrame (called once per chunk by query_iter()). The memory
+        of Python objects (e.g. strings) is only measured if the record was created with deep_memory=True, as it is slower.
+
+        :param df: The resulting DataFrame or None
+        :return: None
+        """
+        if df is not None:
+            self.rows += len(df)
+            self.result_bytes += int(df.memory_usage(index=True, deep=self.deep_memory).sum())
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """
+        Sets the total elapsed time and the exception (if any)
+
+        :param error: The exception raised by the statement
+        :return: None
+        """
+        self.total_seconds = time.perf_counter() - self._start
+        self.error = error
+
+    def to_dict(self) -> dict:
+        """
+        Returns the record as a dictionary
+
+        :return: dict
+        """
+        return {
+            'started': self.started,
+            'method': self.method,
+            'driver': self.driver,
+            'sql': self.normalized_sql,
+            'cached': self.cached,
+            'execute_seconds': self.execute_seconds,
+            'fetch_seconds': self.fetch_seconds,
+            'build_seconds': self.build_seconds,
+            'total_seconds': self.total_seconds,
+            'rows': self.rows,
+            'result_bytes': self.result_bytes,
+            'error': None if self.error is None else repr(self.error)
+        }
+
+
+class QueryStats(object):
+    """
+    A rolling, in-process statistics table of the statements executed by a BaseDBPD manager. Use
+    BaseDBPD.enable_query_stats() rather than creating this class directly.
+
+    For every normalized sql statement the most recent "window" durations are kept to compute the p50/p95, and
+    the most recent "max_records" QueryRecords are kept as a log of individual statements.
+
+    :param window: The number of durations kept per normalized sql statement
+    :param max_records: The number of individual QueryRecords kept
+    :param deep_memory: Boolean indicating if result_bytes should include the memory of Python objects (slower)
+    """
+
+    def __init__(self, window: int = 1000, max_records: int = 1000, deep_memory: bool = False):
+        self.window = window
+        self.max_records = max_records
+        self.deep_memory = deep_memory
+        self.records = deque(maxlen=max_records)
+        # normalized sql -> {'count', 'errors', 'rows', 'result_bytes', 'total_seconds', 'durations'}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def add(self, record: QueryRecord) -> None:
+        """
+        Adds a finished QueryRecord to the statistics
+
+        :param record: The QueryRecord
+        :return: None
+        """
+        with self._lock:
+            self.records.append(record)
+            stats = self._stats.get(record.normalized_sql)
+            if stats is None:
+                stats = {'count': 0, 'errors': 0, 'cached': 0, 'rows': 0, 'result_bytes': 0, 'total_seconds': 0.0, 'durations': deque(maxlen=self.window)}
+                self._stats[record.normalized_sql] = stats
+            stats['count'] += 1
+            stats['errors'] += record.error is not None
+            stats['cached'] += record.cached
+            stats['rows'] += record.rows
+            stats['result_bytes'] += record.result_bytes
+            stats['total_seconds'] += record.total_seconds
+            stats['durations'].append(record.total_seconds)
+
+    def clear(self) -> None:
+        """
+        Removes all statistics and records
+
+        :return: None
+        """
+        with self._lock:
+            self.records.clear()
+            self._stats.clear()
+
+    def records_dataframe(self) -> pd.DataFrame:
+        """
+        Returns the most recent QueryRecords as a DataFrame, one row per executed statement
+
+        :return: DataFrame
+        """
+        with self._lock:
+            records = [record.to_dict() for record in self.records]
+        return pd.DataFrame(data=records, columns=QueryRecord.COLUMNS)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Returns the statistics per normalized sql statement as a DataFrame sorted by the p95 duration (slowest first)
+
+        :return: DataFrame
+        """
+        columns = ['sql', 'count', 'errors', 'cached', 'rows', 'result_bytes', 'total_seconds', 'mean_seconds', 'p50_seconds', 'p95_seconds', 'max_seconds']
+        data = []
+        with self._lock:
+            for sql, stats in self._stats.items():
+                durations = np.fromiter(stats['durations'], dtype=float)
+                data.append([
+                    sql,
+                    stats['count'],
+                    stats['errors'],
+                    stats['cached'],
+                    stats['rows'],
+                    stats['result_bytes'],
+                    stats['total_seconds'],
+                    stats['total_seconds'] / stats['count'],
+                    float(np.percentile(durations, 50)),
+                    float(np.percentile(durations, 95)),
+                    float(durations.max())
+                ])
+        df = pd.DataFrame(data=data, columns=columns)
+        return df.sort_values(by='p95_seconds', ascending=False, ignore_index=True)
@@ -1,4 +1,4 @@
-from .dbpd import BaseDBPD, Optional
+from .dbpd import BaseDBPD, Optional, Union
 
 
 class Postgres(BaseDBPD):
@@ -15,6 +15,9 @@ class Postgres(BaseDBPD):
     :param port: The port at which the database can be located
     :param description: A description of the database (for reference utility only)
     :param show_description: Whether the description should be printed to the console upon init
+    :param thread_safe: Gives every thread its own connection (or Session), so that the manager can be used from several threads (see BaseDBPD.db_conn)
+    :param shared_engine: Reuses the process-wide engine (and connection pool) of the same credentials, close() then keeps the pool open (see EngineRegistry)
+    :param warm_up_connections: The number of pooled connections opened at init, so that the first statements do not pay for connecting
     :param sqlalchemy_create_engine_kwargs: Any keyword arguments that should be passed to the sqlalchemy.create_engine() function
     """
     def __init__(
@@ -25,9 +28,12 @@ class Postgres(BaseDBPD):
             database_name: str,
             postgres_schema: str = 'public',
             port: Optional[int] = None,
-            fernet_encryption_key: Optional[bytes] = None,
+            fernet_encryption_key: Optional[Union[bytes, list]] = None,
             description: str = 'Postgres database connection with credentials',
             show_description: bool = True,
+            thread_safe: bool = False,
+            shared_engine: bool = False,
+            warm_up_connections: int = 0,
             **sqlalchemy_create_engine_kwargs
     ):
         if port is None:
@@ -42,6 +48,9 @@ class Postgres(BaseDBPD):
             fernet_encryption_key=fernet_encryption_key,
             description=description,
             show_description=show_description,
+            thread_safe=thread_safe,
+            shared_engine=shared_engine,
+            warm_up_connections=warm_up_connections,
             **sqlalchemy_create_engine_kwargs
         )
 
@@ -0,0 +1,365 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+import pandas as pd
+
+from collections import OrderedDict
+from typing import Literal, Optional, Union
+
+
+class ResultCache(object):
+    """
+    A least-recently-used cache of query results (DataFrames) for BaseDBPD.query(), keyed on the normalized sql
+    statement plus its parameters. Use BaseDBPD.enable_result_cache() rather than creating this class directly.
+
+    The in-memory tier is bounded by the total DataFrame size in bytes (memory_usage(deep=True)), the least recently
+    used results are evicted first. If a "disk_dir" is given, results are also written to Parquet or Feather files
+    in that directory (with a small JSON sidecar file holding the tables and creation time), so that cached results
+    survive restarts. Both tiers honor the ttl.
+
+    Results are invalidated when a write statement (INSERT, UPDATE, DELETE, etc.) touches one of the tables that a
+    cached SELECT read from (compared without schema prefixes, see dependent_tables()). All results are invalidated by
+    DDL statements and by writes whose tables cannot be determined, and results of a SELECT whose tables cannot be
+    determined reliably (subqueries, CTEs, FROM lists that cannot be parsed) are invalidated by every write.
+
+    :param max_bytes: The maximum total size of the in-memory tier
+    :param ttl: The number of seconds a result stays valid, None for no expiry
+    :param disk_dir: A directory for the on-disk tier, None to keep results in memory only
+    :param disk_format: Either 'parquet' or 'feather', both require pyarrow
+    :param namespace: Identifies the database (such as its filepath or URL) so that managers of different databases can share a disk_dir
+    """
+
+    READ_PATTERN = re.compile(r'^\s*(?:(?:--[^\n]*(?:\n|$)|/\*.*?\*/)\s*)*(?:SELECT|WITH)\b', flags=re.IGNORECASE | re.DOTALL)
+    WRITE_PATTERN = re.compile(r'^\s*(?:(?:--[^\n]*(?:\n|$)|/\*.*?\*/)\s*)*(?:INSERT|UPDATE|DELETE|MERGE|REPLACE|UPSERT|CREATE|DROP|ALTER|RENAME|TRUNCATE)\b', flags=re.IGNORECASE | re.DOTALL)
+    DDL_PATTERN = re.compile(r'^\s*(?:(?:--[^\n]*(?:\n|$)|/\*.*?\*/)\s*)*(?:CREATE|DROP|ALTER|RENAME|TRUNCATE)\b', flags=re.IGNORECASE | re.DOTALL)
+    TABLE_PATTERN = re.compile(r'\b(?:FROM|JOIN|INTO|UPDATE|TABLE|USING)\s+([\w.$#\[\]"`]+)', flags=re.IGNORECASE)
+    # The comma separated list after FROM, up to the next clause, join or parenthesis
+    FROM_LIST_PATTERN = re.compile(
+        r'\bFROM\s+(.*?)(?=\b(?:WHERE|GROUP|ORDER|HAVING|LIMIT|OFFSET|FETCH|UNION|EXCEPT|INTERSECT|WINDOW|RETURNING|FOR|JOIN|'
+        r'INNER|LEFT|RIGHT|FULL|CROSS|NATURAL|ON|SET|VALUES)\b|[();]|$)',
+        flags=re.IGNORECASE | re.DOTALL
+    )
+    # One item of a FROM list: a table name with an optional alias
+    FROM_ITEM_PATTERN = re.compile(r'\s*([\w.$#\[\]"`]+)(?:\s+(?:AS\s+)?[\w\[\]"`]+)?\s*', flags=re.IGNORECASE)
+    # Subqueries and CTEs, whose tables are not reliably found by the patterns above
+    NESTED_PATTERN = re.compile(r'^\s*(?:(?:--[^\n]*(?:\n|$)|/\*.*?\*/)\s*)*WITH\b|\(\s*(?:SELECT|WITH)\b|\bLATERAL\b', flags=re.IGNORECASE | re.DOTALL)
+
+    def __init__(
+            self,
+            max_bytes: int = 256 * 1024 * 1024,
+            ttl: Optional[float] = 300.0,
+            disk_dir: Optional[str] = None,
+            disk_format: Literal['parquet', 'feather'] = 'parquet',
+            namespace: str = ''
+    ):
+        if disk_format not in ['parquet', 'feather']:
+            raise ValueError(f'Invalid "disk_format" argument: "{disk_format}". Must be "parquet" or "feather"')
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.disk_dir = None if disk_dir is None else os.path.abspath(disk_dir)
+        self.disk_format = disk_format
+        self.namespace = namespace
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.current_bytes = 0
+
+        # key -> (created, nbytes, tables, DataFrame)
+        self._memory = OrderedDict()
+        # key -> (created, tables)
+        self._disk_index = {}
+        self._lock = threading.RLock()
+
+        if self.disk_dir is not None:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            self._load_disk_index()
+
+    # Private methods ##############################################################################################
+    def _disk_path(self, key: str, ext: str) -> str:
+        """
+        Returns the path of a result's data file (ext = disk_format) or metadata file (ext = 'json')
+        """
+        return os.path.join(self.disk_dir, f'{key}.{ext}')
+
+    def _expired(self, created: float) -> bool:
+        """
+        Checks if a result created at the "created" timestamp is older than the ttl
+        """
+        return self.ttl is not None and time.time() - created >= self.ttl
+
+    def _evict(self) -> None:
+        """
+        Evicts the least recently used results until the in-memory tier fits within max_bytes
+        """
+        while self.current_bytes > self.max_bytes and self._memory:
+            _, (_, nbytes, _, _) = self._memory.popitem(last=False)
+            self.current_bytes -= nbytes
+            self.evictions += 1
+
+    def _load_disk_index(self) -> None:
+        """
+        Reads the JSON sidecar files of the on-disk tier, removing expired results
+        """
+        for file in os.listdir(self.disk_dir):
+            if not file.endswith('.json'):
+                continue
+            key = file[:-5]
+            try:
+                with open(self._disk_path(key, 'json'), mode='r') as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if self._expired(meta['created']) or not os.path.isfile(self._disk_path(key, self.disk_format)):
+                self._remove_disk(key)
+            else:
+                self._disk_index[key] = (meta['created'], None if meta['tables'] is None else frozenset(meta['tables']))
+
+    def _put_memory(self, key: str, created: float, tables: Optional[frozenset], df: pd.DataFrame) -> None:
+        """
+        Adds a result to the in-memory tier, results larger than max_bytes are not kept in memory
+        """
+        nbytes = int(df.memory_usage(index=True, deep=True).sum())
+        if nbytes > self.max_bytes:
+            return
+        self._memory[key] = (created, nbytes, tables, df)
+        self.current_bytes += nbytes
+        self._evict()
+
+    def _read_disk(self, key: str) -> pd.DataFrame:
+        """
+        Reads a result from the on-disk tier
+        """
+        if self.disk_format == 'parquet':
+            return pd.read_parquet(self._disk_path(key, 'parquet'))
+        return pd.read_feather(self._disk_path(key, 'feather'))
+
+    def _remove(self, key: str) -> None:
+        """
+        Removes a result from both tiers
+        """
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry[1]
+        if key in self._disk_index:
+            self._remove_disk(key)
+
+    def _remove_disk(self, key: str) -> None:
+        """
+        Removes a result's data and metadata files from the on-disk tier
+        """
+        self._disk_index.pop(key, None)
+        for ext in [self.disk_format, 'json']:
+            try:
+                os.remove(self._disk_path(key, ext))
+            except OSError:
+                pass
+
+    def _write_disk(self, key: str, created: float, tables: Optional[frozenset], sql: str, df: pd.DataFrame) -> None:
+        """
+        Writes a result to the on-disk tier. Results that cannot be stored in the file format (such as DataFrames with
+        duplicate column names or mixed-type object columns) are only kept in memory.
+        """
+        try:
+            if self.disk_format == 'parquet':
+                df.to_parquet(self._disk_path(key, 'parquet'), index=False)
+            else:
+                df.to_feather(self._disk_path(key, 'feather'))
+            with open(self._disk_path(key, 'json'), mode='w') as f:
+                json.dump({'created': created, 'tables': None if tables is None else sorted(tables), 'sql': sql}, f)
+            self._disk_index[key] = (created, tables)
+        except Exception:
+            self._remove_disk(key)
+
+    # Public methods ###############################################################################################
+    @classmethod
+    def is_read(cls, sql: str) -> bool:
+        """
+        Checks if a sql statement is a SELECT (or WITH ... SELECT) statement, only these are cached
+
+        :param sql: The sql statement
+        :return: bool
+        """
+        return cls.READ_PATTERN.match(sql) is not None
+
+    @classmethod
+    def is_write(cls, sql: str) -> bool:
+        """
+        Checks if a sql statement modifies data or the schema, these invalidate cached results
+
+        :param sql: The sql statement
+        :return: bool
+        """
+        return cls.WRITE_PATTERN.match(sql) is not None
+
+    @staticmethod
+    def normalize_sql(sql: str) -> str:
+        """
+        Collapses all whitespace in a sql statement, so that the same statement written with different
+        indentation or line breaks results in the same cache key
+
+        :param sql: The sql statement
+        :return: str - The normalized sql statement
+        """
+        return ' '.join(sql.split())
+
+    @classmethod
+    def dependent_tables(cls, sql: str) -> Optional[frozenset]:
+        """
+        Returns the lower-cased table names of a sql statement without their schema prefixes (so that "main.users" and
+        "users" are the same table), used to match writes to the cached results they affect. Returns None if the tables
+        cannot be determined reliably: for statements with subqueries or CTEs, FROM lists with items other than a table
+        name and alias, or statements without any recognizable table name.
+
+        :param sql: The sql statement
+        :return: frozenset or None
+        """
+        if cls.NESTED_PATTERN.search(sql):
+            return None
+        for from_list in cls.FROM_LIST_PATTERN.findall(sql):
+            if not all(cls.FROM_ITEM_PATTERN.fullmatch(item) for item in from_list.split(',')):
+                return None
+        tables = frozenset(table.rpartition('.')[2] for table in cls.tables(sql))
+        return tables or None
+
+    @classmethod
+    def tables(cls, sql: str) -> frozenset:
+        """
+        Returns the lower-cased table names that appear after FROM (every item of a comma separated FROM list), JOIN,
+        INTO, UPDATE, TABLE or USING in a sql statement
+
+        :param sql: The sql statement
+        :return: frozenset - The table names, with quoting characters removed (schema prefixes are kept)
+        """
+        names = cls.TABLE_PATTERN.findall(sql)
+        for from_list in cls.FROM_LIST_PATTERN.findall(sql):
+            for item in from_list.split(','):
+                match = cls.FROM_ITEM_PATTERN.fullmatch(item)
+                if match is not None:
+                    names.append(match.group(1))
+        return frozenset('.'.join(part.strip('[]"`') for part in name.split('.')).lower() for name in names)
+
+    def clear(self) -> None:
+        """
+        Removes every result from both tiers
+
+        :return: None
+        """
+        with self._lock:
+            self._memory.clear()
+            self.current_bytes = 0
+            for key in list(self._disk_index):
+                self._remove_disk(key)
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Returns a copy of the cached result for a key, or None if it is not cached or has expired
+
+        :param key: The key returned by make_key()
+        :return: DataFrame or None
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry[0]):
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return entry[3].copy()
+                self._remove(key)
+            elif key in self._disk_index:
+                created, tables = self._disk_index[key]
+                if not self._expired(created):
+                    try:
+                        df = self._read_disk(key)
+                    except Exception:
+                        self._remove_disk(key)
+                    else:
+                        self.hits += 1
+                        self.disk_hits += 1
+                        self._put_memory(key=key, created=created, tables=tables, df=df)
+                        return df.copy()
+                else:
+                    self._remove_disk(key)
+            self.misses += 1
+            return None
+
+    def info(self) -> dict:
+        """
+        Returns the statistics of the cache
+
+        :return: dict
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'entries': len(self._memory),
+                'disk_entries': len(self._disk_index),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl
+            }
+
+    def invalidate(self, sql: Optional[str] = None) -> None:
+        """
+        Invalidates the results that are affected by a write or DDL statement. DDL statements, statements without any
+        recognizable table name and a sql of None invalidate every result.
+
+        :param sql: The write or DDL statement
+        :return: None
+        """
+        with self._lock:
+            tables = None if sql is None or self.DDL_PATTERN.match(sql) else self.dependent_tables(sql)
+            if tables is None:
+                self.invalidations += len(self._memory.keys() | self._disk_index.keys())
+                self.clear()
+                return
+            # results whose tables are unknown (None) may depend on any table
+            keys = [key for key, entry in self._memory.items() if entry[2] is None or entry[2] & tables]
+            keys += [key for key, (_, entry_tables) in self._disk_index.items() if (entry_tables is None or entry_tables & tables) and key not in keys]
+            for key in keys:
+                self._remove(key)
+            self.invalidations += len(keys)
+
+    def make_key(self, sql: str, parameters: Optional[Union[dict, list]] = None, variant: str = '') -> str:
+        """
+        Creates the cache key of a sql statement and its parameters
+
+        :param sql: The sql statement
+        :param parameters: The parameters associated with a parameterized query
+        :param variant: Distinguishes results of the same statement that are decoded differently (such as with compact dtypes)
+        :return: str - The sha256 hexdigest of the normalized sql, parameters and variant
+        """
+        if isinstance(parameters, dict):
+            parameters = sorted(parameters.items())
+        value = f'{self.namespace}\x00{self.normalize_sql(sql)}\x00{parameters!r}'
+        if variant:
+            value += f'\x00{variant}'
+        return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+    def put(self, key: str, sql: str, df: pd.DataFrame) -> None:
+        """
+        Stores a copy of a result in the cache, and on disk if "disk_dir" is set
+
+        :param key: The key returned by make_key()
+        :param sql: The sql statement of the result, used to determine the tables it depends on
+        :param df: The resulting DataFrame
+        :return: None
+        """
+        with self._lock:
+            created = time.time()
+            tables = self.dependent_tables(sql)
+            df = df.copy()
+            self._remove(key)
+            self._put_memory(key=key, created=created, tables=tables, df=df)
+            if self.disk_dir is not None:
+                self._write_disk(key=key, created=created, tables=tables, sql=sql, df=df)
@@ -1,4 +1,44 @@
-from .dbpd import BaseDBPD, Optional, sqlite3
+import os
+import pickle
+import threading
+import time
+
+import pandas as pd
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Union
+
+from .dbpd import BaseDBPD, Literal, Optional, sqlite3
+
+
+def _parallel_read_range(filepath: str, sql: str, parameters: Union[dict, list]) -> tuple:
+    """
+    Reads one rowid range for SQLite.parallel_read() in a worker process, on a new read-only connection. The DataFrame
+    is returned as Arrow IPC bytes if pyarrow is installed and the columns can be represented in Arrow (otherwise
+    as a pickled DataFrame), so that only a single bytes object is sent back to the parent process.
+
+    :param filepath: The filepath of the SQLite database
+    :param sql: The SELECT statement of the range
+    :param parameters: The parameters of the statement, including the rowid bounds
+    :return: tuple - ('arrow' or 'pickle', bytes)
+    """
+    connection = sqlite3.connect(f'file:{filepath}?mode=ro', uri=True)
+    try:
+        cursor = connection.execute(sql, parameters)
+        columns = [i[0] for i in cursor.description]
+        df = BaseDBPD._array_to_dataframe(data=BaseDBPD._fetch_array(cursor=cursor, column_count=len(columns)), columns=columns)
+        cursor.close()
+    finally:
+        connection.close()
+    try:
+        import pyarrow as pa
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return 'arrow', sink.getvalue().to_pybytes()
+    except Exception:  # pyarrow is not installed, or a column mixes types (SQLite columns are dynamically typed)
+        return 'pickle', pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 class SQLite(BaseDBPD):
@@ -8,15 +48,19 @@ class SQLite(BaseDBPD):
     :param filepath: The filepath of the SQLite database (or where the new one should be created)
     :param description: A description of the database (for reference utility only)
     :param show_description: Whether the description should be printed to the console upon init
+    :param performance_profile: Applies a set of pragmas on connect: 'balanced', 'read_heavy' or 'bulk_load' (see BaseDBPD.SQLITE_PERFORMANCE_PROFILES)
+    :param thread_safe: Gives every thread its own connection (or Session), so that the manager can be used from several threads (see BaseDBPD.db_conn)
     :param sqlite_connection_kwargs: Any keyword arguments that should be passed to the sqlite3.connect() function
     """
 
     def __init__(
             self,
             filepath: str,
-            fernet_encryption_key: Optional[bytes] = None,
+            fernet_encryption_key: Optional[Union[bytes, list]] = None,
             description: str = 'SQLite database connection',
             show_description: bool = True,
+            performance_profile: Optional[Literal['balanced', 'read_heavy', 'bulk_load']] = None,
+            thread_safe: bool = False,
             **sqlite_connection_kwargs
     ):
         super(SQLite, self).__init__(
@@ -25,27 +69,119 @@ class SQLite(BaseDBPD):
             fernet_encryption_key=fernet_encryption_key,
             description=description,
             show_description=show_description,
+            sqlite_performance_profile=performance_profile,
+            thread_safe=thread_safe,
             **sqlite_connection_kwargs
         )
 
+    def parallel_read(
+            self,
+            table_name: str,
+            columns: Optional[list] = None,
+            where: Optional[str] = None,
+            parameters: Optional[Union[dict, list]] = None,
+            workers: Optional[int] = None,
+            index: Optional[Union[str, list]] = None,
+            mp_context: Optional[Literal['fork', 'forkserver', 'spawn']] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Reads a table into a DataFrame using several processes. The table's rowid range is split into equal parts that
+        are read by a pool of worker processes, each with its own read-only connection, so that executing the query and
+        building the DataFrame scale with the number of cores. The parts are returned as Arrow IPC buffers (when
+        pyarrow is installed) and combined in rowid order, with the same dtypes as query() would give.
+
+        Only committed data is read. Tables created WITHOUT ROWID and views are read with query() instead.
+        Starting the processes has a cost (especially with the 'spawn' start method), this pays off for large tables.
+
+        Example:
+            df = db.parallel_read('measurements', columns=['sensor', 'value'], where='value > ?', parameters=[0.5], workers=8)
+
+        :param table_name: The name of the table
+        :param columns: The columns to be read, defaults to all columns
+        :param where: A condition for the rows to be read (the sql after WHERE)
+        :param parameters: The parameters of a parameterized "where" condition, either a list (for ?) or a dict (for :name)
+        :param workers: The number of processes, defaults to the number of CPUs
+        :param index: Can be used to set the index of the resulting DataFrame
+        :param mp_context: The multiprocessing start method, defaults to the platform's default
+        :return: DataFrame or None
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        select = f"""SELECT {'*' if columns is None else ', '.join(columns)} FROM {table_name}"""
+        try:
+            low, high = self.db_conn.execute(f'SELECT MIN(rowid), MAX(rowid) FROM {table_name}').fetchone()
+        except sqlite3.OperationalError:
+            low = high = None
+            workers = 1
+        if workers == 1 or low is None:
+            sql = select if where is None else f'{select} WHERE {where}'
+            return self.query(sql=sql, parameters=parameters, show_head=False, index=index, warn_is_none=False)
+
+        # Several ranges per worker, so that tables with uneven gaps in their rowids are still spread evenly
+        parts = min(workers * 4, high - low + 1)
+        bounds = [low + (high - low + 1) * i // parts for i in range(parts + 1)]
+        if isinstance(parameters, dict):
+            sql = f'{select} WHERE rowid >= :_dbpd_low AND rowid < :_dbpd_high'
+            range_parameters = [{**parameters, '_dbpd_low': bounds[i], '_dbpd_high': bounds[i + 1]} for i in range(parts)]
+        else:
+            sql = f'{select} WHERE rowid >= ? AND rowid < ?'
+            range_parameters = [[bounds[i], bounds[i + 1], *(parameters or [])] for i in range(parts)]
+        if where is not None:
+            sql += f' AND ({where})'
+
+        self.recent_query = sql
+        context = None
+        if mp_context is not None:
+            import multiprocessing
+            context = multiprocessing.get_context(mp_context)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            results = list(executor.map(_parallel_read_range, [self.filepath] * parts, [sql] * parts, range_parameters))
+
+        frames = []
+        for kind, data in results:
+            if kind == 'arrow':
+                import pyarrow as pa
+                frames.append(pa.ipc.open_stream(data).read_all().to_pandas())
+            else:
+                frames.append(pickle.loads(data))
+        frames = [i for i in frames if len(i) > 0] or frames[:1]
+        df = pd.concat(frames, ignore_index=True)
+        if len(df) == 0:
+            return None
+        # Each range infers its own dtypes (a column that is all NULL in a range is object, an INTEGER column with NULLs
+        # float64), columns whose dtypes differ between the ranges are inferred again from all of their values as in query()
+        for position in range(len(df.columns)):
+            if len({frame.dtypes.iloc[position] for frame in frames}) > 1:
+                df.isetitem(position, df.iloc[:, position].astype(object).infer_objects())
+        if index is not None:
+            df.set_index(index, inplace=True)
+        self.recent_df = df
+        return df
+
 
 class SQLiteInMemory(BaseDBPD):
     """
     Will create an in-memory SQLite database, methods can then be used from BaseDBPD
     The first argument for sqlite3.connect() will be ':memory:'
 
-    Use the save_as() method to save the in-memory database to disk
+    Use the save_as() method to save the in-memory database to disk, or start_snapshots() to save it periodically in the
+    background. from_file() loads a database file into memory, serialize() and deserialize() hand the database to
+    another process as bytes.
 
     :param description: A description of the database (for reference utility only)
     :param show_description: Whether the description should be printed to the console upon init
+    :param performance_profile: Applies a set of pragmas on connect: 'balanced', 'read_heavy' or 'bulk_load' (see BaseDBPD.SQLITE_PERFORMANCE_PROFILES)
+    :param thread_safe: An in-memory database cannot be opened twice, all threads share its one connection, whose calls are serialized by a lock (see BaseDBPD.db_conn)
     :param sqlite_connection_kwargs: Any keyword arguments that should be passed to the sqlite3.connect() function
     """
 
     def __init__(
             self,
-            fernet_encryption_key: Optional[bytes] = None,
+            fernet_encryption_key: Optional[Union[bytes, list]] = None,
             description: str = 'In-Memory SQLite database connection',
             show_description: bool = True,
+            performance_profile: Optional[Literal['balanced', 'read_heavy', 'bulk_load']] = None,
+            thread_safe: bool = False,
             **sqlite_connection_kwargs
     ):
         super(SQLiteInMemory, self).__init__(
@@ -54,23 +190,167 @@ class SQLiteInMemory(BaseDBPD):
             fernet_encryption_key=fernet_encryption_key,
             description=description,
             show_description=show_description,
+            sqlite_performance_profile=performance_profile,
+            thread_safe=thread_safe,
             **sqlite_connection_kwargs
         )
+        # The background thread of start_snapshots()
+        self._snapshot_thread: Optional[threading.Thread] = None
+        self._snapshot_stop: Optional[threading.Event] = None
+        self.recent_snapshot: Optional[dict] = None  # the filepath, seconds and error of the most recent background snapshot
+
+    @classmethod
+    def from_file(cls, filepath: str, pages: int = -1, **kwargs) -> 'SQLiteInMemory':
+        """
+        Loads a SQLite database file into a new in-memory database with the SQLite backup API, which copies the database
+        page by page (without going through sql statements). The file is opened read-only and is not changed.
+
+        Example:
+            lookups = SQLiteInMemory.from_file('lookups.db', show_description=False)
+
+        :param filepath: The filepath of the SQLite database to be loaded
+        :param pages: The number of pages copied per step of the backup, -1 copies the whole database in one step
+        :param kwargs: Keyword arguments for SQLiteInMemory(), e.g. description, show_description, performance_profile
+        :return: SQLiteInMemory
+        """
+        if not os.path.isfile(filepath):
+            raise FileNotFoundError(f'No such SQLite database: "{filepath}"')
+        db = cls(**kwargs)
+        source = sqlite3.connect(f'file:{os.path.abspath(filepath)}?mode=ro', uri=True)
+        try:
+            # the backup target must be the sqlite3 connection itself, not the locking wrapper of thread-safe mode
+            source.backup(getattr(db.db_conn, 'sqlite_connection', db.db_conn), pages=pages)
+        finally:
+            source.close()
+        db.invalidate_schema_cache()
+        return db
+
+    def deserialize(self, data: bytes) -> None:
+        """
+        Replaces the contents of the in-memory database with a database serialized by serialize() (or the bytes of a
+        SQLite database file). Uncommitted changes are discarded. Requires Python 3.11 or newer.
 
-    def save_as(self, filepath: str, return_new_database_manager: bool = False) -> Optional[SQLite]:
+        :param data: The serialized database
+        :return: None
+        """
+        if not hasattr(self.db_conn, 'deserialize'):
+            raise RuntimeError('"deserialize()" requires Python 3.11 or newer (sqlite3.Connection.deserialize)')
+        self.db_conn.rollback()
+        self.db_conn.deserialize(data)
+        self.invalidate_schema_cache()
+        if self.result_cache is not None:
+            self.result_cache.invalidate()
+
+    def save_as(self, filepath: str, return_new_database_manager: bool = False, pages: int = -1, pause: float = 0.0) -> Optional[SQLite]:
         """
         Saves an in-memory SQLite database to a SQLite database file
 
+        By default the database is copied in one step, during which no other statement can use the database. With a
+        positive number of "pages" the database is copied in steps of that many pages, and other threads can use the
+        database between the steps (changes made in between are included in the copy).
+
         :param filepath: The filepath of the new SQLite database
         :param return_new_database_manager: Boolean indicating if the method should return a dbpd.SQLite object of the new database
+        :param pages: The number of pages copied per step, -1 copies the whole database in one step
+        :param pause: The number of seconds to sleep between steps, so that other threads are not held up by the copy
         :return: Optional[dbpd.SQLite]
         """
         if not filepath.endswith('.db') and not filepath.endswith('.sqlite'):
             filepath += '.db'
         new_database = sqlite3.connect(filepath)
-        with new_database:
-            self.db_conn.backup(new_database)
-        new_database.close()
+        try:
+            with new_database:
+                self.db_conn.backup(new_database, pages=pages, progress=None if pause <= 0 else lambda status, remaining, total: time.sleep(pause))
+        finally:
+            new_database.close()
 
         if return_new_database_manager:
-            return SQLite(filepath=filepath)
\ No newline at end of file
+            return SQLite(filepath=filepath)
+
+    def serialize(self) -> bytes:
+        """
+        Serializes the in-memory database to bytes, which are the contents of an equivalent SQLite database file. The
+        bytes can be loaded into another in-memory database (e.g. in another process) with deserialize(), or written to a
+        file. Only committed changes are included. Requires Python 3.11 or newer.
+
+        Example:
+            data = db.serialize()
+            # in another process
+            db = SQLiteInMemory(show_description=False)
+            db.deserialize(data)
+
+        :return: bytes
+        """
+        if not hasattr(self.db_conn, 'serialize'):
+            raise RuntimeError('"serialize()" requires Python 3.11 or newer (sqlite3.Connection.serialize)')
+        self.db_conn.commit()
+        return self.db_conn.serialize()
+
+    def start_snapshots(self, filepath: str, interval_seconds: float = 60.0, pages: int = 256, pause: float = 0.001) -> None:
+        """
+        Starts a background thread that saves the in-memory database to a SQLite database file every "interval_seconds",
+        copying "pages" pages per step so that queries of other threads are only held up for one step at a time (see
+        save_as()). Each snapshot is written to a temporary file that then replaces "filepath", so the file always holds a
+        complete snapshot. Errors of a snapshot are warned and stored in the "recent_snapshot" attribute, the thread keeps
+        running. The thread is stopped by stop_snapshots() or close(). As the thread uses the database's connection, the
+        connection is reopened with check_same_thread=False first (commit or roll back pending changes before this).
+
+        Example:
+            db.start_snapshots('lookups.db', interval_seconds=300)
+
+        :param filepath: The filepath of the SQLite database snapshots
+        :param interval_seconds: The number of seconds between the start of two snapshots
+        :param pages: The number of pages copied per step
+        :param pause: The number of seconds to sleep between steps
+        :return: None
+        """
+        if self._snapshot_thread is not None:
+            raise RuntimeError('Snapshots have already been started, call stop_snapshots() first')
+        if interval_seconds <= 0:
+            raise ValueError(f'"interval_seconds" must be positive, got {interval_seconds}')
+        if not filepath.endswith('.db') and not filepath.endswith('.sqlite'):
+            filepath += '.db'
+        filepath = os.path.abspath(filepath)
+        root, ext = os.path.splitext(filepath)
+        self._share_sqlite_connection()  # the snapshot thread uses the connection
+        temp_filepath = f'{root}.snapshot{ext}'
+
+        def _snapshots():
+            while not self._snapshot_stop.wait(timeout=interval_seconds):
+                start = time.perf_counter()
+                try:
+                    if os.path.isfile(temp_filepath):
+                        os.remove(temp_filepath)
+                    self.save_as(filepath=temp_filepath, pages=pages, pause=pause)
+                    os.replace(temp_filepath, filepath)
+                    self.recent_snapshot = {'filepath': filepath, 'seconds': time.perf_counter() - start, 'error': None}
+                except Exception as e:
+                    self.recent_snapshot = {'filepath': filepath, 'seconds': time.perf_counter() - start, 'error': e}
+                    self._warn(f'Snapshot of the in-memory database to "{filepath}" failed: {e}')
+
+        self._snapshot_stop = threading.Event()
+        self._snapshot_thread = threading.Thread(target=_snapshots, name='dbpd-snapshots', daemon=True)
+        self._snapshot_thread.start()
+
+    def stop_snapshots(self) -> None:
+        """
+        Stops the background snapshots of start_snapshots(), waiting for a snapshot in progress to finish
+
+        :return: None
+        """
+        if self._snapshot_thread is None:
+            return
+        self._snapshot_stop.set()
+        self._snapshot_thread.join()
+        self._snapshot_thread = None
+        self._snapshot_stop = None
+
+    def close(self, commit_on_quit: bool = True) -> None:
+        """
+        Stops the background snapshots (see start_snapshots()) and closes the in-memory database
+
+        :param commit_on_quit: Boolean indicating if a final commit should be transacted before close
+        :return: None
+        """
+        self.stop_snapshots()
+        super(SQLiteInMemory, self).close(commit_on_quit=commit_on_quit)
\ No newline at end of file
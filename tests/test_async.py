@@ -0,0 +1,114 @@
+import asyncio
+import threading
+
+import pytest
+
+from dbpd import BaseDBPD, SQLite, SQLiteInMemory
+
+
+def _create_events(db) -> None:
+    db.query('CREATE TABLE events (id INTEGER PRIMARY KEY, name TEXT)', show_head=False, warn_is_none=False)
+    db.commit()
+
+
+async def _write_and_read(db) -> list:
+    for i in range(3):
+        await db.ainsert_values(table_name='events', id=i, name=f'event {i}')
+    await db.acommit()
+    await db.ainsert_values(table_name='events', id=3, name='rolled back')
+    await db.arollback()
+    # qmark parameters for sqlite3, named parameters for SQLAlchemy
+    if db.engine is None:
+        df = await db.aquery('SELECT id, name FROM events WHERE id >= ? ORDER BY id', parameters=[1])
+    else:
+        df = await db.aquery('SELECT id, name FROM events WHERE id >= :id ORDER BY id', parameters={'id': 1})
+    return df.values.tolist()
+
+
+def _count(filepath: str) -> int:
+    check = SQLite(filepath=filepath, show_description=False)
+    count = check.query('SELECT COUNT(*) AS n FROM events', show_head=False)['n'].iloc[0]
+    check.close()
+    return count
+
+
+def test_sqlalchemy_aiosqlite_file(tmp_path):
+    pytest.importorskip('aiosqlite')
+    filepath = str(tmp_path / 'async.db')
+    db = BaseDBPD(connection_credentials=f'sqlite:///{filepath}', show_description=False)
+    _create_events(db)
+
+    async def _main():
+        rows = await _write_and_read(db)
+        assert db.async_engine.url.drivername == 'sqlite+aiosqlite'
+        assert await db.acolumn_names(table_name='events') == ['id', 'name']
+        await db.aclose()
+        return rows
+
+    assert asyncio.run(_main()) == [[1, 'event 1'], [2, 'event 2']]
+    assert db.async_engine is None
+    assert _count(filepath) == 3
+
+
+def test_sqlalchemy_in_memory_url_rejected():
+    db = BaseDBPD(connection_credentials='sqlite://', show_description=False)
+    _create_events(db)
+    with pytest.raises(ValueError, match='in-memory'):
+        asyncio.run(db.aquery('SELECT * FROM events'))
+    db.close()
+
+
+def test_sqlite3_file_in_worker_thread(tmp_path):
+    filepath = str(tmp_path / 'async.db')
+    db = SQLite(filepath=filepath, show_description=False)
+    _create_events(db)
+    first_connection = db.db_conn
+    threads = []
+
+    async def _main():
+        rows = await _write_and_read(db)
+        # the calls ran in the worker thread, on a connection reopened for it
+        threads.append(await db._run_in_async_executor(threading.current_thread))
+        await db.aclose()
+        return rows
+
+    assert asyncio.run(_main()) == [[1, 'event 1'], [2, 'event 2']]
+    assert threads[0].name.startswith('dbpd-async')
+    assert db.db_conn is not first_connection
+    assert db._connect_kwargs['check_same_thread'] is False
+    assert _count(filepath) == 3
+
+
+def test_sqlite3_in_memory_copied_on_reopen():
+    db = SQLiteInMemory(show_description=False)
+    _create_events(db)
+    db.insert_values(table_name='events', id=10, name='before the first async call')
+    db.commit()
+
+    async def _main():
+        rows = await _write_and_read(db)
+        before = await db.aquery('SELECT name FROM events WHERE id = ?', parameters=[10])
+        await db.aclose()
+        return rows, before['name'].tolist()
+
+    rows, before = asyncio.run(_main())
+    assert rows == [[1, 'event 1'], [2, 'event 2'], [10, 'before the first async call']]
+    assert before == ['before the first async call']
+
+
+def test_sqlite3_reopen_with_uncommitted_changes(tmp_path):
+    db = SQLite(filepath=str(tmp_path / 'async.db'), show_description=False)
+    _create_events(db)
+    db.insert_values(table_name='events', id=1, name='uncommitted')
+    with pytest.raises(RuntimeError, match='uncommitted'):
+        asyncio.run(db.aquery('SELECT * FROM events'))
+    # the connection was not replaced and keeps its changes
+    db.commit()
+    assert db.query('SELECT COUNT(*) AS n FROM events', show_head=False)['n'].iloc[0] == 1
+
+    async def _main():
+        df = await db.aquery('SELECT name FROM events')
+        await db.aclose()
+        return df['name'].tolist()
+
+    assert asyncio.run(_main()) == ['uncommitted']
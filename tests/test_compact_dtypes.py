@@ -0,0 +1,116 @@
+import datetime
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dbpd import BaseDBPD, SQLite
+
+
+def _dtypes(df: pd.DataFrame) -> dict:
+    return {column: str(dtype) for column, dtype in df.dtypes.items()}
+
+
+def test_inferred_from_values():
+    df = pd.DataFrame({
+        'small': pd.Series([1, 2, 3], dtype=object),
+        'big': pd.Series([1, 2, 2 ** 40], dtype=object),
+        'small_null': pd.Series([1, None, 3], dtype=object),
+        'big_null': pd.Series([None, 2, -2 ** 40], dtype=object),
+        'flag': pd.Series([True, False, True], dtype=object),
+        'flag_null': pd.Series([True, None, False], dtype=object),
+        'when': pd.Series([datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 2), None], dtype=object),
+        'repeated': pd.Series(['a', 'a', 'a'], dtype=object),
+        'float': pd.Series([1.5, None, 2.5], dtype=object),
+        'decimal': pd.Series([Decimal('1.5'), Decimal('2'), None], dtype=object),
+        'null': pd.Series([None, None, None], dtype=object),
+        'native': np.array([1, 2, 3], dtype=np.int64)
+    })
+    compact = BaseDBPD.compact_dataframe(dataframe=df)
+    assert _dtypes(compact) == {
+        'small': 'int32', 'big': 'int64', 'small_null': 'Int32', 'big_null': 'Int64', 'flag': 'bool', 'flag_null': 'boolean',
+        'when': 'datetime64[us]', 'repeated': 'category', 'float': 'float64', 'decimal': 'object', 'null': 'object', 'native': 'int32'
+    }
+    assert compact['big_null'].tolist() == [pd.NA, 2, -2 ** 40]
+    assert compact['when'].iloc[2] is pd.NaT
+    pd.testing.assert_index_equal(compact.index, df.index)
+
+
+def test_category_ratio():
+    distinct = pd.DataFrame({'name': [f'name {i}' for i in range(10)]}, dtype=object)
+    assert str(BaseDBPD.compact_dataframe(dataframe=distinct)['name'].dtype) != 'category'
+    # a declared 'category' kind is decoded as category regardless of the ratio
+    assert str(BaseDBPD.compact_dataframe(dataframe=distinct, column_types={'name': 'category'})['name'].dtype) == 'category'
+    repeated = pd.DataFrame({'name': [f'name {i % 2}' for i in range(10)]}, dtype=object)
+    assert str(BaseDBPD.compact_dataframe(dataframe=repeated)['name'].dtype) == 'category'
+
+
+def test_declared_kinds():
+    df = pd.DataFrame({
+        'flag': pd.Series([1, 0, None], dtype=object),
+        'not_flag': pd.Series([1, 2, None], dtype=object),
+        'whole': pd.Series([1.0, 2.0, None], dtype=object),
+        'fraction': pd.Series([1.0, 2.5, None], dtype=object),
+        'date': pd.Series(['2024-01-01', '2024-01-02 03:04:05', None], dtype=object),
+        'not_date': pd.Series(['2024-01-01', 'soon', None], dtype=object),
+        'null_int': pd.Series([None, None, None], dtype=object),
+        'null_float': pd.Series([None, None, None], dtype=object),
+        'null_flag': pd.Series([None, None, None], dtype=object),
+        'null_date': pd.Series([None, None, None], dtype=object)
+    })
+    column_types = {
+        'flag': 'boolean', 'not_flag': 'boolean', 'whole': 'integer', 'fraction': 'integer', 'date': 'datetime', 'not_date': 'datetime',
+        'null_int': 'integer', 'null_float': 'float', 'null_flag': 'boolean', 'null_date': 'datetime'
+    }
+    compact = BaseDBPD.compact_dataframe(dataframe=df, column_types=column_types)
+    dtypes = _dtypes(compact)
+    assert dtypes['flag'] == 'boolean' and compact['flag'].tolist() == [True, False, pd.NA]
+    # values that do not fit the declared kind keep their inferred dtype
+    assert dtypes['not_flag'] == 'Int32'
+    assert dtypes['whole'] == 'Int32' and dtypes['fraction'] == 'float64'
+    assert dtypes['date'].startswith('datetime64') and compact['date'].iloc[1] == pd.Timestamp('2024-01-02 03:04:05')
+    assert dtypes['not_date'] == 'str'
+    # all-NULL columns get the dtype of their declared kind
+    assert dtypes['null_int'] == 'Int32' and dtypes['null_float'] == 'float64' and dtypes['null_flag'] == 'boolean'
+    assert dtypes['null_date'].startswith('datetime64')
+
+
+def test_downcast_floats():
+    df = pd.DataFrame({'value': [0.1, 0.2], 'count': [1, 2]})
+    assert _dtypes(BaseDBPD.compact_dataframe(dataframe=df)) == {'value': 'float64', 'count': 'int32'}
+    assert _dtypes(BaseDBPD.compact_dataframe(dataframe=df, downcast_floats=True)) == {'value': 'float32', 'count': 'int32'}
+    assert BaseDBPD.compact_dataframe(dataframe=pd.DataFrame()).empty
+
+
+@pytest.fixture(params=['sqlite3', 'sqlalchemy'])
+def db(request, tmp_path):
+    if request.param == 'sqlite3':
+        db = SQLite(filepath=str(tmp_path / 'compact.db'), show_description=False)
+    else:
+        db = BaseDBPD(connection_credentials=f'sqlite:///{tmp_path / "compact.db"}', show_description=False)
+    db.query('CREATE TABLE events (id INTEGER PRIMARY KEY, kind TEXT, active BOOLEAN, amount REAL, seen TIMESTAMP, note TEXT, parent INTEGER)', show_head=False, warn_is_none=False)
+    db.insert_many(
+        table_name='events',
+        rows=[(i, f'kind {i % 2}', i % 2, i / 4, f'2024-01-0{i % 9 + 1} 12:00:00', f'note {i}', None) for i in range(10)],
+        columns=['id', 'kind', 'active', 'amount', 'seen', 'note', 'parent']
+    )
+    db.commit()
+    yield db
+    db.close()
+
+
+def test_query_uses_declared_types(db):
+    df = db.query('SELECT * FROM events ORDER BY id', show_head=False, compact_dtypes=True)
+    assert _dtypes(df) == {
+        'id': 'int32', 'kind': 'category', 'active': 'bool', 'amount': 'float64', 'seen': 'datetime64[us]', 'note': 'str', 'parent': 'Int32'
+    }
+    expected = db.query('SELECT * FROM events ORDER BY id', show_head=False)
+    assert df['amount'].tolist() == expected['amount'].tolist()
+    assert df['kind'].astype(str).tolist() == expected['kind'].tolist()
+    assert _dtypes(db.query('SELECT amount FROM events', show_head=False, compact_dtypes=True, downcast_floats=True)) == {'amount': 'float32'}
+
+
+def test_query_iter_keeps_categories(db):
+    chunks = list(db.query_iter('SELECT id, kind, note FROM events ORDER BY id', chunksize=4, compact_dtypes=True))
+    assert [_dtypes(chunk) for chunk in chunks] == [{'id': 'int32', 'kind': 'category', 'note': 'str'}] * 3
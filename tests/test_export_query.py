@@ -0,0 +1,87 @@
+import os
+
+import pandas as pd
+import pytest
+
+from dbpd import BaseDBPD, SQLite
+
+SQL = 'SELECT * FROM readings ORDER BY id'
+
+
+@pytest.fixture(params=['sqlite3', 'sqlalchemy'])
+def db(request, tmp_path):
+    if request.param == 'sqlite3':
+        db = SQLite(filepath=str(tmp_path / 'export.db'), show_description=False)
+    else:
+        db = BaseDBPD(connection_credentials=f'sqlite:///{tmp_path / "export.db"}', show_description=False)
+    db.query('CREATE TABLE readings (id INTEGER PRIMARY KEY, sensor TEXT, value REAL, count INTEGER)', show_head=False, warn_is_none=False)
+    # the first rows are NULL in every column but the key, so the first chunk of an export has all-NULL columns
+    db.insert_dataframe(table_name='readings', dataframe=pd.DataFrame({
+        'id': range(10),
+        'sensor': [None] * 3 + [f's{i % 3}' for i in range(3, 10)],
+        'value': [None] * 3 + [i / 2 for i in range(3, 10)],
+        'count': pd.array([None] * 3 + list(range(103, 110)), dtype='Int64')
+    }))
+    db.commit()
+    yield db
+    db.close()
+
+
+@pytest.mark.parametrize('chunksize', [3, 4, 100])
+@pytest.mark.parametrize('file_format, compression', [
+    ('parquet', 'snappy'),
+    ('parquet', None),
+    ('feather', 'lz4'),
+    ('feather', None)
+])
+def test_arrow_round_trip(db, tmp_path, file_format, compression, chunksize):
+    pytest.importorskip('pyarrow')
+    filepath = str(tmp_path / f'readings.{file_format}')
+    export = getattr(db, f'export_query_to_{file_format}')
+    assert export(out_filepath=filepath, in_sql=SQL, chunksize=chunksize, compression=compression) == 10
+    exported = getattr(pd, f'read_{file_format}')(filepath)
+    pd.testing.assert_frame_equal(exported, db.query(SQL, show_head=False))
+    if file_format == 'parquet':
+        import pyarrow.parquet as pq
+        metadata = pq.ParquetFile(filepath).metadata
+        # one row group per chunk, the integer column is all NULL in a first chunk of 3 rows and still written as integers
+        assert metadata.num_row_groups == -(-10 // chunksize)
+        if chunksize == 3:
+            assert str(metadata.schema.to_arrow_schema().field('count').type) == 'int64'
+
+
+@pytest.mark.parametrize('filename', ['readings.csv', 'readings.csv.gz'])
+def test_csv_round_trip(db, tmp_path, filename):
+    filepath = str(tmp_path / filename)
+    assert db.export_query_to_csv(out_filepath=filepath, in_sql=SQL, chunksize=3) == 10
+    exported = pd.read_csv(filepath)
+    expected = db.query(SQL, show_head=False)
+    assert exported.columns.tolist() == expected.columns.tolist()
+    assert exported['id'].tolist() == list(range(10))
+    pd.testing.assert_series_equal(exported['value'], expected['value'])
+    pd.testing.assert_series_equal(exported['count'], expected['count'])
+    assert exported['sensor'].isna().sum() == 3
+
+    # keyword arguments are passed to to_csv()
+    assert db.export_query_to_csv(out_filepath=filepath, in_sql='SELECT id, value FROM readings WHERE id > 7 ORDER BY id', sep=';', compression=None if filename.endswith('.csv') else 'gzip') == 2
+    assert pd.read_csv(filepath, sep=';').values.tolist() == [[8, 4.0], [9, 4.5]]
+
+
+@pytest.mark.parametrize('file_format', ['csv', 'parquet', 'feather'])
+def test_no_results(db, tmp_path, file_format):
+    if file_format != 'csv':
+        pytest.importorskip('pyarrow')
+    filepath = str(tmp_path / f'empty.{file_format}')
+    assert getattr(db, f'export_query_to_{file_format}')(out_filepath=filepath, in_sql='SELECT * FROM readings WHERE id < 0') == 0
+    assert not os.path.exists(filepath)
+
+
+@pytest.mark.parametrize('file_format', ['parquet', 'feather'])
+def test_failed_export_removes_file(db, tmp_path, file_format):
+    pytest.importorskip('pyarrow')
+    # SQLite columns are dynamically typed, text in a later chunk does not match the integer schema of the first chunk
+    db.query("UPDATE readings SET count = 'many' WHERE id = 9", show_head=False, warn_is_none=False)
+    filepath = str(tmp_path / f'readings.{file_format}')
+    with pytest.raises(ValueError, match='CAST'):
+        getattr(db, f'export_query_to_{file_format}')(out_filepath=filepath, in_sql=SQL, chunksize=5)
+    assert not os.path.exists(filepath)
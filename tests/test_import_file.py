@@ -0,0 +1,112 @@
+import pandas as pd
+import pytest
+
+from dbpd import BaseDBPD, SQLite
+
+DATAFRAME = pd.DataFrame({
+    'id': range(1, 8),
+    'name': ['a', 'b', None, 'd', 'e', 'f', 'g'],
+    'price': [1.5, None, 3.5, 4.0, 5.5, 6.0, 7.5],
+    'extra': ['x'] * 7
+})
+
+
+@pytest.fixture(params=['sqlite3', 'sqlalchemy'])
+def db(request, tmp_path):
+    if request.param == 'sqlite3':
+        db = SQLite(filepath=str(tmp_path / 'import.db'), show_description=False)
+    else:
+        db = BaseDBPD(connection_credentials=f'sqlite:///{tmp_path / "import.db"}', show_description=False)
+    yield db
+    db.close(commit_on_quit=False)
+
+
+def _write(dataframe: pd.DataFrame, filepath: str) -> str:
+    if filepath.endswith('.parquet'):
+        dataframe.to_parquet(filepath, index=False)
+    elif filepath.endswith('.feather'):
+        dataframe.to_feather(filepath)
+    else:
+        dataframe.to_csv(filepath, index=False)
+    return filepath
+
+
+def _rows(db, table_name: str) -> list:
+    df = db.query(f'SELECT * FROM {table_name} ORDER BY id', show_head=False, warn_is_none=False)
+    if df is None:
+        return []
+    return [[None if pd.isna(value) else value for value in row] for row in df.values.tolist()]
+
+
+@pytest.mark.parametrize('filename', ['items.csv', 'items.csv.gz', 'items.parquet', 'items.feather'])
+@pytest.mark.parametrize('chunksize', [2, 100])
+def test_create_table(db, tmp_path, filename, chunksize):
+    if not filename.startswith('items.csv'):
+        pytest.importorskip('pyarrow')
+    filepath = str(tmp_path / filename)
+    if filename.endswith('.gz'):
+        DATAFRAME.to_csv(filepath, index=False)
+    else:
+        _write(DATAFRAME, filepath)
+    assert db.import_file(table_name='items', filepath=filepath, chunksize=chunksize, batch_size=3, show_progress=False) == 7
+    assert db.column_names(table_name='items') == ['id', 'name', 'price', 'extra']
+    assert _rows(db, 'items') == [[None if pd.isna(value) else value for value in row] for row in DATAFRAME.values.tolist()]
+    # the import is committed
+    db.rollback()
+    assert len(_rows(db, 'items')) == 7
+
+
+def test_existing_table_ignores_columns(db, tmp_path):
+    db.query('CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, price REAL)', show_head=False, warn_is_none=False)
+    db.commit()
+    filepath = _write(DATAFRAME.rename(columns={'name': 'NAME'}), str(tmp_path / 'items.csv'))
+    assert db.import_file(table_name='Items', filepath=filepath, chunksize=3, null_zeroes_for_columns=['price'], show_progress=False) == 7
+    assert db.column_names(table_name='items') == ['id', 'name', 'price']
+    assert _rows(db, 'items')[:3] == [[1, 'a', 1.5], [2, 'b', None], [3, None, 3.5]]
+
+
+def test_read_csv_kwargs_and_file_format(db, tmp_path):
+    filepath = tmp_path / 'items.txt'
+    filepath.write_text('id;code\n1;007\n2;010\n')
+    assert db.import_file(table_name='codes', filepath=str(filepath), file_format='csv', sep=';', dtype={'code': str}, show_progress=False) == 2
+    assert _rows(db, 'codes') == [[1, '007'], [2, '010']]
+    with pytest.raises(ValueError):
+        db.import_file(table_name='codes', filepath=str(filepath), file_format='xlsx', show_progress=False)
+
+
+@pytest.mark.parametrize('existing', [True, False])
+def test_rollback_on_error(db, tmp_path, existing):
+    if existing:
+        db.query('CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, price REAL, extra TEXT)', show_head=False, warn_is_none=False)
+        db.insert_values(table_name='items', id=100, name='kept')
+        db.commit()
+    # the malformed row fails in the third chunk, after the first chunks were inserted
+    filepath = _write(DATAFRAME, str(tmp_path / 'items.csv'))
+    with open(filepath, 'a') as f:
+        f.write('8,h,8.0,x,one too many\n')
+    with pytest.raises(pd.errors.ParserError):
+        db.import_file(table_name='items', filepath=filepath, chunksize=3, show_progress=False)
+    if existing:
+        assert _rows(db, 'items') == [[100, 'kept', None, None]]
+    else:
+        # the table created for the import is rolled back with the rows
+        assert 'items' not in db.table_names()
+
+
+def test_rollback_on_insert_error(db, tmp_path):
+    db.query('CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)', show_head=False, warn_is_none=False)
+    db.commit()
+    # the duplicate id fails in the third chunk
+    filepath = _write(pd.concat([DATAFRAME, DATAFRAME.iloc[:1]], ignore_index=True), str(tmp_path / 'items.csv'))
+    with pytest.raises(Exception, match='UNIQUE'):
+        db.import_file(table_name='items', filepath=filepath, chunksize=3, show_progress=False)
+    assert _rows(db, 'items') == []
+
+
+def test_no_commit(db, tmp_path):
+    filepath = _write(DATAFRAME, str(tmp_path / 'items.csv'))
+    db.query('CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)', show_head=False, warn_is_none=False)
+    db.commit()
+    assert db.import_file(table_name='items', filepath=filepath, show_progress=False, commit=False) == 7
+    db.rollback()
+    assert _rows(db, 'items') == []
@@ -0,0 +1,105 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dbpd import BaseDBPD, SQLite
+
+
+@pytest.fixture(params=['sqlite3', 'sqlalchemy'])
+def db(request, tmp_path):
+    if request.param == 'sqlite3':
+        db = SQLite(filepath=str(tmp_path / 'insert.db'), show_description=False)
+    else:
+        db = BaseDBPD(connection_credentials=f'sqlite:///{tmp_path / "insert.db"}', show_description=False)
+    db.query('CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, price REAL, stock INTEGER, added TIMESTAMP)', show_head=False, warn_is_none=False)
+    db.commit()
+    yield db
+    db.close(commit_on_quit=False)
+
+
+def _items(db) -> list:
+    df = db.query('SELECT id, name, price, stock, added FROM items ORDER BY id', show_head=False, warn_is_none=False)
+    if df is None:
+        return []
+    return [[None if pd.isna(value) else value for value in row] for row in df.values.tolist()]
+
+
+def _stored_types(db) -> list:
+    df = db.query('SELECT typeof(name) AS name, typeof(price) AS price, typeof(stock) AS stock, typeof(added) AS added FROM items ORDER BY id', show_head=False)
+    return df.values.tolist()
+
+
+def test_insert_dataframe_nulls(db):
+    df = pd.DataFrame({
+        'id': [1, 2, 3, 4],
+        'name': ['a', None, np.nan, 'd'],
+        'price': [1.5, np.nan, 3.5, None],
+        'stock': pd.array([10, None, 30, 0], dtype='Int64'),
+        'added': pd.to_datetime(['2024-01-02 03:04:05', None, '2024-01-03 00:00:00', pd.NaT]),
+        'not_a_column': ['ignored'] * 4
+    })
+    # batches of 3 rows, the second batch holds a single row
+    assert db.insert_dataframe(table_name='items', dataframe=df, batch_size=3, null_zeroes_for_columns=['stock']) == 4
+    db.commit()
+    # NaN, None, pd.NA and NaT are stored as NULL, never as the text 'nan' or a NaN float
+    assert _stored_types(db) == [
+        ['text', 'real', 'integer', 'text'],
+        ['null', 'null', 'null', 'null'],
+        ['null', 'real', 'integer', 'text'],
+        ['text', 'null', 'null', 'null']
+    ]
+    assert [row[:4] for row in _items(db)] == [[1, 'a', 1.5, 10], [2, None, None, None], [3, None, 3.5, 30], [4, 'd', None, None]]
+    assert db.query('SELECT added FROM items WHERE id = 1', show_head=False)['added'].iloc[0] in ['2024-01-02 03:04:05', pd.Timestamp('2024-01-02 03:04:05')]
+
+
+def test_insert_many_nulls(db):
+    rows = [
+        {'id': 1, 'name': 'a', 'price': 1.5, 'stock': 10},
+        {'id': 2, 'name': None, 'price': None},
+        {'id': 3, 'stock': 30, 'name': 'c'}
+    ]
+    # the keys of the first row are the columns, a missing key is NULL
+    assert db.insert_many(table_name='items', rows=rows, batch_size=2) == 3
+    assert db.insert_many(table_name='items', rows=[(4, None, 'ignored', datetime.datetime(2024, 1, 2)), (5, 'e', 'ignored', None)], columns=['id', 'name', 'unknown', 'added']) == 2
+    db.commit()
+    assert [row[:4] for row in _items(db)] == [[1, 'a', 1.5, 10], [2, None, None, None], [3, 'c', None, 30], [4, None, None, None], [5, 'e', None, None]]
+    assert _stored_types(db)[3:] == [['null', 'null', 'null', 'text'], ['text', 'null', 'null', 'null']]
+
+
+def test_insert_many_invalid_arguments(db):
+    assert db.insert_many(table_name='items', rows=[]) == 0
+    with pytest.raises(ValueError):
+        db.insert_many(table_name='items', rows=[(1, 'a')])
+    with pytest.raises(ValueError):
+        db.insert_many(table_name='items', rows=[(1, 'a')], columns=['unknown', 'other'])
+    with pytest.raises(ValueError):
+        db.insert_many(table_name='items', rows=[(1, 'a')], columns=['id', 'name'], batch_size=0)
+    with pytest.raises(ValueError):
+        db.insert_dataframe(table_name='items', dataframe=pd.DataFrame({'unknown': [1]}))
+
+
+def test_insert_rolled_back(db):
+    db.insert_dataframe(table_name='items', dataframe=pd.DataFrame({'id': [1, 2], 'name': ['a', 'b']}))
+    db.rollback()
+    with pytest.raises(Exception):
+        # the duplicate key fails in the second batch, the first batch is rolled back with it
+        db.insert_many(table_name='items', rows=[(1, 'a'), (2, 'b'), (1, 'again')], columns=['id', 'name'], batch_size=2)
+    db.rollback()
+    assert _items(db) == []
+
+
+def test_dataframe_to_db_rows():
+    df = pd.DataFrame({
+        'i': np.array([1, 0], dtype=np.int32),
+        'f': [np.nan, 2.5],
+        'b': [True, False],
+        'o': pd.Series([np.int64(7), None], dtype=object),
+        't': pd.to_datetime(['2024-01-02', None]),
+        'n': pd.array([None, 3], dtype='Int64')
+    })
+    rows = BaseDBPD.dataframe_to_db_rows(dataframe=df, null_zeroes_for_columns=['i'])
+    assert rows == [(1, None, True, 7, datetime.datetime(2024, 1, 2), None), (None, 2.5, False, None, None, 3)]
+    assert [type(value) for value in rows[0]] == [int, type(None), bool, int, datetime.datetime, type(None)]
+    assert type(rows[1][5]) is int
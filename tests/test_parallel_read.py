@@ -0,0 +1,41 @@
+import pandas as pd
+import pytest
+
+from dbpd import SQLite
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = SQLite(filepath=str(tmp_path / 'parallel.db'), show_description=False)
+    db.query('CREATE TABLE readings (id INTEGER PRIMARY KEY, count INTEGER, value REAL, sensor TEXT, note TEXT, reading)', show_head=False, warn_is_none=False)
+    # the first ranges are all NULL in some columns, "reading" mixes integers and text
+    rows = [
+        (i, None if i < 40 else i, None if i % 7 else i / 3, None if i < 40 else f's{i % 5}', None, i if i < 50 else f'r{i}')
+        for i in range(1, 101)
+    ]
+    db.insert_many(table_name='readings', rows=rows, columns=['id', 'count', 'value', 'sensor', 'note', 'reading'])
+    db.commit()
+    yield db
+    db.close()
+
+
+@pytest.mark.parametrize('workers', [1, 2, 4])
+def test_same_as_query(db, workers):
+    expected = db.query('SELECT * FROM readings', show_head=False)
+    df = db.parallel_read('readings', workers=workers)
+    pd.testing.assert_frame_equal(df, expected)
+    assert df['count'].dtype == 'float64' and df['note'].dtype == object
+
+
+def test_columns_where_and_index(db):
+    expected = db.query('SELECT id, count, sensor FROM readings WHERE id > ? AND id <= ?', parameters=[30, 60], show_head=False, index='id')
+    pd.testing.assert_frame_equal(db.parallel_read('readings', columns=['id', 'count', 'sensor'], where='id > ? AND id <= ?', parameters=[30, 60], workers=3, index='id'), expected)
+    df = db.parallel_read('readings', columns=['id', 'count'], where='id > :low', parameters={'low': 90}, workers=2)
+    assert df['count'].tolist() == list(range(91, 101)) and df['count'].dtype == 'int64'
+
+
+def test_no_rows(db):
+    assert db.parallel_read('readings', where='id < 0', workers=2) is None
+    db.query('CREATE TABLE empty (id INTEGER)', show_head=False, warn_is_none=False)
+    db.commit()
+    assert db.parallel_read('empty', workers=2) is None
@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+
+from dbpd import BaseDBPD, SQLite
+
+
+@pytest.fixture(params=['sqlite3', 'sqlalchemy'])
+def db(request, tmp_path):
+    if request.param == 'sqlite3':
+        db = SQLite(filepath=str(tmp_path / 'iter.db'), show_description=False)
+    else:
+        db = BaseDBPD(connection_credentials=f'sqlite:///{tmp_path / "iter.db"}', show_description=False)
+    db.query('CREATE TABLE readings (id INTEGER PRIMARY KEY, sensor TEXT, value REAL, count INTEGER)', show_head=False, warn_is_none=False)
+    db.insert_dataframe(table_name='readings', dataframe=pd.DataFrame({
+        'id': range(10),
+        'sensor': [f's{i % 3}' for i in range(10)],
+        'value': [i / 2 for i in range(10)],
+        'count': range(100, 110)
+    }))
+    db.commit()
+    yield db
+    db.close()
+
+
+@pytest.mark.parametrize('chunksize, sizes', [(1, [1] * 10), (3, [3, 3, 3, 1]), (5, [5, 5]), (10, [10]), (50, [10])])
+def test_chunk_boundaries(db, chunksize, sizes):
+    chunks = list(db.query_iter('SELECT * FROM readings ORDER BY id', chunksize=chunksize))
+    assert [len(chunk) for chunk in chunks] == sizes
+    df = pd.concat(chunks, ignore_index=True)
+    assert df['id'].tolist() == list(range(10))
+    # every chunk has a fresh RangeIndex, like query()
+    assert all(chunk.index.tolist() == list(range(len(chunk))) for chunk in chunks)
+
+
+def test_same_dtypes_as_query(db):
+    expected = db.query('SELECT * FROM readings ORDER BY id', show_head=False)
+    for chunk in db.query_iter('SELECT * FROM readings ORDER BY id', chunksize=4):
+        assert chunk.dtypes.to_dict() == expected.dtypes.to_dict()
+    pd.testing.assert_frame_equal(pd.concat(db.query_iter('SELECT * FROM readings ORDER BY id', chunksize=4), ignore_index=True), expected)
+
+
+def test_parameters_and_index(db):
+    placeholder, parameters = ('?', [7]) if db.engine is None else (':id', {'id': 7})
+    chunks = list(db.query_iter(f'SELECT id, sensor FROM readings WHERE id >= {placeholder} ORDER BY id', parameters=parameters, chunksize=2, index='id'))
+    assert [chunk.index.tolist() for chunk in chunks] == [[7, 8], [9]]
+    assert chunks[0].columns.tolist() == ['sensor']
+
+
+def test_no_results(db):
+    assert list(db.query_iter('SELECT * FROM readings WHERE id < 0')) == []
+    assert list(db.query_iter('UPDATE readings SET value = 0 WHERE id < 0')) == []
+
+
+def test_invalid_chunksize(db):
+    with pytest.raises(ValueError):
+        next(db.query_iter('SELECT * FROM readings', chunksize=0))
+
+
+def test_dtypes_inferred_per_chunk(db):
+    db.query('UPDATE readings SET sensor = NULL, count = NULL WHERE id < 4', show_head=False, warn_is_none=False)
+    expected = db.query('SELECT * FROM readings ORDER BY id', show_head=False)
+    first, second, third = db.query_iter('SELECT * FROM readings ORDER BY id', chunksize=4)
+    # the columns that are all NULL in a chunk are of object dtype, the others are inferred from their values
+    assert first['sensor'].dtype == object and first['count'].dtype == object
+    assert first['sensor'].isna().all() and first['count'].isna().all()
+    assert second['count'].dtype == 'int64' and expected['count'].dtype == 'float64'
+    assert second['sensor'].dtype == expected['sensor'].dtype
+    chunks = [chunk.astype(expected.dtypes.to_dict()) for chunk in [first, second, third]]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
@@ -0,0 +1,155 @@
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from dbpd import SQLite, SQLiteInMemory
+from dbpd.result_cache import ResultCache
+
+
+@pytest.fixture
+def db():
+    db = SQLiteInMemory(show_description=False)
+    db.query('CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)', show_head=False, warn_is_none=False)
+    db.query('CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER, amount REAL)', show_head=False, warn_is_none=False)
+    db.query('CREATE TABLE audit (id INTEGER PRIMARY KEY)', show_head=False, warn_is_none=False)
+    db.insert_dataframe(table_name='users', dataframe=pd.DataFrame({'id': [1, 2], 'name': ['ann', 'bob']}))
+    db.insert_dataframe(table_name='orders', dataframe=pd.DataFrame({'id': [1, 2, 3], 'user_id': [1, 1, 2], 'amount': [1.0, 2.0, 3.0]}))
+    db.commit()
+    db.enable_result_cache()
+    yield db
+    db.close()
+
+
+@pytest.mark.parametrize('sql, tables', [
+    ('SELECT * FROM users', {'users'}),
+    ('SELECT * FROM users u, orders o WHERE u.id = o.user_id', {'users', 'orders'}),
+    ('SELECT * FROM users AS u,orders AS o', {'users', 'orders'}),
+    ('SELECT * FROM users u JOIN orders o ON u.id = o.user_id LEFT JOIN audit a ON a.id = o.id', {'users', 'orders', 'audit'}),
+    ('SELECT * FROM "Users"', {'users'}),
+    ('SELECT * FROM main.users, [main].[Orders]', {'users', 'orders'}),
+    ('SELECT * FROM `users` ORDER BY id', {'users'}),
+    ('UPDATE main.users SET name = ?', {'users'}),
+    ('INSERT INTO "orders" (id) VALUES (?)', {'orders'}),
+    ('DELETE FROM audit WHERE id = 1', {'audit'}),
+    ('WITH big AS (SELECT * FROM orders) SELECT * FROM big', None),
+    ('SELECT * FROM users WHERE id IN (SELECT user_id FROM orders)', None),
+    ('SELECT * FROM (SELECT * FROM users) AS u', None),
+    ('SELECT 1', None)
+])
+def test_dependent_tables(sql, tables):
+    assert ResultCache.dependent_tables(sql) == (None if tables is None else frozenset(tables))
+
+
+def test_tables_keep_schema():
+    assert ResultCache.tables('SELECT * FROM main."Users", orders') == frozenset({'main.users', 'orders'})
+
+
+def _cached(db, sql: str) -> bool:
+    hits = db.result_cache.hits
+    db.query(sql, show_head=False, warn_is_none=False)
+    return db.result_cache.hits > hits
+
+
+def test_write_evicts_dependent_results(db):
+    comma = 'SELECT u.name, o.amount FROM users u, orders o WHERE u.id = o.user_id ORDER BY o.id'
+    joined = 'SELECT u.name, o.amount FROM users u JOIN orders o ON u.id = o.user_id ORDER BY o.id'
+    qualified = 'SELECT name FROM main."Users" ORDER BY id'
+    for sql in [comma, joined, qualified]:
+        assert not _cached(db, sql)
+        assert _cached(db, sql)
+
+    # a write to an unrelated table keeps the results
+    db.query('INSERT INTO audit (id) VALUES (1)', show_head=False, warn_is_none=False)
+    assert all(_cached(db, sql) for sql in [comma, joined, qualified])
+
+    # a write to the second table of a FROM list evicts the result
+    db.query('UPDATE orders SET amount = 10.0 WHERE id = 1', show_head=False, warn_is_none=False)
+    assert db.query(comma, show_head=False)['amount'].tolist() == [10.0, 2.0, 3.0]
+    assert db.query(joined, show_head=False)['amount'].tolist() == [10.0, 2.0, 3.0]
+    assert _cached(db, qualified)
+
+    # a write with a schema prefix evicts the results of the unqualified or quoted table
+    db.query("UPDATE main.users SET name = 'cyd' WHERE id = 2", show_head=False, warn_is_none=False)
+    assert db.query(qualified, show_head=False)['name'].tolist() == ['ann', 'cyd']
+
+
+def test_unknown_tables_evicted_by_any_write(db):
+    subquery = 'SELECT name FROM users WHERE id IN (SELECT user_id FROM orders WHERE amount > 2)'
+    plain = 'SELECT * FROM users'
+    assert db.query(subquery, show_head=False)['name'].tolist() == ['bob']
+    db.query(plain, show_head=False)
+    db.query('UPDATE orders SET amount = 5.0 WHERE id = 1', show_head=False, warn_is_none=False)
+    assert db.query(subquery, show_head=False)['name'].tolist() == ['ann', 'bob']
+    assert _cached(db, plain)
+
+
+def test_ddl_and_rollback_clear_cache(db):
+    db.query('SELECT * FROM users', show_head=False)
+    db.query('CREATE TABLE other (id INTEGER)', show_head=False, warn_is_none=False)
+    assert db.result_cache_info()['entries'] == 0
+
+    db.query('SELECT * FROM users', show_head=False)
+    db.rollback()
+    assert db.result_cache_info()['entries'] == 0
+
+
+def test_ttl_expiry(db):
+    db.enable_result_cache(ttl=0.05)
+    assert not _cached(db, 'SELECT * FROM users')
+    assert _cached(db, 'SELECT * FROM users')
+    time.sleep(0.1)
+    assert not _cached(db, 'SELECT * FROM users')
+
+
+def test_byte_size_lru_eviction(db):
+    nbytes = int(db.query('SELECT * FROM orders WHERE id = 1', show_head=False).memory_usage(index=True, deep=True).sum())
+    db.enable_result_cache(max_bytes=int(nbytes * 2.5))
+    first, second, third = [f'SELECT * FROM orders WHERE id = {i}' for i in [1, 2, 3]]
+    db.query(first, show_head=False)
+    db.query(second, show_head=False)
+    # using the first result makes the second the least recently used
+    assert _cached(db, first)
+    db.query(third, show_head=False)
+    info = db.result_cache_info()
+    assert info['entries'] == 2 and info['evictions'] == 1 and info['bytes'] <= info['max_bytes']
+    assert _cached(db, first)
+    assert _cached(db, third)
+    assert not _cached(db, second)
+
+
+@pytest.mark.parametrize('disk_format', ['parquet', 'feather'])
+def test_disk_tier(tmp_path, disk_format):
+    pytest.importorskip('pyarrow')
+    filepath = str(tmp_path / 'cache.db')
+    disk_dir = str(tmp_path / 'cache')
+    db = SQLite(filepath=filepath, show_description=False)
+    db.query('CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)', show_head=False, warn_is_none=False)
+    db.insert_dataframe(table_name='users', dataframe=pd.DataFrame({'id': [1, 2], 'name': ['ann', 'bob']}))
+    db.commit()
+    db.enable_result_cache(disk_dir=disk_dir, disk_format=disk_format)
+    expected = db.query('SELECT * FROM users ORDER BY id', show_head=False)
+    assert len([file for file in os.listdir(disk_dir) if file.endswith(f'.{disk_format}')]) == 1
+    db.close()
+
+    # a new manager of the same database reads the result from disk
+    db = SQLite(filepath=filepath, show_description=False)
+    db.enable_result_cache(disk_dir=disk_dir, disk_format=disk_format)
+    assert db.result_cache_info()['disk_entries'] == 1
+    pd.testing.assert_frame_equal(db.query('SELECT * FROM users ORDER BY id', show_head=False), expected)
+    assert db.result_cache_info()['disk_hits'] == 1
+
+    # a write removes the files of the dependent result
+    db.insert_values(table_name='users', id=3, name='cyd')
+    assert os.listdir(disk_dir) == []
+    assert db.query('SELECT * FROM users ORDER BY id', show_head=False)['name'].tolist() == ['ann', 'bob', 'cyd']
+    db.close()
+
+    # expired results are removed when the disk tier is loaded
+    db = SQLite(filepath=filepath, show_description=False)
+    time.sleep(0.05)
+    db.enable_result_cache(disk_dir=disk_dir, disk_format=disk_format, ttl=0.01)
+    assert db.result_cache_info()['disk_entries'] == 0
+    assert os.listdir(disk_dir) == []
+    db.close()
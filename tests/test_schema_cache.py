@@ -0,0 +1,105 @@
+import time
+
+import pytest
+
+from dbpd import BaseDBPD, SQLite
+
+
+def _connect(kind: str, filepath: str, **kwargs):
+    if kind == 'sqlite3':
+        return SQLite(filepath=filepath, show_description=False, **kwargs)
+    return BaseDBPD(connection_credentials=f'sqlite:///{filepath}', show_description=False, **kwargs)
+
+
+@pytest.fixture(params=['sqlite3', 'sqlalchemy'])
+def kind(request):
+    return request.param
+
+
+def _ddl(db, sql: str) -> None:
+    db.query(sql, show_head=False, warn_is_none=False)
+    db.commit()
+
+
+def test_hits_and_misses(kind, tmp_path):
+    db = _connect(kind, str(tmp_path / 'schema.db'))
+    _ddl(db, 'CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)')
+    db.invalidate_schema_cache()
+    hits, misses = db.schema_cache_hits, db.schema_cache_misses
+    assert db.table_names() == ['users']
+    assert db.column_names(table_name='users') == ['id', 'name']
+    assert db.table_names() == ['users']
+    # table names are matched case-insensitively in the cache
+    assert db.column_names(table_name='USERS') == ['id', 'name']
+    info = db.schema_cache_info()
+    assert info['hits'] - hits == 2 and info['misses'] - misses == 2
+    assert info['entries'] == 2 and info['ttl'] == 60.0
+    db.close()
+
+
+@pytest.mark.parametrize('sql, tables, columns', [
+    ('CREATE TABLE orders (id INTEGER)', ['orders', 'users'], ['id', 'name']),
+    ('ALTER TABLE users ADD COLUMN email TEXT', ['users'], ['id', 'name', 'email']),
+    ('  -- a comment first\n/* and a block comment */ alter table users rename column name to full_name', ['users'], ['id', 'full_name']),
+    ('DROP TABLE users', [], [])
+])
+def test_ddl_invalidates(kind, tmp_path, sql, tables, columns):
+    db = _connect(kind, str(tmp_path / 'schema.db'))
+    _ddl(db, 'CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)')
+    assert db.table_names() == ['users']
+    assert db.column_names(table_name='users') == ['id', 'name']
+    _ddl(db, sql)
+    assert db.schema_cache_info()['entries'] == 0
+    assert sorted(db.table_names()) == tables
+    assert db.column_names(table_name='users') == columns
+    db.close()
+
+
+def test_rollback_invalidates(kind, tmp_path):
+    db = _connect(kind, str(tmp_path / 'schema.db'))
+    _ddl(db, 'CREATE TABLE users (id INTEGER PRIMARY KEY)')
+    assert db.table_names() == ['users']
+    db.rollback()
+    assert db.schema_cache_info()['entries'] == 0
+    db.close()
+
+
+def test_other_connection_needs_ttl_or_invalidation(kind, tmp_path):
+    filepath = str(tmp_path / 'schema.db')
+    db = _connect(kind, filepath, schema_cache_ttl=0.2)
+    other = _connect(kind, filepath)
+    _ddl(db, 'CREATE TABLE users (id INTEGER PRIMARY KEY)')
+    assert db.table_names() == ['users']
+    assert db.column_names(table_name='users') == ['id']
+
+    # a schema change by another connection is not seen while the cached names are fresh
+    _ddl(other, 'CREATE TABLE orders (id INTEGER)')
+    _ddl(other, 'ALTER TABLE users ADD COLUMN name TEXT')
+    assert db.table_names() == ['users']
+    db.invalidate_schema_cache(table_name='Users')
+    assert sorted(db.table_names()) == ['orders', 'users']
+    assert db.column_names(table_name='users') == ['id', 'name']
+
+    _ddl(other, 'ALTER TABLE users ADD COLUMN email TEXT')
+    assert db.column_names(table_name='users') == ['id', 'name']
+    time.sleep(0.25)
+    assert db.column_names(table_name='users') == ['id', 'name', 'email']
+    other.close()
+    db.close()
+
+
+@pytest.mark.parametrize('ttl', [0, None])
+def test_disabled_and_unlimited_ttl(kind, tmp_path, ttl):
+    db = _connect(kind, str(tmp_path / 'schema.db'), schema_cache_ttl=ttl)
+    _ddl(db, 'CREATE TABLE users (id INTEGER PRIMARY KEY)')
+    misses = db.schema_cache_misses
+    for _ in range(3):
+        assert db.column_names(table_name='users') == ['id']
+    if ttl == 0:
+        # nothing is cached, every call queries the database
+        assert db.schema_cache_misses - misses == 3
+        assert db.schema_cache_info()['entries'] == 0
+    else:
+        assert db.schema_cache_misses - misses == 1
+        assert db.schema_cache_info()['entries'] == 1
+    db.close()
@@ -0,0 +1,126 @@
+import os
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from dbpd import SQLite, SQLiteInMemory
+
+
+def _events_db(rows: int = 100, thread_safe: bool = False) -> SQLiteInMemory:
+    db = SQLiteInMemory(show_description=False, thread_safe=thread_safe)
+    db.query('CREATE TABLE events (id INTEGER PRIMARY KEY, payload TEXT)', show_head=False, warn_is_none=False)
+    db.insert_dataframe(table_name='events', dataframe=pd.DataFrame({'id': range(rows), 'payload': ['x' * 1000] * rows}))
+    db.commit()
+    return db
+
+
+def _count(filepath: str) -> int:
+    connection = sqlite3.connect(filepath)
+    try:
+        return connection.execute('SELECT COUNT(*) FROM events').fetchone()[0]
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize('pages', [-1, 1])
+def test_from_file(tmp_path, pages):
+    filepath = str(tmp_path / 'source.db')
+    source = SQLite(filepath=filepath, show_description=False)
+    source.query('CREATE TABLE events (id INTEGER PRIMARY KEY, payload TEXT)', show_head=False, warn_is_none=False)
+    source.insert_dataframe(table_name='events', dataframe=pd.DataFrame({'id': range(50), 'payload': ['x' * 1000] * 50}))
+    source.close()
+    modified = os.path.getmtime(filepath)
+
+    db = SQLiteInMemory.from_file(filepath, pages=pages, show_description=False)
+    assert db.table_names(show_names=False) == ['events']
+    assert db.query('SELECT COUNT(*) AS n FROM events', show_head=False)['n'].iloc[0] == 50
+    # the file is read only
+    db.insert_values(table_name='events', id=50, payload='y')
+    db.commit()
+    assert _count(filepath) == 50
+    assert os.path.getmtime(filepath) == modified
+    db.close()
+
+
+def test_from_file_missing(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        SQLiteInMemory.from_file(str(tmp_path / 'missing.db'), show_description=False)
+
+
+def test_serialize_deserialize():
+    db = _events_db(rows=10)
+    db.insert_values(table_name='events', id=10, payload='committed by serialize()')
+    data = db.serialize()
+    db.close()
+
+    other = SQLiteInMemory(show_description=False)
+    other.query('CREATE TABLE replaced (id INTEGER)', show_head=False, warn_is_none=False)
+    other.deserialize(data)
+    assert other.table_names(show_names=False) == ['events']
+    assert other.query('SELECT COUNT(*) AS n FROM events', show_head=False)['n'].iloc[0] == 11
+    other.close()
+
+
+@pytest.mark.parametrize('pages, pause', [(-1, 0.0), (1, 0.0), (4, 0.001)])
+def test_save_as(tmp_path, pages, pause):
+    db = _events_db()
+    new = db.save_as(filepath=str(tmp_path / 'saved'), return_new_database_manager=True, pages=pages, pause=pause)
+    assert new.filepath.endswith('saved.db')
+    assert new.query('SELECT COUNT(*) AS n FROM events', show_head=False)['n'].iloc[0] == 100
+    new.close()
+    db.close()
+
+
+def test_stepped_save_as_does_not_block_thread_safe_readers(tmp_path):
+    # 100 rows of 1 kB are ~30 pages, copied one page per step with a pause between the steps
+    db = _events_db(thread_safe=True)
+    copy = threading.Thread(target=db.save_as, kwargs={'filepath': str(tmp_path / 'stepped.db'), 'pages': 1, 'pause': 0.02})
+    start = time.perf_counter()
+    copy.start()
+    time.sleep(0.05)
+    waits = []
+    while copy.is_alive():
+        query_start = time.perf_counter()
+        db.query('SELECT COUNT(*) AS n FROM events', show_head=False)
+        waits.append(time.perf_counter() - query_start)
+        time.sleep(0.01)
+    copy.join()
+    elapsed = time.perf_counter() - start
+
+    assert elapsed > 0.3
+    assert len(waits) > 5
+    assert max(waits) < elapsed / 3
+    assert _count(str(tmp_path / 'stepped.db')) == 100
+    db.close()
+
+
+def test_snapshots(tmp_path):
+    filepath = str(tmp_path / 'snapshot.db')
+    db = _events_db(thread_safe=True)
+    db.start_snapshots(filepath=filepath, interval_seconds=0.05, pages=4, pause=0.0)
+    with pytest.raises(RuntimeError):
+        db.start_snapshots(filepath=filepath)
+    deadline = time.monotonic() + 10
+    while db.recent_snapshot is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert db.recent_snapshot is not None and db.recent_snapshot['error'] is None
+    assert _count(filepath) == 100
+
+    db.insert_values(table_name='events', id=100, payload='y')
+    db.commit()
+    # a later snapshot includes the new row
+    deadline = time.monotonic() + 10
+    while _count(filepath) == 100 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    db.stop_snapshots()
+    assert db._snapshot_thread is None
+    assert _count(filepath) == 101
+    assert not os.path.exists(str(tmp_path / 'snapshot.snapshot.db'))
+
+    # close() stops the snapshots as well
+    db.start_snapshots(filepath=filepath, interval_seconds=0.05)
+    db.close()
+    assert db._snapshot_thread is None
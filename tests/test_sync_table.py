@@ -0,0 +1,82 @@
+import pandas as pd
+import pytest
+
+from dbpd import SQLiteInMemory
+
+
+@pytest.mark.filterwarnings('error::DeprecationWarning')
+def test_sync_from_sqlite_source():
+    source = SQLiteInMemory(show_description=False)
+    target = SQLiteInMemory(show_description=False)
+    source.query('CREATE TABLE orders (order_id INTEGER PRIMARY KEY, amount REAL, updated_at INTEGER)', show_head=False, warn_is_none=False)
+    source.insert_dataframe(table_name='orders', dataframe=pd.DataFrame({'order_id': [1, 2, 3], 'amount': [1.0, 2.0, 3.0], 'updated_at': [10, 20, 30]}))
+    source.commit()
+    assert source.sync_table(target=target, table_name='orders', watermark_column='updated_at', key_columns='order_id') == 3
+
+    source.query('UPDATE orders SET amount = 20.0, updated_at = 40 WHERE order_id = 2', show_head=False, warn_is_none=False)
+    source.insert_values(table_name='orders', order_id=4, amount=4.0, updated_at=50)
+    source.commit()
+    statements = []
+    source.add_query_hook(pre_execute=lambda record: statements.append(record.sql))
+    # the rows at or after the previous watermark (30) are pulled again
+    assert source.sync_table(target=target, table_name='orders', watermark_column='updated_at', key_columns='order_id') == 3
+
+    # sqlite3 binds qmark parameters, a named placeholder bound by position is deprecated
+    assert any(sql.rstrip().endswith('>= ?') for sql in statements)
+    assert not any(':watermark' in sql for sql in statements)
+    assert source.recent_sync['watermark'] == 50
+    synced = target.query('SELECT order_id, amount FROM orders ORDER BY order_id', show_head=False)
+    assert synced['amount'].tolist() == [1.0, 20.0, 3.0, 4.0]
+    source.close()
+    target.close()
+
+
+def _qualify_table_names(monkeypatch, db) -> None:
+    # table_names() of Postgres returns "schema.table", sqlite's "main" schema stands in for it
+    table_names = db.table_names
+    monkeypatch.setattr(db, 'table_names', lambda show_names=False: [f'main.{name}' for name in table_names(show_names=show_names)])
+
+
+def test_schema_qualified_table_names(monkeypatch, tmp_path):
+    source = SQLiteInMemory(show_description=False)
+    target = SQLiteInMemory(show_description=False)
+    _qualify_table_names(monkeypatch=monkeypatch, db=target)
+    source.query('CREATE TABLE orders (order_id INTEGER PRIMARY KEY, updated_at INTEGER)', show_head=False, warn_is_none=False)
+    source.insert_dataframe(table_name='orders', dataframe=pd.DataFrame({'order_id': [1, 2], 'updated_at': [10, 20]}))
+    source.commit()
+
+    # the existing watermark and target tables are found, the second sync does not create them again
+    assert source.sync_table(target=target, table_name='orders', watermark_column='updated_at', key_columns='order_id') == 2
+    source.insert_values(table_name='orders', order_id=3, updated_at=30)
+    source.commit()
+    assert source.sync_table(target=target, table_name='orders', watermark_column='updated_at', key_columns='order_id') == 2
+    assert source.sync_table(target=target, table_name='orders', watermark_column='updated_at', target_table_name='Orders_Log') == 3
+    source.insert_values(table_name='orders', order_id=4, updated_at=40)
+    source.commit()
+    assert source.sync_table(target=target, table_name='orders', watermark_column='updated_at', target_table_name='Orders_Log') == 1
+
+    assert source.copy_query_to(target=target, table_name='copies', sql='SELECT * FROM orders') == 4
+    assert source.copy_query_to(target=target, table_name='COPIES', sql='SELECT * FROM orders') == 4
+    filepath = tmp_path / 'orders.csv'
+    filepath.write_text('order_id,updated_at\n5,50\n')
+    assert target.import_file(table_name='orders', filepath=str(filepath), show_progress=False) == 1
+
+    assert target.query('SELECT COUNT(*) AS n FROM orders', show_head=False)['n'].iloc[0] == 4
+    assert target.query('SELECT COUNT(*) AS n FROM orders_log', show_head=False)['n'].iloc[0] == 4
+    assert target.query('SELECT COUNT(*) AS n FROM copies', show_head=False)['n'].iloc[0] == 8
+    source.close()
+    target.close()
+
+
+def test_failed_copy_rolls_back_created_table():
+    source = SQLiteInMemory(show_description=False)
+    target = SQLiteInMemory(show_description=False)
+    source.query('CREATE TABLE orders (order_id INTEGER PRIMARY KEY, details TEXT)', show_head=False, warn_is_none=False)
+    source.insert_dataframe(table_name='orders', dataframe=pd.DataFrame({'order_id': range(1, 7), 'details': ['{"a": 1}'] * 5 + ['not json']}))
+    source.commit()
+    # the malformed JSON fails in the second chunk, after the table was created and the first chunk inserted
+    with pytest.raises(Exception, match='JSON'):
+        source.copy_query_to(target=target, table_name='copies', sql="SELECT order_id, json_extract(details, '$.a') AS a FROM orders", chunksize=3)
+    assert target.table_names() == []
+    source.close()
+    target.close()
@@ -0,0 +1,73 @@
+import threading
+
+import pandas as pd
+
+from dbpd import SQLite, SQLiteInMemory
+
+
+def test_in_memory_concurrent_writers():
+    # all threads share the one connection of a thread-safe in-memory database
+    db = SQLiteInMemory(show_description=False, thread_safe=True)
+    db.query('CREATE TABLE events (id INTEGER PRIMARY KEY, writer INTEGER)', show_head=False, warn_is_none=False)
+    db.commit()
+    writers, rows = 8, 200
+    errors = []
+
+    def _write(writer: int) -> None:
+        try:
+            for i in range(rows):
+                db.insert_values(table_name='events', id=writer * rows * 2 + i, writer=writer)
+                if i % 10 == 0:
+                    db.insert_dataframe(table_name='events', dataframe=pd.DataFrame({'id': [writer * rows * 2 + rows + i], 'writer': [writer]}))
+                db.query('SELECT COUNT(*) AS n FROM events', show_head=False)
+                db.commit()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=_write, args=(writer,)) for writer in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    counts = db.query('SELECT writer, COUNT(*) AS n FROM events GROUP BY writer', show_head=False)
+    assert counts['n'].tolist() == [rows + rows // 10] * writers
+    db.close()
+
+
+def test_file_wal_concurrent_writers_and_close(tmp_path):
+    # every thread opens its own connection to the file, close() commits and closes them from the main thread
+    filepath = str(tmp_path / 'events.db')
+    db = SQLite(filepath=filepath, performance_profile='balanced', thread_safe=True, show_description=False, timeout=30)
+    assert db.query('PRAGMA journal_mode', show_head=False).iloc[0, 0] == 'wal'
+    db.query('CREATE TABLE events (id INTEGER PRIMARY KEY, writer INTEGER)', show_head=False, warn_is_none=False)
+    db.commit()
+    writers, rows = 4, 50
+    errors = []
+
+    def _write(writer: int) -> None:
+        try:
+            for i in range(rows):
+                db.insert_values(table_name='events', id=writer * rows + i, writer=writer)
+                db.commit()
+                db.query('SELECT COUNT(*) AS n FROM events WHERE writer = ?', parameters=[writer], show_head=False)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=_write, args=(writer,)) for writer in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # a row left uncommitted by a thread that has exited is committed by close()
+    thread = threading.Thread(target=db.insert_values, kwargs={'table_name': 'events', 'id': writers * rows, 'writer': writers})
+    thread.start()
+    thread.join()
+    db.close()
+
+    assert errors == []
+    check = SQLite(filepath=filepath, show_description=False)
+    counts = check.query('SELECT writer, COUNT(*) AS n FROM events GROUP BY writer', show_head=False)
+    check.close()
+    assert counts['n'].tolist() == [rows] * writers + [1]
@@ -0,0 +1,130 @@
+import pytest
+
+from dbpd import BaseDBPD, SQLite, SQLiteInMemory
+
+
+def test_nested_rollback_rows_not_counted():
+    db = SQLiteInMemory(show_description=False)
+    db.query('CREATE TABLE events (id INTEGER PRIMARY KEY)', show_head=False, warn_is_none=False)
+    db.commit()
+    with db.transaction(commit_every_rows=100):
+        for i in range(3):
+            db.insert_values(table_name='events', id=i)
+        with pytest.raises(ValueError):
+            with db.transaction():
+                for i in range(3, 10):
+                    db.insert_values(table_name='events', id=i)
+                with db.transaction():
+                    db.insert_values(table_name='events', id=10)
+                raise ValueError('roll back the nested block')
+        with db.transaction():
+            db.insert_values(table_name='events', id=11)
+
+    assert db.query('SELECT COUNT(*) AS n FROM events', show_head=False)['n'].iloc[0] == 4
+    assert db.recent_transaction['rows'] == 4
+    assert db.recent_transaction['commits'] == 1
+    db.close()
+
+
+def test_nested_rollback_does_not_trigger_group_commit():
+    db = SQLiteInMemory(show_description=False)
+    db.query('CREATE TABLE events (id INTEGER PRIMARY KEY)', show_head=False, warn_is_none=False)
+    db.commit()
+    with db.transaction(commit_every_rows=5):
+        db.insert_values(table_name='events', id=0)
+        with pytest.raises(ValueError):
+            with db.transaction():
+                for i in range(1, 5):
+                    db.insert_values(table_name='events', id=i)
+                raise ValueError('roll back the nested block')
+        # 2 counted rows, below the threshold of 5 rows
+        db.insert_values(table_name='events', id=5)
+
+    assert db.recent_transaction['rows'] == 2
+    assert db.recent_transaction['commits'] == 1
+    db.close()
+
+
+@pytest.fixture(params=['sqlite3', 'sqlalchemy'])
+def db(request, tmp_path):
+    if request.param == 'sqlite3':
+        db = SQLite(filepath=str(tmp_path / 'transaction.db'), show_description=False)
+    else:
+        db = BaseDBPD(connection_credentials=f'sqlite:///{tmp_path / "transaction.db"}', show_description=False)
+    db.query('CREATE TABLE events (id INTEGER PRIMARY KEY)', show_head=False, warn_is_none=False)
+    db.commit()
+    yield db
+    db.close(commit_on_quit=False)
+
+
+def _ids(db) -> list:
+    df = db.query('SELECT id FROM events ORDER BY id', show_head=False, warn_is_none=False)
+    return [] if df is None else df['id'].tolist()
+
+
+def test_rollback_in_nested_block_keeps_original_exception(db):
+    with db.transaction():
+        db.insert_values(table_name='events', id=1)
+        with pytest.raises(ValueError, match='original'):
+            with db.transaction():
+                db.insert_values(table_name='events', id=2)
+                db.rollback()
+                db.insert_values(table_name='events', id=3)
+                raise ValueError('original')
+        with db.transaction():
+            db.insert_values(table_name='events', id=4)
+            # only the nested block is rolled back, it stays open
+            db.rollback()
+            db.insert_values(table_name='events', id=5)
+
+    assert _ids(db) == [1, 5]
+    assert db.recent_transaction['rows'] == 2
+
+
+def test_rollback_in_outermost_block(db):
+    with db.transaction():
+        db.insert_values(table_name='events', id=1)
+        db.rollback()
+        db.insert_values(table_name='events', id=2)
+
+    assert _ids(db) == [2]
+    assert db.recent_transaction['rows'] == 1
+
+
+def test_helper_error_in_nested_block(db, tmp_path):
+    # import_file() rolls back on its error path, the nested block re-raises the import's error
+    filepath = tmp_path / 'events.csv'
+    filepath.write_text('id\n10\n10\n')
+    with db.transaction():
+        db.insert_values(table_name='events', id=1)
+        with pytest.raises(Exception) as raised:
+            with db.transaction():
+                db.insert_values(table_name='events', id=2)
+                db.import_file(table_name='events', filepath=str(filepath), show_progress=False)
+        assert 'savepoint' not in str(raised.value).lower()
+        assert 'unique' in str(raised.value).lower()
+
+    assert _ids(db) == [1]
+
+
+def test_ddl_rolled_back_with_outermost_block(db):
+    with pytest.raises(ValueError):
+        with db.transaction():
+            db.query('CREATE TABLE logs (id INTEGER PRIMARY KEY)', show_head=False, warn_is_none=False)
+            db.insert_values(table_name='logs', id=1)
+            raise ValueError('roll back the block')
+
+    assert db.table_names(show_names=False) == ['events']
+
+
+def test_ddl_after_group_commit_rolled_back(db):
+    with pytest.raises(ValueError):
+        # a write statement counts 1 row, the CREATE TABLE and INSERT are committed as the first group
+        with db.transaction(commit_every_rows=2):
+            db.query('CREATE TABLE logs (id INTEGER PRIMARY KEY)', show_head=False, warn_is_none=False)
+            db.insert_values(table_name='logs', id=1)
+            db.query('CREATE TABLE later (id INTEGER)', show_head=False, warn_is_none=False)
+            raise ValueError('roll back the last group')
+
+    assert sorted(db.table_names(show_names=False)) == ['events', 'logs']
+    assert db.recent_transaction['commits'] == 1
@@ -0,0 +1,94 @@
+import pandas as pd
+import pytest
+
+from dbpd import BaseDBPD, SQLite
+
+
+@pytest.fixture(params=['sqlite3', 'sqlalchemy'])
+def db(request, tmp_path):
+    if request.param == 'sqlite3':
+        db = SQLite(filepath=str(tmp_path / 'upsert.db'), show_description=False)
+    else:
+        db = BaseDBPD(connection_credentials=f'sqlite:///{tmp_path / "upsert.db"}', show_description=False)
+    db.query('CREATE TABLE products (sku TEXT PRIMARY KEY, name TEXT, price REAL, stock INTEGER)', show_head=False, warn_is_none=False)
+    db.query('CREATE TABLE prices (region TEXT, sku TEXT, price REAL, PRIMARY KEY (region, sku))', show_head=False, warn_is_none=False)
+    db.commit()
+    yield db
+    db.close(commit_on_quit=False)
+
+
+def _products(db) -> list:
+    df = db.query('SELECT sku, name, price, stock FROM products ORDER BY sku', show_head=False, warn_is_none=False)
+    return [] if df is None else df.values.tolist()
+
+
+def test_insert(db):
+    df = pd.DataFrame({'sku': ['a', 'b'], 'name': ['apple', 'banana'], 'price': [1.0, 2.0], 'stock': [10, 20]})
+    assert db.upsert_dataframe(table_name='products', dataframe=df, key_columns='sku') == 2
+    db.commit()
+    assert _products(db) == [['a', 'apple', 1.0, 10], ['b', 'banana', 2.0, 20]]
+
+
+def test_update(db):
+    db.upsert_dataframe(table_name='products', dataframe=pd.DataFrame({'sku': ['a'], 'name': ['apple'], 'price': [1.0], 'stock': [10]}), key_columns='sku')
+    db.upsert_dataframe(table_name='products', dataframe=pd.DataFrame({'sku': ['a'], 'name': ['green apple'], 'price': [1.5], 'stock': [5]}), key_columns='sku')
+    assert _products(db) == [['a', 'green apple', 1.5, 5]]
+
+    # only the update columns change, the other columns keep their values
+    df = pd.DataFrame({'SKU': ['a'], 'Name': ['red apple'], 'Price': [9.0], 'stock': [0], 'not_a_column': ['ignored']})
+    db.upsert_dataframe(table_name='products', dataframe=df, key_columns='sku', update_columns=['price'])
+    assert _products(db) == [['a', 'green apple', 9.0, 5]]
+
+    # without update columns existing rows are left as is, new rows are inserted
+    df = pd.DataFrame({'sku': ['a', 'b'], 'name': ['ignored', 'banana'], 'price': [0.0, 2.0], 'stock': [0, 20]})
+    assert db.upsert_dataframe(table_name='products', dataframe=df, key_columns='sku', update_columns=[]) >= 1
+    assert _products(db) == [['a', 'green apple', 9.0, 5], ['b', 'banana', 2.0, 20]]
+
+
+def test_mixed_batches(db):
+    db.upsert_dataframe(table_name='products', dataframe=pd.DataFrame({'sku': ['a', 'c'], 'name': ['apple', 'cherry'], 'price': [1.0, 3.0], 'stock': [1, 3]}), key_columns='sku')
+    # updates and inserts across batches of 2 rows, the last row of a duplicated key is used
+    df = pd.DataFrame({
+        'sku': ['a', 'b', 'c', 'd', 'b'],
+        'name': ['apple', 'banana', 'cherry', 'date', 'blueberry'],
+        'price': [1.1, 2.0, 3.3, 4.0, 2.2],
+        'stock': [11, 2, 33, 4, 22]
+    })
+    db.upsert_dataframe(table_name='products', dataframe=df, key_columns='sku', batch_size=2)
+    assert _products(db) == [['a', 'apple', 1.1, 11], ['b', 'blueberry', 2.2, 22], ['c', 'cherry', 3.3, 33], ['d', 'date', 4.0, 4]]
+
+
+def test_composite_key(db):
+    df = pd.DataFrame({'region': ['eu', 'us', 'eu'], 'sku': ['a', 'a', 'b'], 'price': [1.0, 2.0, 3.0]})
+    db.upsert_dataframe(table_name='prices', dataframe=df, key_columns=['region', 'sku'])
+    db.upsert_dataframe(table_name='prices', dataframe=pd.DataFrame({'region': ['us'], 'sku': ['a'], 'price': [2.5]}), key_columns=['region', 'sku'])
+    prices = db.query('SELECT region, sku, price FROM prices ORDER BY region, sku', show_head=False)
+    assert prices.values.tolist() == [['eu', 'a', 1.0], ['eu', 'b', 3.0], ['us', 'a', 2.5]]
+
+
+def test_invalid_arguments(db):
+    df = pd.DataFrame({'sku': ['a'], 'price': [1.0]})
+    with pytest.raises(ValueError):
+        db.upsert_dataframe(table_name='products', dataframe=df, key_columns='name')
+    with pytest.raises(ValueError):
+        db.upsert_dataframe(table_name='products', dataframe=df, key_columns='sku', update_columns=['sku'])
+    with pytest.raises(ValueError):
+        db.upsert_dataframe(table_name='products', dataframe=df, key_columns='sku', batch_size=0)
+    assert db.upsert_dataframe(table_name='products', dataframe=df.iloc[:0], key_columns='sku') == 0
+
+
+def test_upsert_in_transaction(db):
+    df = pd.DataFrame({'sku': ['a', 'b', 'c', 'a'], 'name': ['apple', 'banana', 'cherry', 'avocado'], 'price': [1.0, 2.0, 3.0, 4.0], 'stock': [1, 2, 3, 4]})
+    with db.transaction(commit_every_rows=3):
+        db.upsert_dataframe(table_name='products', dataframe=df, key_columns='sku')
+        # the updates count as one row each towards the group commit, as for any driver
+        db.upsert_dataframe(table_name='products', dataframe=df.iloc[:2], key_columns='sku', update_columns=['stock'])
+    assert db.recent_transaction['rows'] == 5
+    assert db.recent_transaction['commits'] == 2
+    assert _products(db) == [['a', 'avocado', 4.0, 1], ['b', 'banana', 2.0, 2], ['c', 'cherry', 3.0, 3]]
+
+    with pytest.raises(ValueError):
+        with db.transaction():
+            db.upsert_dataframe(table_name='products', dataframe=pd.DataFrame({'sku': ['d'], 'price': [5.0]}), key_columns='sku')
+            raise ValueError('roll back the upsert')
+    assert [row[0] for row in _products(db)] == ['a', 'b', 'c']